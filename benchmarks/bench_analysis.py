@@ -0,0 +1,174 @@
+"""Benchmark batch analysis against the per-event path.
+
+Builds synthetic snapshots (one game each, sharing a Kalshi board per
+slate) and times:
+
+- per-event: _resolve_markets + _compare_event_to_kalshi per snapshot
+- batch (python / numpy): AnalysisService.analyze_batch
+- batch with --workers processes (if more than 1)
+
+Nothing is written to the database. Analysis hashes from every engine
+are compared to check the batch output is identical.
+
+Usage:
+    python benchmarks/bench_analysis.py --games 10000 --games 100000 --workers 4
+"""
+
+from __future__ import annotations
+
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import click
+
+from sportsbetsinfo.config.settings import Settings
+from sportsbetsinfo.core.models import InfoSnapshot, SourceVersions
+from sportsbetsinfo.db.connection import get_connection_manager
+from sportsbetsinfo.db.schema import initialize_database
+from sportsbetsinfo.services.analyzer import AnalysisService
+from sportsbetsinfo.services.matching import _LEAGUE_TEAMS
+from sportsbetsinfo.services.vectorized import HAS_NUMPY, compute_edges
+
+TEAMS = [f"{city} {nickname}" for city, nickname in _LEAGUE_TEAMS["basketball_nba"]]
+
+
+def make_snapshots(games: int, slate_size: int, seed: int) -> list[InfoSnapshot]:
+    """Generate one snapshot per game, sharing a Kalshi board per slate."""
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    snapshots = []
+
+    for slate_start in range(0, games, slate_size):
+        events = []
+        board = []
+        for i in range(slate_start, min(slate_start + slate_size, games)):
+            home, away = rng.sample(TEAMS, 2)
+            home_odds = rng.choice([-1, 1]) * rng.randint(101, 400)
+            events.append({
+                "event_id": f"ev{i}",
+                "sport_key": "basketball_nba",
+                "home_team": home,
+                "away_team": away,
+                "commence_time": (start + timedelta(hours=i)).isoformat(),
+                "best_home_odds": home_odds,
+                "best_away_odds": -home_odds + rng.choice([-20, 0, 20]),
+            })
+            # ~80% of games have a Kalshi market, ~5% of those without a price
+            if rng.random() < 0.8:
+                price = rng.randint(5, 95) / 100 if rng.random() < 0.95 else None
+                board.append({
+                    "market_id": f"KX{i}",
+                    "title": f"{away.split()[-1]} at {home.split()[-1]} game {i}",
+                    "implied_probability": price,
+                    "yes_bid": None if price is None else int(price * 100) - 1,
+                    "yes_ask": None if price is None else int(price * 100) + 1,
+                    "volume": rng.randint(0, 10_000),
+                })
+
+        for event in events:
+            snapshots.append(
+                InfoSnapshot.create(
+                    game_id=event["event_id"],
+                    collected_at=start,
+                    schema_version="1",
+                    source_versions=SourceVersions(),
+                    raw_payloads={},
+                    normalized_fields={"odds_api_events": [event], "kalshi_markets": board},
+                )
+            )
+
+    return snapshots
+
+
+def per_event(service: AnalysisService, snapshots: list[InfoSnapshot]) -> list[str]:
+    """The analyze_snapshot() path without persistence."""
+    hashes = []
+    for snapshot in snapshots:
+        events = snapshot.normalized_fields["odds_api_events"]
+        markets, _ = service._resolve_markets(
+            events, snapshot.normalized_fields["kalshi_markets"], {}
+        )
+        comparisons = [
+            c
+            for c in (service._compare_event_to_kalshi(e, m) for e, m in zip(events, markets, strict=True))
+            if c
+        ]
+        analysis = service._build_analysis(snapshot, comparisons)
+        if analysis is not None:
+            hashes.append(analysis.hash)
+    return hashes
+
+
+def timed(label: str, games: int, func):  # type: ignore[no-untyped-def]
+    """Run func once and print its throughput."""
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    click.echo(f"  {label:<24} {elapsed:8.3f}s  {games / elapsed:>12,.0f} games/s")
+    return result
+
+
+@click.command()
+@click.option("--games", "sizes", type=int, multiple=True, default=[10_000, 100_000])
+@click.option("--slate-size", default=50, show_default=True, help="Games per Kalshi board")
+@click.option("--seed", default=7, show_default=True)
+@click.option("--workers", default=1, show_default=True, help="Also time a process pool")
+def main(sizes: tuple[int, ...], slate_size: int, seed: int, workers: int) -> None:
+    """Time per-event vs batch analysis."""
+    db_path = Path(tempfile.mkdtemp()) / "bench.db"
+    with get_connection_manager(db_path).write() as conn:
+        initialize_database(conn)
+    service = AnalysisService(Settings(db_path=db_path))
+
+    engines = ["python", "numpy"] if HAS_NUMPY else ["python"]
+    if not HAS_NUMPY:
+        click.echo("NumPy not installed; benchmarking the pure-Python batch engine only")
+
+    for games in sizes:
+        snapshots = make_snapshots(games, slate_size, seed)
+        click.echo(f"\n{games:,} games ({len(snapshots):,} snapshots)")
+
+        baseline = timed(
+            "per-event", games, lambda snapshots=snapshots: per_event(service, snapshots)
+        )
+
+        for engine in engines:
+            analyses, _ = timed(
+                f"batch ({engine})",
+                games,
+                lambda engine=engine, snapshots=snapshots: service.analyze_batch(
+                    snapshots, engine=engine
+                ),
+            )
+            status = "identical" if [a.hash for a in analyses] == baseline else "MISMATCH"
+            click.echo(f"  {'':<24} output {status}")
+
+        if workers > 1:
+            analyses, _ = timed(
+                f"batch ({workers} workers)",
+                games,
+                lambda snapshots=snapshots: service.analyze_batch(snapshots, workers=workers),
+            )
+            status = "identical" if [a.hash for a in analyses] == baseline else "MISMATCH"
+            click.echo(f"  {'':<24} output {status}")
+
+        # The vectorized math alone, on pre-packed columns
+        events = [s.normalized_fields["odds_api_events"][0] for s in snapshots]
+        home = [e["best_home_odds"] for e in events]
+        away = [e["best_away_odds"] for e in events]
+        kalshi = [random.Random(seed + i).random() for i in range(len(events))]
+        for engine in engines:
+            timed(
+                f"edge math ({engine})",
+                games,
+                lambda engine=engine, home=home, away=away, kalshi=kalshi: compute_edges(
+                    home, away, kalshi, engine=engine
+                ),
+            )
+
+
+if __name__ == "__main__":
+    main()
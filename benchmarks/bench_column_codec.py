@@ -0,0 +1,293 @@
+"""Benchmark zlib column compression against plain JSON columns.
+
+Builds a database of synthetic collection cycles (a shared Kalshi board
+payload, per-game odds payloads and normalized fields per poll, plus one
+analysis per cycle), copies it with recompress_database() into a
+zlib-encoded file, and reports for both:
+
+- database size, and bytes of the JSON-heavy tables
+- estimated page cache hit rate for uniform reads of those tables, with
+  the connection's page cache and with a small (--small-cache-mib) cache
+  (the share of their pages that fits in the cache)
+- read latency: a game's timeline (get_by_game_id, raw payloads
+  hydrated and hashes verified) and an analysis by ID, warm and with the
+  small cache and memory mapping disabled
+
+Reconstructed snapshots and analyses are compared between the two files.
+
+Usage:
+    python benchmarks/bench_column_codec.py --games 40 --polls 96
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import click
+
+from sportsbetsinfo.core.models import Analysis, InfoSnapshot, SourceVersions
+from sportsbetsinfo.db.codec import ColumnCodec, recompress_database, table_sizes
+from sportsbetsinfo.db.connection import CACHE_SIZE_KIB, get_connection
+from sportsbetsinfo.db.repositories import AnalysisRepository, SnapshotRepository
+from sportsbetsinfo.db.schema import initialize_database
+from sportsbetsinfo.db.verification import VerificationPolicy
+from sportsbetsinfo.services.matching import _LEAGUE_TEAMS
+
+TEAMS = [f"{city} {nickname}" for city, nickname in _LEAGUE_TEAMS["basketball_nba"]]
+BOOKMAKERS = ["draftkings", "fanduel", "betmgm", "caesars", "pointsbetus", "bovada"]
+JSON_TABLES = ("info_snapshots", "payload_blobs", "analyses")
+PLAIN = ColumnCodec()
+
+
+def make_cycles(
+    games: int, polls: int, seed: int
+) -> list[tuple[list[InfoSnapshot], Analysis]]:
+    """Generate one batch of snapshots and an analysis per poll cycle."""
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    matchups = [rng.sample(TEAMS, 2) for _ in range(games)]
+    prices = [rng.randint(5, 95) for _ in range(games)]
+
+    cycles = []
+    for poll in range(polls):
+        collected_at = start + timedelta(minutes=15 * poll)
+        for index in rng.sample(range(games), 3):
+            prices[index] = max(2, min(98, prices[index] + rng.choice([-2, -1, 1, 2])))
+
+        markets = [
+            {
+                "ticker": f"KXNBAGAME-26JAN01-{i}",
+                "event_ticker": f"KXNBAGAME-26JAN01-{i}",
+                "title": f"{away} at {home} Winner?",
+                "subtitle": f"{home.split()[-1]} to win",
+                "status": "active",
+                "yes_bid": prices[i] - 1,
+                "yes_ask": prices[i] + 1,
+                "no_bid": 99 - prices[i],
+                "no_ask": 101 - prices[i],
+                "last_price": prices[i],
+                "volume": 1000 * i + poll,
+                "open_interest": 500 * i + poll,
+                "close_time": (start + timedelta(days=1, hours=i % 6)).isoformat(),
+                "rules_primary": f"If the {home} win the game, the market resolves to Yes.",
+            }
+            for i, (home, away) in enumerate(matchups)
+        ]
+        board = [
+            {
+                "market_id": m["ticker"],
+                "title": m["title"],
+                "implied_probability": m["last_price"] / 100,
+                "yes_bid": m["yes_bid"],
+                "yes_ask": m["yes_ask"],
+                "volume": m["volume"],
+            }
+            for m in markets
+        ]
+
+        snapshots = []
+        for i, (home, away) in enumerate(matchups):
+            home_odds = -110 - (prices[i] - 50) * 4
+            event = {
+                "id": f"ev{i}",
+                "sport_key": "basketball_nba",
+                "commence_time": (start + timedelta(days=1, hours=i % 6)).isoformat(),
+                "home_team": home,
+                "away_team": away,
+                "bookmakers": [
+                    {
+                        "key": book,
+                        "title": book.title(),
+                        "last_update": collected_at.isoformat(),
+                        "markets": [{
+                            "key": "h2h",
+                            "outcomes": [
+                                {"name": home, "price": home_odds + offset},
+                                {"name": away, "price": -home_odds + offset},
+                            ],
+                        }],
+                    }
+                    for offset, book in enumerate(BOOKMAKERS)
+                ],
+            }
+            snapshots.append(
+                InfoSnapshot.create(
+                    game_id=f"ev{i}",
+                    collected_at=collected_at,
+                    schema_version="1",
+                    source_versions=SourceVersions(),
+                    raw_payloads={"kalshi_markets": {"markets": markets}, "odds_api_event": event},
+                    normalized_fields={
+                        "odds_api_events": [{
+                            "event_id": f"ev{i}",
+                            "home_team": home,
+                            "away_team": away,
+                            "commence_time": event["commence_time"],
+                            "best_home_odds": home_odds,
+                            "best_away_odds": -home_odds,
+                        }],
+                        "kalshi_markets": board,
+                    },
+                )
+            )
+
+        analysis = Analysis.create(
+            analysis_version="1",
+            code_version="bench",
+            input_snapshot_ids=sorted(s.snapshot_id for s in snapshots),
+            derived_features={
+                "comparisons": [
+                    {
+                        "event_id": f"ev{i}",
+                        "home_team": home,
+                        "away_team": away,
+                        "kalshi_market_id": markets[i]["ticker"],
+                        "kalshi_implied_prob": prices[i] / 100,
+                        "vegas_home_prob": 0.5,
+                        "delta_home": prices[i] / 100 - 0.5,
+                        "edge_magnitude": abs(prices[i] / 100 - 0.5),
+                        "matched": True,
+                    }
+                    for i, (home, away) in enumerate(matchups)
+                ]
+            },
+            conclusions={},
+            recommended_actions=[],
+        )
+        cycles.append((snapshots, analysis))
+    return cycles
+
+
+def build(db_path: Path, cycles: list[tuple[list[InfoSnapshot], Analysis]]) -> None:
+    """Write all cycles with plain JSON columns."""
+    conn = get_connection(db_path)
+    try:
+        initialize_database(conn)
+        snapshots = SnapshotRepository(conn, codec=PLAIN)
+        analyses = AnalysisRepository(conn, codec=PLAIN)
+        for batch, analysis in cycles:
+            snapshots.insert_many(batch)
+            analyses.insert(analysis)
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        conn.close()
+
+
+def recompress(source_path: Path, dest_path: Path, level: int) -> float:
+    """Copy source into dest with zlib columns, returning elapsed seconds."""
+    source = get_connection(source_path)
+    dest = get_connection(dest_path)
+    try:
+        initialize_database(dest)
+        started = time.perf_counter()
+        recompress_database(source, dest, ColumnCodec(name="zlib", level=level))
+        elapsed = time.perf_counter() - started
+        dest.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        source.close()
+        dest.close()
+    return elapsed
+
+
+def median_ms(
+    conn: Any, keys: list[str], read: Callable[[Any, str], Any], rounds: int = 3
+) -> tuple[float, list[Any]]:
+    """Best-of-rounds median milliseconds of read(conn, key) over keys, and the values read."""
+    best = float("inf")
+    values: list[Any] = []
+    for _ in range(rounds):
+        timings = []
+        values = []
+        for key in keys:
+            started = time.perf_counter()
+            values.append(read(conn, key))
+            timings.append(time.perf_counter() - started)
+        best = min(best, statistics.median(timings))
+    return best * 1000, values
+
+
+def read_timeline(conn: Any, game_id: str) -> list[tuple[str, Any, Any]]:
+    """A game's snapshots, hydrated and verified by a fresh repository."""
+    repo = SnapshotRepository(conn, VerificationPolicy(use_cache=False))
+    return [(s.hash, s.raw_payloads, s.normalized_fields) for s in repo.get_by_game_id(game_id)]
+
+
+def read_analysis(conn: Any, analysis_id: str) -> tuple[str, Any]:
+    """An analysis by ID, verified by a fresh repository."""
+    analysis = AnalysisRepository(conn, VerificationPolicy(use_cache=False)).get_by_id(analysis_id)
+    assert analysis is not None
+    return analysis.hash, analysis.derived_features
+
+
+@click.command()
+@click.option("--games", default=40, show_default=True, help="Games per cycle")
+@click.option("--polls", default=96, show_default=True, help="Poll cycles")
+@click.option("--level", default=6, show_default=True, help="zlib level")
+@click.option("--small-cache-mib", default=2, show_default=True, help="Cache for the cold reads")
+@click.option("--seed", default=7, show_default=True)
+def main(games: int, polls: int, level: int, small_cache_mib: int, seed: int) -> None:
+    """Compare plain and zlib-encoded JSON columns."""
+    cycles = make_cycles(games, polls, seed)
+    game_ids = [s.game_id for s in cycles[0][0]]
+    analysis_ids = [analysis.analysis_id for _, analysis in cycles]
+    root = Path(tempfile.mkdtemp())
+    plain_path, zlib_path = root / "plain.db", root / "zlib.db"
+
+    build(plain_path, cycles)
+    seconds = recompress(plain_path, zlib_path, level)
+    click.echo(
+        f"{games} games x {polls} polls ({games * polls:,} snapshots, {polls} analyses); "
+        f"recompress took {seconds:.2f}s\n"
+    )
+    click.echo(
+        f"  {'file':<6} {'db size':>9} {'json tbls':>10} {'hit(64M)':>9} "
+        f"{'hit(' + str(small_cache_mib) + 'M)':>8} {'timeline':>9} {'cold':>8} "
+        f"{'analysis':>9} {'cold':>8}"
+    )
+
+    results = []
+    for label, path in (("plain", plain_path), ("zlib", zlib_path)):
+        conn = get_connection(path)
+        try:
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            size = conn.execute("PRAGMA page_count").fetchone()[0] * page_size
+            sizes = table_sizes(conn)
+            json_bytes = sum(sizes.get(t, 0) for t in JSON_TABLES)
+            hit = min(1.0, CACHE_SIZE_KIB * 1024 / json_bytes)
+            small_hit = min(1.0, small_cache_mib * 1_048_576 / json_bytes)
+
+            timeline_ms, timelines = median_ms(conn, game_ids, read_timeline)
+            analysis_ms, analyses = median_ms(conn, analysis_ids, read_analysis)
+        finally:
+            conn.close()
+
+        # Cold-ish reads: small page cache, no memory mapping, new connection
+        conn = get_connection(path)
+        try:
+            conn.execute("PRAGMA mmap_size = 0")
+            conn.execute(f"PRAGMA cache_size = -{small_cache_mib * 1024}")
+            cold_timeline_ms, _ = median_ms(conn, list(reversed(game_ids)), read_timeline)
+            cold_analysis_ms, _ = median_ms(conn, list(reversed(analysis_ids)), read_analysis)
+        finally:
+            conn.close()
+
+        results.append((timelines, analyses))
+        click.echo(
+            f"  {label:<6} {size / 1_048_576:>7.2f}MB {json_bytes / 1_048_576:>8.2f}MB "
+            f"{hit:>9.0%} {small_hit:>8.0%} {timeline_ms:>7.2f}ms {cold_timeline_ms:>6.2f}ms "
+            f"{analysis_ms:>7.2f}ms {cold_analysis_ms:>6.2f}ms"
+        )
+
+    status = "identical" if results[0] == results[1] else "MISMATCH"
+    click.echo(f"\n  decoded content {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Benchmark the GCRA rate limiters against the previous lock-holding limiter.
+
+Fires N concurrent simulated requests (fixed latency, no network)
+through each limiter and reports wall time, limiter waits, the rate
+requests were actually admitted at, and effective concurrency (average
+requests in flight = total request time / wall time).
+
+Two scenarios:
+
+- same endpoint: every request shares one limit. The previous limiter
+  held its asyncio.Lock while sleeping and dated its refill from before
+  the sleep, so it admitted faster than its configured rate; GCRA
+  admits exactly ``burst`` immediately and then ``rate`` per second.
+- mixed endpoints: half the requests go to a costly endpoint with a
+  tighter limit. Without per-endpoint buckets the whole client has to
+  run at the costly rate; with EndpointRateLimiter only that endpoint
+  is held back.
+
+Usage:
+    python benchmarks/bench_rate_limiter.py --requests 50 --rate 10 --burst 10
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+import click
+
+from sportsbetsinfo.clients.ratelimit import EndpointRateLimiter, RateLimiter
+
+
+class LockingRateLimiter:
+    """The token bucket BaseAPIClient used before GCRA (kept for comparison)."""
+
+    def __init__(self, requests_per_second: float) -> None:
+        self.rate = requests_per_second
+        self.tokens = requests_per_second
+        self.last_update = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            elapsed = now - self.last_update
+            self.tokens = min(self.rate, self.tokens + elapsed * self.rate)
+            self.last_update = now
+
+            if self.tokens < 1:
+                wait_time = (1 - self.tokens) / self.rate
+                await asyncio.sleep(wait_time)
+                self.tokens = 0
+            else:
+                self.tokens -= 1
+
+
+async def run(
+    acquire: Callable[[str], Awaitable[object]],
+    paths: list[str],
+    latency: float,
+) -> dict[str, float]:
+    """Send one concurrent simulated request per path through ``acquire``."""
+    waits: list[float] = []
+
+    async def request(path: str) -> None:
+        queued = time.perf_counter()
+        await acquire(path)
+        waits.append(time.perf_counter() - queued)
+        await asyncio.sleep(latency)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(request(path) for path in paths))
+    wall = time.perf_counter() - started
+    spread = max(waits) - min(waits)
+    return {
+        "wall": wall,
+        "mean_wait": statistics.mean(waits),
+        "max_wait": max(waits),
+        "admit_rate": (len(paths) - 1) / spread if spread > 0 else float("inf"),
+        "concurrency": len(paths) * latency / wall,
+    }
+
+
+def report(label: str, result: dict[str, float]) -> None:
+    """Print one result row."""
+    click.echo(
+        f"  {label:<30} {result['wall']:7.2f}s {result['mean_wait']:9.3f}s "
+        f"{result['max_wait']:9.3f}s {result['admit_rate']:9.1f} {result['concurrency']:10.2f}"
+    )
+
+
+def header() -> None:
+    """Print the column header."""
+    click.echo(
+        f"  {'limiter':<30} {'wall':>8} {'mean wait':>10} {'max wait':>10} "
+        f"{'admit/s':>9} {'in flight':>10}"
+    )
+
+
+@click.command()
+@click.option("--requests", default=50, show_default=True, help="Concurrent requests")
+@click.option("--rate", default=10.0, show_default=True, help="Requests per second")
+@click.option("--burst", default=10, show_default=True, help="GCRA burst size")
+@click.option("--costly-rate", default=2.0, show_default=True, help="Costly endpoint limit")
+@click.option("--latency", default=0.2, show_default=True, help="Simulated request latency (s)")
+def main(requests: int, rate: float, burst: int, costly_rate: float, latency: float) -> None:
+    """Compare limiter waits and concurrency under concurrent load."""
+    click.echo(
+        f"{requests} concurrent requests, {rate:g} req/s, {latency * 1000:.0f} ms latency"
+    )
+
+    click.echo("\nSame endpoint")
+    header()
+    paths = ["/markets"] * requests
+    locking = LockingRateLimiter(rate)
+    report("lock-holding bucket", asyncio.run(run(lambda _: locking.acquire(), paths, latency)))
+    for size in (burst, 1):
+        gcra = RateLimiter(rate, size)
+        report(
+            f"GCRA (burst {size})",
+            asyncio.run(run(lambda _, gcra=gcra: gcra.acquire(), paths, latency)),
+        )
+
+    click.echo(f"\nMixed endpoints (half limited to {costly_rate:g} req/s)")
+    header()
+    paths = ["/costly" if i % 2 else "/markets" for i in range(requests)]
+    single = RateLimiter(costly_rate, 1)
+    report(
+        "one bucket at the costly rate",
+        asyncio.run(run(lambda _: single.acquire(), paths, latency)),
+    )
+    endpoints = EndpointRateLimiter(rate, burst, {"/costly": (costly_rate, 1)})
+    report("per-endpoint buckets", asyncio.run(run(endpoints.acquire, paths, latency)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Benchmark event-loop lag from Kalshi request signing.
+
+Starts a local stand-in Kalshi server (a thread serving canned JSON),
+generates a throwaway RSA-2048 key, and issues N concurrent signed
+requests through KalshiClient while a probe coroutine measures how
+late the event loop wakes it (1 ms ticks). Runs with signing on the
+event loop, in a thread pool, and in a pre-warmed thread pool.
+
+Usage:
+    python benchmarks/bench_signing.py --requests 200 --threads 2
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import click
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from sportsbetsinfo.clients.kalshi import KalshiClient
+from sportsbetsinfo.clients.resilience import RetryPolicy
+
+_BODY = json.dumps({"market": {"ticker": "KXNBA", "yes_bid": 40, "yes_ask": 42}}).encode()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answers every GET with a canned market."""
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(_BODY)))
+        self.end_headers()
+        self.wfile.write(_BODY)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+def write_key(directory: Path) -> Path:
+    """Write a throwaway RSA-2048 private key."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    path = directory / "bench_key.pem"
+    path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return path
+
+
+async def measure(client: KalshiClient, requests: int) -> dict[str, float]:
+    """Issue concurrent requests while sampling event-loop lag."""
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def probe() -> None:
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - started - 0.001)
+
+    probe_task = asyncio.create_task(probe())
+    started = time.perf_counter()
+    await asyncio.gather(*(client.get_market(f"KX{i}") for i in range(requests)))
+    wall = time.perf_counter() - started
+    done.set()
+    await probe_task
+
+    lags.sort()
+    return {
+        "wall": wall,
+        "p50": statistics.median(lags) * 1000,
+        "p99": lags[int(len(lags) * 0.99) - 1] * 1000,
+        "max": lags[-1] * 1000,
+    }
+
+
+async def run(
+    base_url: str, key_path: Path, requests: int, signer: ThreadPoolExecutor | None
+) -> dict[str, float]:
+    """Time one configuration."""
+    client = KalshiClient(
+        api_key="bench",
+        private_key_path=key_path,
+        rate_limit=100_000,
+        burst=100_000,
+        retry_policy=RetryPolicy(max_retries=0),
+        base_url=base_url,
+        signer=signer,
+    )
+    async with client:
+        return await measure(client, requests)
+
+
+@click.command()
+@click.option("--requests", default=200, show_default=True, help="Concurrent signed requests")
+@click.option("--threads", default=2, show_default=True, help="Signing threads")
+def main(requests: int, threads: int) -> None:
+    """Compare event-loop lag with inline and pooled signing."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}/trade-api/v2"
+    key_path = write_key(Path(tempfile.mkdtemp()))
+
+    click.echo(f"{requests} concurrent signed requests against {base_url}\n")
+    click.echo(f"  {'signing':<26} {'wall':>8} {'lag p50':>9} {'lag p99':>9} {'lag max':>9}")
+
+    cold = ThreadPoolExecutor(max_workers=threads)
+    warm = ThreadPoolExecutor(max_workers=threads)
+    for future in [warm.submit(time.sleep, 0.05) for _ in range(threads)]:
+        future.result()
+
+    for label, signer in [
+        ("on the event loop", None),
+        (f"thread pool ({threads})", cold),
+        (f"pre-warmed pool ({threads})", warm),
+    ]:
+        result = asyncio.run(run(base_url, key_path, requests, signer))
+        click.echo(
+            f"  {label:<26} {result['wall']:7.2f}s {result['p50']:7.2f}ms "
+            f"{result['p99']:7.2f}ms {result['max']:7.2f}ms"
+        )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
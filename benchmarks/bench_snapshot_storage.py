@@ -0,0 +1,185 @@
+"""Benchmark delta-encoded snapshot storage against the full layout.
+
+Builds synthetic game timelines (every poll carries the slate's Kalshi
+board and the game's odds event, with a few prices moving per poll),
+writes them once per keyframe interval into separate databases, and
+reports:
+
+- database size and normalized_fields bytes per snapshot
+- write time (one insert_many per poll cycle, like collect-day)
+- timeline read latency: get_by_game_id (full entities, verified) and
+  get_views_by_game_id with normalized_fields decoded
+
+Every reconstructed timeline is compared against the full layout.
+
+Usage:
+    python benchmarks/bench_snapshot_storage.py --games 50 --polls 96 --interval 8 --interval 32
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import click
+
+from sportsbetsinfo.core.models import InfoSnapshot, SourceVersions
+from sportsbetsinfo.db.connection import get_connection_manager
+from sportsbetsinfo.db.repositories import SnapshotRepository
+from sportsbetsinfo.db.schema import initialize_database
+from sportsbetsinfo.db.verification import VerificationPolicy
+from sportsbetsinfo.services.matching import _LEAGUE_TEAMS
+
+TEAMS = [f"{city} {nickname}" for city, nickname in _LEAGUE_TEAMS["basketball_nba"]]
+
+
+def make_cycles(games: int, polls: int, moves: int, seed: int) -> list[list[InfoSnapshot]]:
+    """Generate one batch of snapshots (one per game) per poll cycle."""
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    events: list[dict[str, Any]] = []
+    board: list[dict[str, Any]] = []
+    for i in range(games):
+        home, away = rng.sample(TEAMS, 2)
+        home_odds = rng.choice([-1, 1]) * rng.randint(101, 400)
+        events.append({
+            "event_id": f"ev{i}",
+            "sport_key": "basketball_nba",
+            "home_team": home,
+            "away_team": away,
+            "commence_time": (start + timedelta(days=1, hours=i % 6)).isoformat(),
+            "best_home_odds": home_odds,
+            "best_away_odds": -home_odds + rng.choice([-20, 0, 20]),
+        })
+        price = rng.randint(5, 95)
+        board.append({
+            "market_id": f"KX{i}",
+            "title": f"{away.split()[-1]} at {home.split()[-1]} game {i}",
+            "implied_probability": price / 100,
+            "yes_bid": price - 1,
+            "yes_ask": price + 1,
+            "volume": rng.randint(0, 10_000),
+        })
+
+    cycles = []
+    for poll in range(polls):
+        collected_at = start + timedelta(minutes=15 * poll)
+        # A few markets and odds move per cycle; volume ticks on ~20% of markets
+        board = [
+            dict(market, volume=market["volume"] + rng.randint(1, 50))
+            if rng.random() < 0.2
+            else market
+            for market in board
+        ]
+        for index in rng.sample(range(games), min(moves, games)):
+            price = max(2, min(98, board[index]["yes_bid"] + 1 + rng.choice([-2, -1, 1, 2])))
+            board[index] = dict(
+                board[index], implied_probability=price / 100, yes_bid=price - 1, yes_ask=price + 1
+            )
+            events[index] = dict(
+                events[index], best_home_odds=events[index]["best_home_odds"] + rng.choice([-5, 5])
+            )
+
+        cycles.append([
+            InfoSnapshot.create(
+                game_id=event["event_id"],
+                collected_at=collected_at,
+                schema_version="1",
+                source_versions=SourceVersions(),
+                raw_payloads={},
+                normalized_fields={
+                    "odds_api_events": [event],
+                    "odds_api_requests_remaining": 20_000 - poll,
+                    "kalshi_markets": board,
+                },
+            )
+            for event in events
+        ])
+    return cycles
+
+
+def write_db(db_path: Path, cycles: list[list[InfoSnapshot]], interval: int | None) -> float:
+    """Write all cycles into a fresh database, returning elapsed seconds."""
+    manager = get_connection_manager(db_path)
+    with manager.write() as conn:
+        initialize_database(conn)
+    started = time.perf_counter()
+    with manager.write() as conn:
+        repo = SnapshotRepository(conn, keyframe_interval=interval)
+        for cycle in cycles:
+            repo.insert_many(cycle)
+    return time.perf_counter() - started
+
+
+def storage(db_path: Path) -> tuple[int, float]:
+    """Database size in bytes and mean normalized_fields bytes per row."""
+    with get_connection_manager(db_path).read() as conn:
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        mean = conn.execute("SELECT AVG(LENGTH(normalized_fields)) FROM info_snapshots").fetchone()[0]
+    return page_count * page_size, mean
+
+
+def read_latency(
+    db_path: Path, game_ids: list[str], polls: int, views: bool
+) -> tuple[float, list[list[dict[str, Any]]]]:
+    """Median milliseconds to read one game's timeline, and the timelines read."""
+    timings = []
+    timelines = []
+    with get_connection_manager(db_path).read() as conn:
+        for game_id in game_ids:
+            # Fresh repository per read, as request handlers do
+            repo = SnapshotRepository(conn, verification=VerificationPolicy(use_cache=False))
+            started = time.perf_counter()
+            if views:
+                rows = [v.normalized_fields for v in repo.get_views_by_game_id(game_id, polls)]
+            else:
+                rows = [s.normalized_fields for s in repo.get_by_game_id(game_id, polls)]
+            timings.append(time.perf_counter() - started)
+            timelines.append(rows)
+    return statistics.median(timings) * 1000, timelines
+
+
+@click.command()
+@click.option("--games", default=50, show_default=True, help="Games per slate")
+@click.option("--polls", default=96, show_default=True, help="Poll cycles (snapshots per game)")
+@click.option("--moves", default=3, show_default=True, help="Markets moving per cycle")
+@click.option("--interval", "intervals", type=int, multiple=True, default=[8, 16, 32])
+@click.option("--seed", default=7, show_default=True)
+def main(games: int, polls: int, moves: int, intervals: tuple[int, ...], seed: int) -> None:
+    """Compare storage size and timeline reads for full vs delta layouts."""
+    cycles = make_cycles(games, polls, moves, seed)
+    game_ids = [s.game_id for s in cycles[0]]
+    root = Path(tempfile.mkdtemp())
+    click.echo(f"{games} games x {polls} polls ({games * polls:,} snapshots)\n")
+    click.echo(
+        f"  {'layout':<12} {'db size':>10} {'fields/row':>11} {'write':>8}"
+        f" {'timeline':>10} {'views':>8}  output"
+    )
+
+    baseline: list[list[dict[str, Any]]] | None = None
+    for interval in (None, *intervals):
+        label = "full" if interval is None else f"delta/{interval}"
+        db_path = root / f"{label.replace('/', '-')}.db"
+        write_seconds = write_db(db_path, cycles, interval)
+        size, mean = storage(db_path)
+        timeline_ms, timelines = read_latency(db_path, game_ids, polls, views=False)
+        views_ms, view_timelines = read_latency(db_path, game_ids, polls, views=True)
+
+        if baseline is None:
+            baseline = timelines
+        status = "identical" if timelines == baseline == view_timelines else "MISMATCH"
+        click.echo(
+            f"  {label:<12} {size / 1_048_576:>8.2f}MB {mean:>9,.0f}B {write_seconds:>7.2f}s"
+            f" {timeline_ms:>8.2f}ms {views_ms:>6.2f}ms  {status}"
+        )
+
+
+if __name__ == "__main__":
+    main()
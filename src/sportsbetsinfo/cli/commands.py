@@ -7,8 +7,11 @@ analysis lineage, and integrity verification.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import time
 from datetime import date, datetime, timezone
 from pathlib import Path
+from typing import cast
 
 import click
 from rich.console import Console
@@ -39,25 +42,61 @@ def cli(ctx: click.Context, db: str) -> None:
 def init_db(ctx: click.Context) -> None:
     """Initialize the database schema.
 
-    Creates all tables and immutability triggers.
+    Creates all tables and immutability triggers. Safe to re-run after
+    upgrading: new tables are added and derived indexes are backfilled.
     """
-    from sportsbetsinfo.db.connection import get_connection
+    from sportsbetsinfo.db.connection import get_connection_manager
+    from sportsbetsinfo.db.repositories.analysis import AnalysisRepository
+    from sportsbetsinfo.db.repositories.market_match import MarketMatchRepository
     from sportsbetsinfo.db.schema import initialize_database
 
     db_path = ctx.obj["db_path"]
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with get_connection(db_path) as conn:
+    with get_connection_manager(db_path).write() as conn:
         initialize_database(conn)
+        AnalysisRepository(conn).backfill_comparisons()
+        MarketMatchRepository(conn).backfill_from_comparisons()
 
     console.print(f"[green]Database initialized at {db_path}[/green]")
 
 
+@cli.command("backfill-comparisons")
+@click.pass_context
+def backfill_comparisons(ctx: click.Context) -> None:
+    """Extract comparisons of existing analyses into analysis_comparisons.
+
+    Also records the Kalshi markets those comparisons matched in
+    market_matches. Only missing rows are inserted, so it is safe to
+    run repeatedly.
+    """
+    from sportsbetsinfo.db.connection import get_connection_manager
+    from sportsbetsinfo.db.repositories.analysis import AnalysisRepository
+    from sportsbetsinfo.db.repositories.market_match import MarketMatchRepository
+    from sportsbetsinfo.db.schema import create_all_tables
+
+    db_path = ctx.obj["db_path"]
+
+    if not db_path.exists():
+        console.print(f"[red]Database not found at {db_path}[/red]")
+        return
+
+    with get_connection_manager(db_path).write() as conn:
+        create_all_tables(conn)
+        inserted = AnalysisRepository(conn).backfill_comparisons()
+        matches = MarketMatchRepository(conn).backfill_from_comparisons()
+
+    console.print(
+        f"[green]Backfilled {inserted} comparison row(s) and {matches} market match(es)[/green]"
+    )
+
+
 @cli.command()
 @click.pass_context
 def status(ctx: click.Context) -> None:
     """Show database statistics."""
-    from sportsbetsinfo.db.connection import get_connection
+    from sportsbetsinfo.db.connection import get_connection_manager
+    from sportsbetsinfo.db.repositories.snapshot import SnapshotRepository
     from sportsbetsinfo.db.schema import get_table_counts
 
     db_path = ctx.obj["db_path"]
@@ -67,8 +106,9 @@ def status(ctx: click.Context) -> None:
         console.print("Run 'sportsbetsinfo init-db' first.")
         return
 
-    with get_connection(db_path) as conn:
+    with get_connection_manager(db_path).read() as conn:
         counts = get_table_counts(conn)
+        dedup = SnapshotRepository(conn).get_dedup_stats()
 
         table = Table(title="Database Statistics")
         table.add_column("Entity", style="cyan")
@@ -78,6 +118,48 @@ def status(ctx: click.Context) -> None:
             table.add_row(entity, str(count))
 
         console.print(table)
+        console.print(
+            f"[dim]Unchanged polls stored as heartbeats: {dedup.heartbeats} "
+            f"({dedup.dedup_ratio:.1%} of polls)[/dim]"
+        )
+
+
+@cli.command()
+def quota() -> None:
+    """Show the Odds API quota budget and when it will run out."""
+    from sportsbetsinfo.clients.quota import QuotaBudgeter
+    from sportsbetsinfo.config.settings import get_settings
+
+    settings = get_settings()
+    budget = QuotaBudgeter(settings.odds_api_budget_path, settings.odds_api_quota_reset_day)
+    forecast = budget.forecast()
+
+    if forecast.remaining is None:
+        console.print("[yellow]No Odds API responses recorded yet[/yellow]")
+        return
+
+    table = Table(title="Odds API Quota")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", justify="right", style="green")
+    table.add_row("Remaining", str(forecast.remaining))
+    table.add_row("Used this period", str(forecast.used))
+    table.add_row("Resets", forecast.period_end.strftime("%Y-%m-%d"))
+    table.add_row("Daily allowance", f"{forecast.daily_allowance:.1f}")
+    table.add_row("Used today", str(forecast.used_today))
+    table.add_row(
+        "Burn rate / day",
+        f"{forecast.burn_rate_per_day:.1f}" if forecast.burn_rate_per_day is not None else "-",
+    )
+    table.add_row("Deferred requests", str(forecast.deferred))
+    console.print(table)
+
+    if forecast.exhausted_at is not None:
+        console.print(
+            f"[red]At the current rate the quota runs out on "
+            f"{forecast.exhausted_at:%Y-%m-%d}[/red]"
+        )
+    else:
+        console.print("[green]Quota lasts until the reset at the current rate[/green]")
 
 
 @cli.command()
@@ -213,16 +295,207 @@ def collect_day(ctx: click.Context, target_date: str | None, sport: str) -> None
             console.print(table)
             console.print(f"\n[green]Created {len(snapshots)} snapshot(s)[/green]")
 
-            # Show API quota if available
-            if collector._odds_api and collector._odds_api.requests_remaining is not None:
+            # Show upstream requests and API quota
+            stats = collector.stats
+            console.print(
+                f"[dim]Upstream requests: Kalshi {stats.kalshi_requests}, "
+                f"Odds API {stats.odds_api_requests} "
+                f"(cache hits: Kalshi {stats.kalshi_cache_hits}, "
+                f"Odds API {stats.odds_api_cache_hits}; "
+                f"retries: Kalshi {stats.kalshi_retries}, "
+                f"Odds API {stats.odds_api_retries})[/dim]"
+            )
+            if stats.snapshots_unchanged:
+                console.print(
+                    f"[dim]Unchanged since last poll (heartbeat only): "
+                    f"{stats.snapshots_unchanged}[/dim]"
+                )
+            if stats.odds_api_requests_remaining is not None:
                 console.print(
                     f"[dim]Odds API requests remaining: "
-                    f"{collector._odds_api.requests_remaining}[/dim]"
+                    f"{stats.odds_api_requests_remaining}[/dim]"
                 )
 
     asyncio.run(_collect_day())
 
 
+@cli.command()
+@click.option(
+    "--sport",
+    "sports",
+    multiple=True,
+    default=["basketball_nba"],
+    show_default=True,
+    help="Sport key for The Odds API (repeatable)",
+)
+@click.option("--jitter", default=0.1, show_default=True, help="Fractional interval jitter")
+@click.option(
+    "--status-file",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Status file (default: SPORTSBETS_DAEMON_STATUS_PATH)",
+)
+@click.option(
+    "--policy",
+    type=click.Choice(["cadence", "volatility"]),
+    default=None,
+    help="Polling policy (default: SPORTSBETS_DAEMON_POLLING)",
+)
+@click.option(
+    "--requests-per-hour",
+    type=float,
+    default=None,
+    help="Cap on board fetches per hour (default: SPORTSBETS_DAEMON_REQUESTS_PER_HOUR)",
+)
+def daemon(
+    sports: tuple[str, ...],
+    jitter: float,
+    status_file: Path | None,
+    policy: str | None,
+    requests_per_hour: float | None,
+) -> None:
+    """Collect snapshots continuously on a tip-off-aware cadence.
+
+    Each game is snapshotted every 2h until 6h before tip-off, every
+    30 min until the final hour, every 5 min until tip-off and every
+    15 min while live. With the volatility policy these intervals
+    shrink for games whose lines are moving and grow for flat ones.
+    Upstream clients stay open for the whole run; SIGINT/SIGTERM finish
+    the current tick and exit.
+    """
+    import signal
+
+    from sportsbetsinfo.config.settings import get_settings
+    from sportsbetsinfo.core.models import InfoSnapshot
+    from sportsbetsinfo.services.collector import DataCollector
+    from sportsbetsinfo.services.polling import get_policy
+    from sportsbetsinfo.services.scheduler import CollectionScheduler
+
+    settings = get_settings()
+
+    if not settings.odds_api_configured:
+        console.print("[red]Odds API key not configured![/red]")
+        console.print("Set SPORTSBETS_ODDS_API_KEY in .env")
+        return
+
+    status_path = status_file or settings.daemon_status_path
+    polling = get_policy(policy or settings.daemon_polling)
+    if requests_per_hour is None:
+        requests_per_hour = settings.daemon_requests_per_hour
+    console.print(
+        f"Collecting {', '.join(sports)} with the {polling.name} policy "
+        f"(status: [cyan]{status_path}[/cyan]); Ctrl+C to stop"
+    )
+
+    async def _run() -> None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            # Windows: Ctrl+C raises KeyboardInterrupt instead
+            with contextlib.suppress(NotImplementedError):
+                loop.add_signal_handler(sig, stop.set)
+
+        async with DataCollector(settings) as collector:
+            scheduler = CollectionScheduler(
+                collector,
+                list(sports),
+                jitter=jitter,
+                status_path=status_path,
+                policy=polling,
+                max_requests_per_hour=requests_per_hour or None,
+            )
+
+            def report(snapshots: list[InfoSnapshot]) -> None:
+                stats = scheduler.stats
+                line = (
+                    f"[dim]{datetime.now(timezone.utc):%H:%M:%S}[/dim] "
+                    f"{len(snapshots)} poll(s), {len(scheduler.games)} game(s) tracked, "
+                    f"next at {scheduler.next_wakeup():%H:%M:%S} UTC"
+                )
+                if stats.errors:
+                    line += f" [red]({stats.errors} error(s), last: {stats.last_error})[/red]"
+                console.print(line)
+
+            await scheduler.run(stop, on_tick=report)
+            console.print(
+                f"[green]Stopped after {scheduler.stats.snapshots_created} snapshot(s) and "
+                f"{scheduler.stats.heartbeats} unchanged poll(s) "
+                f"in {scheduler.stats.ticks} tick(s)[/green]"
+            )
+
+    try:
+        asyncio.run(_run())
+    except KeyboardInterrupt:
+        console.print("[yellow]Interrupted[/yellow]")
+
+
+@cli.command("replay-polling")
+@click.option("--threshold", default=0.03, show_default=True, help="Large move (probability)")
+@click.option("--window", default=15, show_default=True, help="Minutes to observe a move in")
+@click.option("--limit", default=100, show_default=True, help="Most recent games to replay")
+@click.pass_context
+def replay_polling(ctx: click.Context, threshold: float, window: int, limit: int) -> None:
+    """Compare polling policies against recorded snapshot history.
+
+    Replays each policy over every game's stored snapshots and reports
+    how many large line moves it would have observed per request spent.
+    """
+    from datetime import timedelta
+
+    from sportsbetsinfo.db.connection import get_connection_manager
+    from sportsbetsinfo.db.repositories.snapshot import SnapshotRepository
+    from sportsbetsinfo.services.polling import POLICIES, ReplayResult, replay_game
+
+    db_path = ctx.obj["db_path"]
+    results = {name: ReplayResult(policy=name) for name in POLICIES}
+
+    with get_connection_manager(db_path).read() as conn:
+        repo = SnapshotRepository(conn)
+        summaries = repo.get_game_summaries(limit=limit)
+        for summary in summaries:
+            history = repo.get_views_by_game_id(
+                summary.game_id,
+                limit=summary.snapshot_count + len(repo.get_heartbeats(summary.game_id)),
+                include_heartbeats=True,
+            )
+            for name, policy_class in POLICIES.items():
+                results[name] = results[name].merge(
+                    replay_game(
+                        policy_class(),
+                        summary.game_id,
+                        history,
+                        threshold=threshold,
+                        window=timedelta(minutes=window),
+                    )
+                )
+
+    if not summaries:
+        console.print("[yellow]No snapshots to replay[/yellow]")
+        return
+
+    table = Table(title=f"Polling Replay: {len(summaries)} game(s)")
+    table.add_column("Policy", style="cyan")
+    table.add_column("Requests", justify="right")
+    table.add_column("Large Moves", justify="right")
+    table.add_column("Observed", justify="right")
+    table.add_column("Coverage", justify="right")
+    table.add_column("Observed / 100 req", justify="right", style="green")
+    for result in results.values():
+        table.add_row(
+            result.policy,
+            str(result.requests),
+            str(result.large_moves),
+            str(result.covered_moves),
+            f"{result.coverage:.1%}",
+            f"{result.covered_per_100_requests:.2f}",
+        )
+    console.print(table)
+    console.print(
+        f"[dim]Large move: >= {threshold:.1%} in home no-vig or Kalshi probability; "
+        f"observed within {window} min[/dim]"
+    )
+
+
 @cli.command()
 @click.argument("game_id")
 @click.pass_context
@@ -230,16 +503,17 @@ def timeline(ctx: click.Context, game_id: str) -> None:
     """Show snapshot timeline for a game.
 
     Displays all snapshots in chronological order - the "what we knew at time T"
-    history for a specific game.
+    history for a specific game. Polls that saw unchanged content are
+    shown as heartbeats of the snapshot they repeated.
     """
-    from sportsbetsinfo.db.connection import get_connection
+    from sportsbetsinfo.db.connection import get_connection_manager
     from sportsbetsinfo.db.repositories.snapshot import SnapshotRepository
 
     db_path = ctx.obj["db_path"]
 
-    with get_connection(db_path) as conn:
+    with get_connection_manager(db_path).read() as conn:
         repo = SnapshotRepository(conn)
-        snapshots = repo.get_by_game_id(game_id)
+        snapshots = repo.get_views_by_game_id(game_id, include_heartbeats=True)
 
         if not snapshots:
             console.print(f"[yellow]No snapshots found for game {game_id}[/yellow]")
@@ -258,9 +532,13 @@ def timeline(ctx: click.Context, game_id: str) -> None:
             if snapshot.source_versions.odds_api:
                 sources.append("OddsAPI")
 
+            snapshot_id = snapshot.snapshot_id[:8] + "..."
+            if snapshot.is_heartbeat:
+                snapshot_id = f"[dim]{snapshot_id} (unchanged)[/dim]"
+
             table.add_row(
                 snapshot.collected_at.strftime("%Y-%m-%d %H:%M:%S"),
-                snapshot.snapshot_id[:8] + "...",
+                snapshot_id,
                 ", ".join(sources) or "None",
                 snapshot.hash[:12] + "...",
             )
@@ -277,12 +555,12 @@ def lineage(ctx: click.Context, analysis_id: str) -> None:
     Traces the parent chain from root to the specified analysis,
     showing the evolution of understanding.
     """
-    from sportsbetsinfo.db.connection import get_connection
+    from sportsbetsinfo.db.connection import get_connection_manager
     from sportsbetsinfo.db.repositories.analysis import AnalysisRepository
 
     db_path = ctx.obj["db_path"]
 
-    with get_connection(db_path) as conn:
+    with get_connection_manager(db_path).read() as conn:
         repo = AnalysisRepository(conn)
         path = repo.get_lineage(analysis_id)
 
@@ -312,102 +590,183 @@ def lineage(ctx: click.Context, analysis_id: str) -> None:
 
 
 @cli.command()
+@click.option("--full", is_flag=True, help="Ignore checkpoints and re-verify every row")
+@click.option("--workers", type=int, default=None, help="Hashing processes (default: CPU count)")
+@click.option("--batch-size", default=500, show_default=True, help="Rows per batch")
+@click.option("--no-checkpoint", is_flag=True, help="Do not record this run as a checkpoint")
 @click.pass_context
-def verify(ctx: click.Context) -> None:
+def verify(
+    ctx: click.Context,
+    full: bool,
+    workers: int | None,
+    batch_size: int,
+    no_checkpoint: bool,
+) -> None:
     """Verify hash integrity of all records.
 
-    Checks that stored hashes match computed hashes for all entities.
-    Reports any integrity violations.
+    Streams every table in rowid order and checks that stored hashes match
+    computed hashes, regardless of SPORTSBETS_VERIFY_ON_READ. Reports all
+    integrity violations. Each run is checkpointed, so the next run only
+    verifies rows added since the last clean run unless --full is given.
     """
-    from sportsbetsinfo.core.exceptions import HashMismatchError
-    from sportsbetsinfo.db.connection import get_connection
-    from sportsbetsinfo.db.repositories.analysis import AnalysisRepository
-    from sportsbetsinfo.db.repositories.evaluation import EvaluationRepository
-    from sportsbetsinfo.db.repositories.outcome import OutcomeRepository
-    from sportsbetsinfo.db.repositories.proposal import ProposalRepository
-    from sportsbetsinfo.db.repositories.snapshot import SnapshotRepository
+    from sportsbetsinfo.config.settings import get_settings
+    from sportsbetsinfo.services.verifier import IntegrityVerifier
 
-    db_path = ctx.obj["db_path"]
-    errors: list[str] = []
-    verified = 0
+    settings = get_settings().model_copy(update={"db_path": ctx.obj["db_path"]})
 
-    with get_connection(db_path) as conn:
-        # Verify snapshots
-        console.print("Verifying snapshots...", end=" ")
-        snapshot_repo = SnapshotRepository(conn)
-        try:
-            snapshots = snapshot_repo.get_all(limit=10000)
-            verified += len(snapshots)
-            console.print(f"[green]{len(snapshots)} OK[/green]")
-        except HashMismatchError as e:
-            errors.append(str(e))
-            console.print(f"[red]ERROR: {e}[/red]")
-
-        # Verify analyses
-        console.print("Verifying analyses...", end=" ")
-        analysis_repo = AnalysisRepository(conn)
-        try:
-            analyses = analysis_repo.get_all(limit=10000)
-            verified += len(analyses)
-            console.print(f"[green]{len(analyses)} OK[/green]")
-        except HashMismatchError as e:
-            errors.append(str(e))
-            console.print(f"[red]ERROR: {e}[/red]")
-
-        # Verify outcomes
-        console.print("Verifying outcomes...", end=" ")
-        outcome_repo = OutcomeRepository(conn)
-        try:
-            outcomes = outcome_repo.get_all(limit=10000)
-            verified += len(outcomes)
-            console.print(f"[green]{len(outcomes)} OK[/green]")
-        except HashMismatchError as e:
-            errors.append(str(e))
-            console.print(f"[red]ERROR: {e}[/red]")
-
-        # Verify evaluations
-        console.print("Verifying evaluations...", end=" ")
-        eval_repo = EvaluationRepository(conn)
-        try:
-            evaluations = eval_repo.get_all(limit=10000)
-            verified += len(evaluations)
-            console.print(f"[green]{len(evaluations)} OK[/green]")
-        except HashMismatchError as e:
-            errors.append(str(e))
-            console.print(f"[red]ERROR: {e}[/red]")
-
-        # Verify proposals
-        console.print("Verifying proposals...", end=" ")
-        proposal_repo = ProposalRepository(conn)
-        try:
-            proposals = proposal_repo.get_all(limit=10000)
-            verified += len(proposals)
-            console.print(f"[green]{len(proposals)} OK[/green]")
-        except HashMismatchError as e:
-            errors.append(str(e))
-            console.print(f"[red]ERROR: {e}[/red]")
+    verifier = IntegrityVerifier(settings, workers=workers, batch_size=batch_size)
+
+    with console.status("Verifying...") as status:
+
+        def on_progress(table: str, rows: int) -> None:
+            status.update(f"Verifying {table}... {rows:,} rows")
 
+        report = verifier.verify_all(
+            full=full,
+            checkpoint=not no_checkpoint,
+            on_progress=on_progress,
+        )
+
+    table = Table(title=f"Verification ({verifier.workers} worker(s))")
+    table.add_column("Table", style="cyan")
+    table.add_column("From rowid", justify="right", style="dim")
+    table.add_column("Rows", justify="right")
+    table.add_column("Mismatches", justify="right")
+    table.add_column("Rows/sec", justify="right", style="green")
+
+    for result in report.tables:
+        mismatch_style = "red" if result.mismatches else "green"
+        table.add_row(
+            result.table,
+            str(result.start_rowid + 1),
+            f"{result.rows:,}",
+            f"[{mismatch_style}]{len(result.mismatches)}[/{mismatch_style}]",
+            f"{result.rows_per_second:,.0f}",
+        )
+
+    console.print(table)
     console.print()
+
+    errors = report.mismatches
     if errors:
         console.print(f"[red]Found {len(errors)} integrity error(s)![/red]")
-        for err in errors[:10]:
+        for err in errors:
             console.print(f"  - {err}")
     else:
-        console.print(f"[green]All {verified} records verified successfully[/green]")
+        console.print(
+            f"[green]All {report.rows:,} records verified successfully "
+            f"({report.rows_per_second:,.0f} rows/sec)[/green]"
+        )
+
+
+@cli.command()
+@click.argument("output", type=click.Path(dir_okay=False, path_type=Path))
+@click.option(
+    "--codec",
+    type=click.Choice(["zlib", "none"]),
+    default="zlib",
+    show_default=True,
+    help="Codec for the JSON columns ('none' decompresses)",
+)
+@click.option("--level", default=6, show_default=True, type=click.IntRange(1, 9))
+@click.pass_context
+def recompress(ctx: click.Context, output: Path, codec: str, level: int) -> None:
+    """Copy the database into OUTPUT with JSON columns re-encoded.
+
+    Stored tables are immutable, so existing rows are never rewritten in
+    place. This copies every row (keeping rowids and hashes) into a new
+    database file, encoding snapshot payloads, normalized fields and
+    analysis features with the chosen codec. Point SPORTSBETS_DB_PATH at
+    OUTPUT once it looks right.
+    """
+    from sportsbetsinfo.db.codec import CodecName, ColumnCodec, recompress_database, table_sizes
+    from sportsbetsinfo.db.connection import get_connection, get_connection_manager
+    from sportsbetsinfo.db.schema import initialize_database
+
+    db_path = ctx.obj["db_path"]
+
+    if not db_path.exists():
+        console.print(f"[red]Database not found at {db_path}[/red]")
+        return
+    if output.exists():
+        console.print(f"[red]{output} already exists; recompress only writes new files[/red]")
+        return
+
+    dest = get_connection(output)
+    try:
+        initialize_database(dest)
+        with get_connection_manager(db_path).read() as source:
+            before = table_sizes(source)
+            with console.status("Recompressing...") as status:
+
+                def on_progress(table: str, rows: int) -> None:
+                    status.update(f"Copying {table}... {rows:,} rows")
+
+                # click.Choice has already restricted codec to a CodecName
+                column_codec = ColumnCodec(name=cast(CodecName, codec), level=level)
+                copied = recompress_database(source, dest, column_codec, on_progress=on_progress)
+        dest.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        after = table_sizes(dest)
+    finally:
+        dest.close()
+
+    table = Table(title=f"Recompressed to {output} ({codec})")
+    table.add_column("Table", style="cyan")
+    table.add_column("Rows", justify="right")
+    table.add_column("Before", justify="right")
+    table.add_column("After", justify="right", style="green")
+
+    for name, rows in copied.items():
+        table.add_row(
+            name,
+            f"{rows:,}",
+            f"{before.get(name, 0) / 1024:,.0f} KiB",
+            f"{after.get(name, 0) / 1024:,.0f} KiB",
+        )
+    table.add_row(
+        "[bold]Total[/bold]",
+        f"{sum(copied.values()):,}",
+        f"{sum(before.values()) / 1024:,.0f} KiB",
+        f"{sum(after.values()) / 1024:,.0f} KiB",
+    )
+
+    console.print(table)
 
 
 @cli.command()
 @click.argument("game_id", required=False)
 @click.option("--all", "analyze_all", is_flag=True, help="Analyze all games with snapshots")
+@click.option(
+    "--engine",
+    type=click.Choice(["auto", "numpy", "python"]),
+    default="auto",
+    show_default=True,
+    help="Batch engine for --all (numpy requires the 'fast' extra)",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Processes building analyses for --all [default: SPORTSBETS_ANALYSIS_WORKERS]",
+)
 @click.pass_context
-def analyze(ctx: click.Context, game_id: str | None, analyze_all: bool) -> None:
+def analyze(
+    ctx: click.Context,
+    game_id: str | None,
+    analyze_all: bool,
+    engine: str,
+    workers: int | None,
+) -> None:
     """Analyze snapshots comparing Kalshi vs Vegas (with vig).
 
     Creates Analysis objects with edge calculations.
     Use --all to analyze all games, or provide a specific GAME_ID.
     """
+    from rich.markup import escape
+
     from sportsbetsinfo.config.settings import get_settings
     from sportsbetsinfo.services.analyzer import AnalysisService
+    from sportsbetsinfo.services.vectorized import resolve_backend
 
     if not game_id and not analyze_all:
         console.print("[red]Provide a GAME_ID or use --all[/red]")
@@ -417,8 +776,20 @@ def analyze(ctx: click.Context, game_id: str | None, analyze_all: bool) -> None:
     service = AnalysisService(settings)
 
     if analyze_all:
-        console.print("Analyzing all games with snapshots...")
-        analyses = service.analyze_all_games()
+        try:
+            backend = resolve_backend(engine)
+        except ValueError as e:
+            console.print(f"[red]{escape(str(e))}[/red]")
+            return
+
+        workers = workers or settings.analysis_workers
+        console.print(
+            f"Analyzing all games with snapshots "
+            f"([dim]{backend} engine, {workers} worker(s)[/dim])..."
+        )
+        started = time.perf_counter()
+        analyses = service.analyze_all_games(engine=backend, workers=workers)
+        elapsed = time.perf_counter() - started
 
         if not analyses:
             console.print("[yellow]No analyses created (no matching data)[/yellow]")
@@ -443,7 +814,10 @@ def analyze(ctx: click.Context, game_id: str | None, analyze_all: bool) -> None:
             )
 
         console.print(table)
-        console.print(f"\n[green]Created {len(analyses)} analysis(es)[/green]")
+        console.print(
+            f"\n[green]Created {len(analyses)} analysis(es)[/green] "
+            f"[dim]in {elapsed:.2f}s ({len(analyses) / max(elapsed, 1e-9):,.0f}/sec)[/dim]"
+        )
 
     else:
         console.print(f"Analyzing game [cyan]{game_id}[/cyan]...")
@@ -574,7 +948,7 @@ def evaluate(ctx: click.Context, report: bool) -> None:
         return
 
     # Run evaluations
-    console.print("Evaluating analyses against outcomes...")
+    console.print(f"Evaluating analyses against outcomes ({service.pending_count()} pending)...")
     evaluations = service.evaluate_all_pending()
 
     if not evaluations:
@@ -9,37 +9,16 @@ from typing import Any
 
 import httpx
 
-from sportsbetsinfo.core.exceptions import APIError
-
-
-class RateLimiter:
-    """Simple token bucket rate limiter."""
-
-    def __init__(self, requests_per_second: float) -> None:
-        """Initialize rate limiter.
-
-        Args:
-            requests_per_second: Maximum requests per second
-        """
-        self.rate = requests_per_second
-        self.tokens = requests_per_second
-        self.last_update = time.monotonic()
-        self._lock = asyncio.Lock()
-
-    async def acquire(self) -> None:
-        """Wait until a request can be made."""
-        async with self._lock:
-            now = time.monotonic()
-            elapsed = now - self.last_update
-            self.tokens = min(self.rate, self.tokens + elapsed * self.rate)
-            self.last_update = now
-
-            if self.tokens < 1:
-                wait_time = (1 - self.tokens) / self.rate
-                await asyncio.sleep(wait_time)
-                self.tokens = 0
-            else:
-                self.tokens -= 1
+from sportsbetsinfo.clients.cache import (
+    CachedResponse,
+    CachePolicy,
+    ResponseCache,
+    cache_key,
+    storable_headers,
+)
+from sportsbetsinfo.clients.ratelimit import EndpointRateLimiter
+from sportsbetsinfo.clients.resilience import RetryPolicy, get_circuit_breaker, retry_after
+from sportsbetsinfo.core.exceptions import APIError, CircuitOpenError
 
 
 class BaseAPIClient(ABC):
@@ -47,16 +26,28 @@ class BaseAPIClient(ABC):
 
     Provides:
     - Async HTTP client management
-    - Rate limiting
-    - Error handling
+    - Rate limiting (client-wide burst plus per-endpoint ``RATE_LIMITS``)
+    - Error handling, retries with backoff and a per-host circuit breaker
     - Version tracking
+    - Request counting (``request_count``, ``cache_hits``)
+    - Optional response caching of GET requests (``CACHE_TTLS``)
     """
 
+    # Path regex to TTL in seconds for cacheable GET endpoints
+    CACHE_TTLS: dict[str, float] = {}
+
+    # Path regex to (requests per second, burst) for endpoints with their own limit
+    RATE_LIMITS: dict[str, tuple[float, int | None]] = {}
+
     def __init__(
         self,
         base_url: str,
         rate_limit: float = 1.0,
         timeout: float = 30.0,
+        burst: int | None = None,
+        cache: ResponseCache | None = None,
+        cache_ttls: dict[str, float] | None = None,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
         """Initialize client.
 
@@ -64,10 +55,27 @@ class BaseAPIClient(ABC):
             base_url: API base URL
             rate_limit: Requests per second
             timeout: Request timeout in seconds
+            burst: Requests allowed back to back (default: one second's worth)
+            cache: Response cache for GET requests (None disables caching)
+            cache_ttls: Per-endpoint TTLs overriding CACHE_TTLS
+            retry_policy: Retry and circuit breaker settings (default: RetryPolicy())
         """
         self.base_url = base_url
-        self.rate_limiter = RateLimiter(rate_limit)
+        self.rate_limiter = EndpointRateLimiter(
+            rate_limit, burst, self.RATE_LIMITS, name=self.__class__.__name__
+        )
         self.timeout = timeout
+        self.request_count = 0
+        self.retry_count = 0
+        self.cache_hits = 0
+        self.cache = cache
+        self.cache_policy = CachePolicy({**self.CACHE_TTLS, **(cache_ttls or {})})
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breaker = get_circuit_breaker(
+            httpx.URL(base_url).host,
+            self.retry_policy.breaker_threshold,
+            self.retry_policy.breaker_reset_timeout,
+        )
         self._client: httpx.AsyncClient | None = None
 
     async def __aenter__(self) -> BaseAPIClient:
@@ -92,10 +100,17 @@ class BaseAPIClient(ABC):
     ) -> httpx.Response:
         """Make a rate-limited HTTP request.
 
+        Cacheable GET requests are answered from the cache while fresh
+        (without counting against the rate limit or ``request_count``)
+        and revalidated with If-None-Match / If-Modified-Since once stale.
+        Requests that go upstream are first passed to _admit(), then sent
+        by _send() with retries and the host's circuit breaker.
+
         Args:
             method: HTTP method
             path: URL path
-            **kwargs: Additional httpx request arguments
+            **kwargs: Additional httpx request arguments, plus an optional
+                ``priority`` passed to _admit()
 
         Returns:
             HTTP response
@@ -105,11 +120,36 @@ class BaseAPIClient(ABC):
         """
         if not self._client:
             raise RuntimeError("Client not initialized. Use async context manager.")
+        priority = kwargs.pop("priority", None)
 
-        await self.rate_limiter.acquire()
+        ttl = (
+            self.cache_policy.ttl_for(path)
+            if self.cache is not None and method == "GET"
+            else None
+        )
+        key = cached = None
+        if ttl is not None:
+            assert self.cache is not None
+            key = cache_key(self.base_url, path, kwargs.get("params"))
+            cached = self.cache.get(key)
+            if cached is not None and cached.is_fresh():
+                self.cache.stats.hits += 1
+                self.cache_hits += 1
+                return cached.to_response(self._client.build_request(method, path, **kwargs))
+            if cached is not None:
+                validators: dict[str, str] = {}
+                if cached.etag:
+                    validators["If-None-Match"] = cached.etag
+                if cached.last_modified:
+                    validators["If-Modified-Since"] = cached.last_modified
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), **validators}
+
+        self._admit(method, path, priority)
 
         try:
-            response = await self._client.request(method, path, **kwargs)
+            response = await self._send(method, path, **kwargs)
+            if ttl is not None:
+                return self._cache_response(key, cached, response, ttl)
             response.raise_for_status()
             return response
         except httpx.HTTPStatusError as e:
@@ -124,6 +164,149 @@ class BaseAPIClient(ABC):
                 message=str(e),
             ) from e
 
+    async def _send(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a request upstream, retrying transient failures.
+
+        Each attempt waits for the rate limiter and gets fresh headers
+        from _request_headers(), so signed requests are re-signed.
+        Transport errors and retryable statuses count against the host's
+        breaker and are retried (idempotent methods only) after
+        Retry-After or a full-jitter backoff.
+
+        Args:
+            method: HTTP method
+            path: URL path
+            **kwargs: Additional httpx request arguments
+
+        Returns:
+            The last upstream response (possibly an error status)
+
+        Raises:
+            CircuitOpenError: If the host's breaker is open
+            httpx.RequestError: If the last attempt failed in transport
+        """
+        assert self._client is not None
+        policy = self.retry_policy
+        stats = self.breaker.stats
+        retry = 0
+        while True:
+            if not self.breaker.allow():
+                raise CircuitOpenError(
+                    self.__class__.__name__, self.breaker.host, self.breaker.retry_in()
+                )
+            await self.rate_limiter.acquire(path)
+            self.request_count += 1
+            stats.attempts += 1
+            headers = {
+                **(kwargs.get("headers") or {}),
+                **(await self._request_headers(method, path)),
+            }
+
+            response = None
+            try:
+                response = await self._client.request(
+                    method, path, **{**kwargs, "headers": headers}
+                )
+            except httpx.RequestError:
+                self.breaker.record_failure()
+                if not policy.is_retryable(method, None) or retry >= policy.max_retries:
+                    stats.giveups += 1
+                    raise
+                delay = policy.backoff(retry)
+            else:
+                if not policy.is_failure(response):
+                    self.breaker.record_success()
+                    return response
+                self.breaker.record_failure()
+                if not policy.is_retryable(method, response) or retry >= policy.max_retries:
+                    stats.giveups += 1
+                    return response
+                wait = retry_after(response)
+                if wait is not None and wait > policy.max_retry_after:
+                    stats.giveups += 1
+                    return response
+                if wait is not None:
+                    stats.retry_after_waits += 1
+                delay = wait if wait is not None else policy.backoff(retry)
+
+            retry += 1
+            stats.retries += 1
+            self.retry_count += 1
+            await asyncio.sleep(delay)
+
+    async def _request_headers(self, method: str, path: str) -> dict[str, str]:
+        """Hook returning per-attempt headers (e.g. request signatures).
+
+        Args:
+            method: HTTP method
+            path: URL path
+
+        Returns:
+            Headers merged over the caller's headers (default: none)
+        """
+        return {}
+
+    def _admit(self, method: str, path: str, priority: str | None) -> None:
+        """Hook run before a request is sent upstream.
+
+        Clients with a request budget override this to refuse requests
+        by raising APIError. The default admits everything.
+
+        Args:
+            method: HTTP method
+            path: URL path
+            priority: Priority given by the caller, if any
+        """
+        return None
+
+    def _cache_response(
+        self,
+        key: str | None,
+        cached: CachedResponse | None,
+        response: httpx.Response,
+        ttl: float,
+    ) -> httpx.Response:
+        """Store or revalidate a cacheable response.
+
+        Args:
+            key: Cache key of the request
+            cached: Stale entry that was revalidated, if any
+            response: Upstream response
+            ttl: Endpoint TTL in seconds
+
+        Returns:
+            The upstream response, or the cached one on a 304
+        """
+        assert self.cache is not None and key is not None
+        if response.status_code == 304 and cached is not None:
+            self.cache.stats.revalidated += 1
+            self.cache_hits += 1
+            self.cache.set(key, cached.refreshed(ttl))
+            # Served body is cached, but headers (quota) are from this request
+            return httpx.Response(
+                status_code=cached.status_code,
+                headers={**cached.headers, **storable_headers(response)},
+                content=cached.content,
+                request=response.request,
+            )
+
+        self.cache.stats.misses += 1
+        response.raise_for_status()
+        if "no-store" not in response.headers.get("cache-control", ""):
+            now = time.time()
+            self.cache.set(
+                key,
+                CachedResponse(
+                    status_code=response.status_code,
+                    headers=storable_headers(response),
+                    content=response.content,
+                    stored_at=now,
+                    expires_at=now + ttl,
+                ),
+            )
+            self.cache.stats.stores += 1
+        return response
+
     async def get(self, path: str, **kwargs: Any) -> httpx.Response:
         """Make GET request."""
         return await self._request("GET", path, **kwargs)
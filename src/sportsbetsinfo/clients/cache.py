@@ -0,0 +1,362 @@
+"""Response cache for API clients.
+
+The same upstream boards are requested several times a minute by the
+collection cron, the web ``/api/collect`` route and the outcome
+service. BaseAPIClient consults a ResponseCache before GET requests:
+
+- fresh entry (within the endpoint's TTL): served without a request
+- stale entry with an ETag or Last-Modified: revalidated with a
+  conditional request; a 304 refreshes the entry
+- otherwise: normal request, stored if the endpoint has a TTL
+
+Two backends are provided: MemoryResponseCache (per process) and
+SqliteResponseCache (shared across processes and CLI runs via a
+separate cache database, never the event store). Cached responses
+are marked so clients do not re-apply quota headers from them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+# Response extension set on responses served from the cache
+FROM_CACHE_EXTENSION = "sportsbetsinfo_from_cache"
+
+# Query parameters left out of cache keys (credentials)
+_SECRET_PARAMS = frozenset({"apiKey", "api_key"})
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A stored upstream response.
+
+    Attributes:
+        status_code: HTTP status of the original response
+        headers: Response headers
+        content: Response body
+        stored_at: Unix time the response was fetched or revalidated
+        expires_at: Unix time after which it must be revalidated
+    """
+
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    stored_at: float
+    expires_at: float
+
+    @property
+    def etag(self) -> str | None:
+        """ETag validator, if upstream sent one."""
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        """Last-Modified validator, if upstream sent one."""
+        return self.headers.get("last-modified")
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Whether the entry can be served without contacting upstream."""
+        return (now if now is not None else time.time()) < self.expires_at
+
+    def refreshed(self, ttl: float, now: float | None = None) -> CachedResponse:
+        """Copy with a new expiry after a successful revalidation."""
+        now = now if now is not None else time.time()
+        return replace(self, stored_at=now, expires_at=now + ttl)
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        """Rebuild an httpx.Response marked as served from the cache."""
+        return httpx.Response(
+            status_code=self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=request,
+            extensions={FROM_CACHE_EXTENSION: True},
+        )
+
+
+@dataclass
+class CacheStats:
+    """Cache hit metrics."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    stores: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered without a full response."""
+        lookups = self.hits + self.misses + self.revalidated
+        return (self.hits + self.revalidated) / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, float | int]:
+        """Convert to dictionary for serialization."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "stores": self.stores,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class ResponseCache(ABC):
+    """Storage backend for cached responses."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        """Get an entry (fresh or stale) by key."""
+
+    @abstractmethod
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store or replace an entry."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-process LRU cache."""
+
+    def __init__(self, max_entries: int = 512) -> None:
+        """Initialize cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+        """
+        super().__init__()
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Get an entry (fresh or stale) by key."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store or replace an entry."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SqliteResponseCache(ResponseCache):
+    """On-disk cache shared by every process using the same file.
+
+    Uses its own database file: cache rows are overwritten and
+    expire, which the append-only event store does not allow.
+    """
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS http_cache (
+        key TEXT PRIMARY KEY,
+        status_code INTEGER NOT NULL,
+        headers TEXT NOT NULL,
+        content BLOB NOT NULL,
+        stored_at REAL NOT NULL,
+        expires_at REAL NOT NULL
+    )
+    """
+
+    def __init__(self, path: Path | str, max_stale_seconds: float = 86400.0) -> None:
+        """Open (and create if needed) the cache database.
+
+        Args:
+            path: Cache database file
+            max_stale_seconds: Entries expired longer than this are purged on open
+        """
+        super().__init__()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA busy_timeout = 5000")
+        with self._lock:
+            self._conn.execute(self._SCHEMA)
+            self._conn.execute(
+                "DELETE FROM http_cache WHERE expires_at < ?",
+                (time.time() - max_stale_seconds,),
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Get an entry (fresh or stale) by key."""
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT status_code, headers, content, stored_at, expires_at
+                FROM http_cache WHERE key = ?
+                """,
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(
+            status_code=row[0],
+            headers=json.loads(row[1]),
+            content=bytes(row[2]),
+            stored_at=row[3],
+            expires_at=row[4],
+        )
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store or replace an entry."""
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO http_cache (
+                    key, status_code, headers, content, stored_at, expires_at
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    key,
+                    entry.status_code,
+                    json.dumps(entry.headers),
+                    entry.content,
+                    entry.stored_at,
+                    entry.expires_at,
+                ),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM http_cache")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
+
+
+class CachePolicy:
+    """Per-endpoint TTLs, matched against request paths."""
+
+    def __init__(self, ttls: dict[str, float]) -> None:
+        """Initialize policy.
+
+        Args:
+            ttls: Regex (matched against the full path) to TTL in seconds.
+                The first matching pattern wins; unmatched paths and
+                TTLs <= 0 are not cached.
+        """
+        self._rules = [(re.compile(pattern), ttl) for pattern, ttl in ttls.items()]
+
+    def ttl_for(self, path: str) -> float | None:
+        """Get the TTL for a request path, or None if it is not cached."""
+        for pattern, ttl in self._rules:
+            if pattern.fullmatch(path):
+                return ttl if ttl > 0 else None
+        return None
+
+
+def cache_key(base_url: str, path: str, params: Any = None) -> str:
+    """Build a cache key for a GET request.
+
+    Credentials in the query string are left out, and parameters are
+    sorted so equivalent requests share an entry.
+
+    Args:
+        base_url: Client base URL
+        path: Request path
+        params: Query parameters
+
+    Returns:
+        Hex digest identifying the request
+    """
+    items = sorted(
+        (str(k), str(v))
+        for k, v in httpx.QueryParams(params or {}).multi_items()
+        if k not in _SECRET_PARAMS
+    )
+    return hashlib.sha256(json.dumps([base_url, path, items]).encode("utf-8")).hexdigest()
+
+
+def is_from_cache(response: httpx.Response) -> bool:
+    """Whether a response was served from the cache rather than upstream."""
+    return bool(response.extensions.get(FROM_CACHE_EXTENSION))
+
+
+def storable_headers(response: httpx.Response) -> dict[str, str]:
+    """Response headers worth keeping with a cached body."""
+    return {
+        k.lower(): v
+        for k, v in response.headers.items()
+        if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+    }
+
+
+_caches: dict[tuple[str, str], ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_response_cache(backend: str, path: Path | str | None = None) -> ResponseCache | None:
+    """Get the process-wide cache for a backend.
+
+    Args:
+        backend: "off", "memory" or "sqlite"
+        path: Cache database file (sqlite backend)
+
+    Returns:
+        Shared ResponseCache, or None if caching is off
+    """
+    if backend == "off":
+        return None
+    key = (backend, str(Path(path).resolve()) if path else "")
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            if backend == "memory":
+                cache = MemoryResponseCache()
+            elif backend == "sqlite":
+                if path is None:
+                    raise ValueError("The sqlite response cache needs a path")
+                cache = SqliteResponseCache(path)
+            else:
+                raise ValueError(f"Unknown response cache backend: {backend}")
+            _caches[key] = cache
+        return cache
+
+
+def get_cache_stats() -> dict[str, dict[str, float | int]]:
+    """Get statistics for every cache created in this process.
+
+    Returns:
+        Backend name to CacheStats dictionary
+    """
+    with _caches_lock:
+        return {backend: cache.stats.to_dict() for (backend, _), cache in _caches.items()}
@@ -6,8 +6,12 @@ Uses RSA key authentication.
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import threading
 import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -15,8 +19,49 @@ from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding, rsa
 
 from sportsbetsinfo.clients.base import BaseAPIClient
+from sportsbetsinfo.clients.cache import ResponseCache
+from sportsbetsinfo.clients.resilience import RetryPolicy
 from sportsbetsinfo.core.exceptions import APIError
 
+# Largest page sizes the API accepts
+MAX_MARKETS_PAGE_SIZE = 1000
+MAX_EVENTS_PAGE_SIZE = 200
+
+# Pages buffered per concurrent series before producers wait
+_SERIES_QUEUE_PAGES = 4
+
+_signer_pools: dict[int, ThreadPoolExecutor] = {}
+_signer_pools_lock = threading.Lock()
+
+
+def get_signer_pool(threads: int, prewarm: bool = False) -> ThreadPoolExecutor:
+    """Get the process-wide thread pool for request signing.
+
+    RSA-PSS signing is CPU work; running it in a pool keeps it off the
+    event loop so other coroutines (and web handlers) are not stalled.
+    Pools are shared by every KalshiClient asking for the same size.
+
+    Args:
+        threads: Signing threads
+        prewarm: Start every thread when the pool is created instead of
+            on first use
+
+    Returns:
+        Shared ThreadPoolExecutor
+    """
+    with _signer_pools_lock:
+        pool = _signer_pools.get(threads)
+        created = pool is None
+        if pool is None:
+            pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="kalshi-signer")
+            _signer_pools[threads] = pool
+    if prewarm and created:
+        # Tasks that wait for each other force the pool to spawn every thread
+        barrier = threading.Barrier(threads)
+        for future in [pool.submit(barrier.wait, 5.0) for _ in range(threads)]:
+            future.result()
+    return pool
+
 
 class KalshiClient(BaseAPIClient):
     """Client for Kalshi prediction market API.
@@ -28,11 +73,25 @@ class KalshiClient(BaseAPIClient):
     API_VERSION = "v2"
     BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
 
+    # Prices move quickly; series metadata rarely changes. Orderbooks and
+    # exchange status are never cached.
+    CACHE_TTLS = {
+        r"/markets": 15.0,
+        r"/markets/[^/]+": 15.0,
+        r"/events": 60.0,
+        r"/series/[^/]+": 3600.0,
+    }
+
     def __init__(
         self,
         api_key: str,
         private_key_path: Path,
         rate_limit: float = 10.0,
+        burst: int | None = None,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        base_url: str | None = None,
+        signer: ThreadPoolExecutor | None = None,
     ) -> None:
         """Initialize Kalshi client with RSA authentication.
 
@@ -40,13 +99,23 @@ class KalshiClient(BaseAPIClient):
             api_key: Kalshi API key ID (from API keys page)
             private_key_path: Path to RSA private key file (.pem)
             rate_limit: Requests per second (default 10)
+            burst: Requests allowed back to back (default: one second's worth)
+            cache: Response cache for GET requests
+            retry_policy: Retry and circuit breaker settings
+            base_url: Override BASE_URL (e.g. a local stand-in server)
+            signer: Thread pool requests are signed in (None signs on the
+                event loop); see get_signer_pool()
         """
         super().__init__(
-            base_url=self.BASE_URL,
+            base_url=base_url or self.BASE_URL,
             rate_limit=rate_limit,
+            burst=burst,
+            cache=cache,
+            retry_policy=retry_policy,
         )
         self.api_key = api_key
         self._private_key = self._load_private_key(private_key_path)
+        self._signer = signer
 
     def _load_private_key(self, key_path: Path) -> rsa.RSAPrivateKey:
         """Load RSA private key from file.
@@ -93,7 +162,7 @@ class KalshiClient(BaseAPIClient):
         return base64.b64encode(signature).decode("utf-8")
 
     def _auth_headers(self, method: str, path: str) -> dict[str, str]:
-        """Get authentication headers for a request.
+        """Get authentication headers for a request, signing on this thread.
 
         Args:
             method: HTTP method
@@ -103,14 +172,29 @@ class KalshiClient(BaseAPIClient):
             Dictionary with auth headers
         """
         timestamp_ms = int(time.time() * 1000)
-        signature = self._sign_request(method, path, timestamp_ms)
+        return self._signed_headers(timestamp_ms, self._sign_request(method, path, timestamp_ms))
 
+    def _signed_headers(self, timestamp_ms: int, signature: str) -> dict[str, str]:
+        """Build the auth headers for a signature."""
         return {
             "KALSHI-ACCESS-KEY": self.api_key,
             "KALSHI-ACCESS-SIGNATURE": signature,
             "KALSHI-ACCESS-TIMESTAMP": str(timestamp_ms),
         }
 
+    async def _request_headers(self, method: str, path: str) -> dict[str, str]:
+        """Sign every attempt, so retried requests carry a fresh timestamp.
+
+        Signing runs in the signer pool when one is configured.
+        """
+        if self._signer is None:
+            return self._auth_headers(method, path)
+        timestamp_ms = int(time.time() * 1000)
+        signature = await asyncio.get_running_loop().run_in_executor(
+            self._signer, self._sign_request, method, path, timestamp_ms
+        )
+        return self._signed_headers(timestamp_ms, signature)
+
     async def authenticate(self) -> None:
         """Verify authentication works by fetching account info.
 
@@ -129,12 +213,14 @@ class KalshiClient(BaseAPIClient):
         path = "/exchange/status"
         response = await self.get(
             path,
-            headers=self._auth_headers("GET", path),
         )
         return response.json()
 
     async def get_markets(self, **kwargs: Any) -> dict[str, Any]:
-        """Get available markets.
+        """Get one page of available markets.
+
+        Use iter_markets() or iter_market_pages() to follow the cursor
+        through every page.
 
         Kwargs:
             series_ticker: Filter by series (e.g., "NBA")
@@ -157,11 +243,127 @@ class KalshiClient(BaseAPIClient):
 
         response = await self.get(
             path,
-            headers=self._auth_headers("GET", path),
             params={k: v for k, v in params.items() if v is not None},
         )
         return response.json()
 
+    async def iter_market_pages(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over every page of markets, following the cursor.
+
+        Only one page is held at a time, so callers can normalize pages
+        as they arrive.
+
+        Kwargs:
+            Same filters as get_markets(); ``limit`` is the page size
+            (default MAX_MARKETS_PAGE_SIZE)
+            max_pages: Stop after this many pages
+
+        Yields:
+            Raw page responses (``markets`` and ``cursor``)
+        """
+        kwargs.setdefault("limit", MAX_MARKETS_PAGE_SIZE)
+        async for page in self._paginate(self.get_markets, "markets", **kwargs):
+            yield page
+
+    async def iter_markets(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over every market across all pages.
+
+        Kwargs:
+            Same as iter_market_pages()
+
+        Yields:
+            Raw market dictionaries
+        """
+        async for page in self.iter_market_pages(**kwargs):
+            for market in page.get("markets") or []:
+                yield market
+
+    async def iter_markets_by_series(
+        self,
+        series_tickers: list[str],
+        **kwargs: Any,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Page through several series concurrently.
+
+        Each series is paginated by its own task; all requests share this
+        client's rate limiter. Pages are yielded as they arrive, so
+        series may interleave, but each series' pages stay in order.
+
+        Args:
+            series_tickers: Series to fetch (e.g. ["KXNBAGAME", "KXNFLGAME"])
+
+        Kwargs:
+            Same as iter_market_pages() (except series_ticker)
+
+        Yields:
+            (series_ticker, raw page) tuples
+
+        Raises:
+            APIError: If fetching any series fails
+        """
+        queue: asyncio.Queue[tuple[str, dict[str, Any] | BaseException | None]] = (
+            asyncio.Queue(maxsize=_SERIES_QUEUE_PAGES * max(1, len(series_tickers)))
+        )
+
+        async def produce(series_ticker: str) -> None:
+            try:
+                async for page in self.iter_market_pages(series_ticker=series_ticker, **kwargs):
+                    await queue.put((series_ticker, page))
+            except Exception as e:
+                await queue.put((series_ticker, e))
+            else:
+                await queue.put((series_ticker, None))
+
+        tasks = [asyncio.create_task(produce(ticker)) for ticker in series_tickers]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                series_ticker, item = await queue.get()
+                if item is None:
+                    remaining -= 1
+                elif isinstance(item, BaseException):
+                    raise item
+                else:
+                    yield series_ticker, item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _paginate(
+        self,
+        fetch: Callable[..., Awaitable[dict[str, Any]]],
+        items_key: str,
+        max_pages: int | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Call a list endpoint repeatedly until the cursor is exhausted.
+
+        Args:
+            fetch: Bound list method (get_markets or get_events)
+            items_key: Response key holding the page's items
+            max_pages: Stop after this many pages
+
+        Yields:
+            Raw page responses
+        """
+        seen_cursors: set[str] = set()
+        cursor = kwargs.pop("cursor", None)
+        pages = 0
+
+        while max_pages is None or pages < max_pages:
+            if cursor:
+                kwargs["cursor"] = cursor
+            page = await fetch(**kwargs)
+            pages += 1
+            yield page
+
+            cursor = page.get("cursor")
+            # An empty page or a repeated cursor means there is nothing further
+            if not cursor or not page.get(items_key) or cursor in seen_cursors:
+                return
+            seen_cursors.add(cursor)
+
     async def get_odds(self, market_id: str) -> dict[str, Any]:
         """Get current orderbook for a market.
 
@@ -174,7 +376,6 @@ class KalshiClient(BaseAPIClient):
         path = f"/markets/{market_id}/orderbook"
         response = await self.get(
             path,
-            headers=self._auth_headers("GET", path),
         )
         return response.json()
 
@@ -190,12 +391,13 @@ class KalshiClient(BaseAPIClient):
         path = f"/markets/{market_id}"
         response = await self.get(
             path,
-            headers=self._auth_headers("GET", path),
         )
         return response.json()
 
     async def get_events(self, **kwargs: Any) -> dict[str, Any]:
-        """Get events (groups of related markets).
+        """Get one page of events (groups of related markets).
+
+        Use iter_events() or iter_event_pages() to follow the cursor.
 
         Kwargs:
             series_ticker: Filter by series
@@ -218,11 +420,38 @@ class KalshiClient(BaseAPIClient):
 
         response = await self.get(
             path,
-            headers=self._auth_headers("GET", path),
             params={k: v for k, v in params.items() if v is not None},
         )
         return response.json()
 
+    async def iter_event_pages(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over every page of events, following the cursor.
+
+        Kwargs:
+            Same filters as get_events(); ``limit`` is the page size
+            (default MAX_EVENTS_PAGE_SIZE)
+            max_pages: Stop after this many pages
+
+        Yields:
+            Raw page responses (``events`` and ``cursor``)
+        """
+        kwargs.setdefault("limit", MAX_EVENTS_PAGE_SIZE)
+        async for page in self._paginate(self.get_events, "events", **kwargs):
+            yield page
+
+    async def iter_events(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over every event across all pages.
+
+        Kwargs:
+            Same as iter_event_pages()
+
+        Yields:
+            Raw event dictionaries
+        """
+        async for page in self.iter_event_pages(**kwargs):
+            for event in page.get("events") or []:
+                yield event
+
     async def get_series(self, series_ticker: str) -> dict[str, Any]:
         """Get series information.
 
@@ -235,7 +464,6 @@ class KalshiClient(BaseAPIClient):
         path = f"/series/{series_ticker}"
         response = await self.get(
             path,
-            headers=self._auth_headers("GET", path),
         )
         return response.json()
 
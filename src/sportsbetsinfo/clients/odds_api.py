@@ -8,7 +8,13 @@ from __future__ import annotations
 from datetime import date, datetime, timezone
 from typing import Any
 
+import httpx
+
 from sportsbetsinfo.clients.base import BaseAPIClient
+from sportsbetsinfo.clients.cache import ResponseCache, is_from_cache
+from sportsbetsinfo.clients.quota import PRIORITY_NORMAL, QuotaBudgeter
+from sportsbetsinfo.clients.resilience import RetryPolicy
+from sportsbetsinfo.core.exceptions import QuotaBudgetError
 
 
 class OddsAPIClient(BaseAPIClient):
@@ -31,37 +37,85 @@ class OddsAPIClient(BaseAPIClient):
         "ncaaf": "americanfootball_ncaaf",
     }
 
+    # Every request costs quota, so responses are reused while fresh
+    CACHE_TTLS = {
+        r"/sports": 3600.0,
+        r"/sports/[^/]+/odds": 60.0,
+        r"/sports/[^/]+/events/[^/]+/odds": 60.0,
+        r"/sports/[^/]+/scores": 120.0,
+    }
+
     def __init__(
         self,
         api_key: str,
         rate_limit: float = 1.0,
+        burst: int | None = None,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        base_url: str | None = None,
+        budget: QuotaBudgeter | None = None,
     ) -> None:
         """Initialize The Odds API client.
 
         Args:
             api_key: API key from the-odds-api.com
             rate_limit: Requests per second (be conservative to stay in quota)
+            burst: Requests allowed back to back (default: one second's worth)
+            cache: Response cache for GET requests
+            retry_policy: Retry and circuit breaker settings
+            base_url: Override BASE_URL (e.g. a local stand-in server)
+            budget: Quota budgeter that may defer requests (None never defers)
         """
         super().__init__(
-            base_url=self.BASE_URL,
+            base_url=base_url or self.BASE_URL,
             rate_limit=rate_limit,
+            burst=burst,
+            cache=cache,
+            retry_policy=retry_policy,
         )
         self.api_key = api_key
+        self.budget = budget
         self._requests_remaining: int | None = None
         self._requests_used: int | None = None
 
-    def _update_quota(self, headers: dict[str, Any]) -> None:
-        """Update request quota from response headers."""
+    def _update_quota(self, response: httpx.Response) -> None:
+        """Update request quota from response headers.
+
+        Responses served from the cache carry the quota of an earlier
+        request and are ignored.
+        """
+        if is_from_cache(response):
+            return
+        headers = response.headers
         if "x-requests-remaining" in headers:
             self._requests_remaining = int(headers["x-requests-remaining"])
         if "x-requests-used" in headers:
             self._requests_used = int(headers["x-requests-used"])
+        if self.budget is not None:
+            self.budget.observe(self._requests_remaining, self._requests_used)
+
+    def _admit(self, method: str, path: str, priority: str | None) -> None:
+        """Refuse requests the quota budget cannot afford.
+
+        Raises:
+            QuotaBudgetError: If the budget defers the request
+        """
+        if self.budget is None:
+            return
+        decision = self.budget.check(priority or PRIORITY_NORMAL)
+        if not decision.allowed:
+            raise QuotaBudgetError(self.__class__.__name__, decision.priority, decision.reason)
 
     @property
     def requests_remaining(self) -> int | None:
         """Get remaining API requests for the month."""
         return self._requests_remaining
 
+    @property
+    def requests_used(self) -> int | None:
+        """Get API requests used so far this month."""
+        return self._requests_used
+
     async def get_sports(self) -> list[dict[str, Any]]:
         """Get list of available sports.
 
@@ -72,7 +126,7 @@ class OddsAPIClient(BaseAPIClient):
             "/sports",
             params={"apiKey": self.api_key},
         )
-        self._update_quota(dict(response.headers))
+        self._update_quota(response)
         return response.json()
 
     async def get_markets(self, **kwargs: Any) -> dict[str, Any]:
@@ -83,6 +137,7 @@ class OddsAPIClient(BaseAPIClient):
             regions: Comma-separated regions (default "us")
             markets: Comma-separated market types (default "h2h")
             odds_format: "american" or "decimal" (default "american")
+            priority: Budget priority ("high", "normal" or "low")
 
         Returns:
             Dictionary with events and remaining quota
@@ -96,8 +151,9 @@ class OddsAPIClient(BaseAPIClient):
                 "markets": kwargs.get("markets", "h2h"),
                 "oddsFormat": kwargs.get("odds_format", "american"),
             },
+            priority=kwargs.get("priority"),
         )
-        self._update_quota(dict(response.headers))
+        self._update_quota(response)
         return {
             "events": response.json(),
             "requests_remaining": self._requests_remaining,
@@ -108,7 +164,7 @@ class OddsAPIClient(BaseAPIClient):
 
         Args:
             event_id: The Odds API event ID
-            **kwargs: Additional parameters (regions, markets, etc.)
+            **kwargs: Additional parameters (regions, markets, priority, etc.)
 
         Returns:
             Dictionary with detailed odds from all bookmakers
@@ -122,18 +178,20 @@ class OddsAPIClient(BaseAPIClient):
                 "markets": kwargs.get("markets", "h2h,spreads,totals"),
                 "oddsFormat": kwargs.get("odds_format", "american"),
             },
+            priority=kwargs.get("priority"),
         )
-        self._update_quota(dict(response.headers))
+        self._update_quota(response)
         return response.json()
 
     async def get_scores(
-        self, sport: str, days_from: int = 1
+        self, sport: str, days_from: int = 1, priority: str | None = None
     ) -> list[dict[str, Any]]:
         """Get recent scores/results.
 
         Args:
             sport: Sport key
             days_from: Days back to fetch (1-3)
+            priority: Budget priority ("high", "normal" or "low")
 
         Returns:
             List of completed events with scores
@@ -144,8 +202,9 @@ class OddsAPIClient(BaseAPIClient):
                 "apiKey": self.api_key,
                 "daysFrom": days_from,
             },
+            priority=priority,
         )
-        self._update_quota(dict(response.headers))
+        self._update_quota(response)
         return response.json()
 
     def get_version(self) -> str:
@@ -0,0 +1,343 @@
+"""Request budgeting for quota-limited APIs (The Odds API).
+
+The Odds API reports ``x-requests-remaining`` and ``x-requests-used``
+on every response. QuotaBudgeter records them in a small JSON state
+file shared by every process (cron runs, the web server, the CLI) and
+spreads the remaining quota evenly over the rest of the billing period:
+
+- today's allowance = (remaining + used today) / days left in the period
+- high priority calls (games near tip-off) run until the quota is gone
+- normal priority calls run while today's usage is under the allowance
+- low priority calls run while today's usage is under half of it
+
+The state file is replaced atomically; concurrent processes can at
+worst lose one usage sample, never corrupt the file.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+PRIORITY_HIGH = "high"
+PRIORITY_NORMAL = "normal"
+PRIORITY_LOW = "low"
+PRIORITIES = (PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW)
+
+# Share of today's allowance available to each priority
+_PRIORITY_SHARE = {PRIORITY_HIGH: None, PRIORITY_NORMAL: 1.0, PRIORITY_LOW: 0.5}
+
+# Games starting within this window make their board high priority
+HIGH_PRIORITY_WINDOW = timedelta(hours=2)
+# Boards with no game within this window are low priority
+LOW_PRIORITY_WINDOW = timedelta(hours=24)
+
+# Usage samples older than this are dropped; the burn rate uses the last week
+_SAMPLE_RETENTION = timedelta(days=14)
+_BURN_RATE_WINDOW = timedelta(days=7)
+_MIN_BURN_RATE_SPAN = timedelta(hours=1)
+
+
+@dataclass(frozen=True)
+class BudgetDecision:
+    """Whether a request may spend quota.
+
+    Attributes:
+        allowed: True if the request may be sent
+        priority: Priority the request was judged at
+        reason: Why it was refused (empty when allowed)
+    """
+
+    allowed: bool
+    priority: str
+    reason: str = ""
+
+
+@dataclass(frozen=True)
+class QuotaForecast:
+    """Budget and burn-rate projection for the current billing period.
+
+    Attributes:
+        remaining: Requests remaining (None before the first response)
+        used: Requests used this period
+        period_end: When the quota resets
+        days_left: Days until the reset (fractional)
+        daily_allowance: Requests per day that spend the quota evenly
+        used_today: Requests used since midnight UTC
+        burn_rate_per_day: Recent average requests per day
+        exhausted_at: When the quota runs out at the burn rate (None if it
+            lasts until the reset or the rate is unknown)
+        deferred: Requests refused by the budget this period
+    """
+
+    remaining: int | None
+    used: int | None
+    period_end: datetime
+    days_left: float
+    daily_allowance: float | None
+    used_today: int
+    burn_rate_per_day: float | None
+    exhausted_at: datetime | None
+    deferred: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "remaining": self.remaining,
+            "used": self.used,
+            "period_end": self.period_end.isoformat(),
+            "days_left": round(self.days_left, 2),
+            "daily_allowance": (
+                round(self.daily_allowance, 1) if self.daily_allowance is not None else None
+            ),
+            "used_today": self.used_today,
+            "burn_rate_per_day": (
+                round(self.burn_rate_per_day, 1) if self.burn_rate_per_day is not None else None
+            ),
+            "exhausted_at": self.exhausted_at.isoformat() if self.exhausted_at else None,
+            "deferred": self.deferred,
+        }
+
+
+def period_end(now: datetime, reset_day: int) -> datetime:
+    """Get the next quota reset after ``now``.
+
+    Args:
+        now: Current time (UTC)
+        reset_day: Day of the month the quota resets (1-28)
+
+    Returns:
+        Midnight UTC of the next reset day
+    """
+    reset = datetime(now.year, now.month, reset_day, tzinfo=timezone.utc)
+    if reset <= now:
+        year, month = (now.year + 1, 1) if now.month == 12 else (now.year, now.month + 1)
+        reset = datetime(year, month, reset_day, tzinfo=timezone.utc)
+    return reset
+
+
+def priority_for_tipoff(
+    tipoffs: Iterable[datetime], now: datetime | None = None
+) -> str:
+    """Get the priority of a board from its games' start times.
+
+    Args:
+        tipoffs: Commence times of the games on the board
+        now: Current time (default: now)
+
+    Returns:
+        PRIORITY_HIGH if a game starts (or started) within two hours,
+        PRIORITY_LOW if none starts within a day, else PRIORITY_NORMAL
+    """
+    now = now or datetime.now(timezone.utc)
+    upcoming = [t - now for t in tipoffs if t - now > -HIGH_PRIORITY_WINDOW]
+    if not upcoming:
+        return PRIORITY_LOW
+    nearest = min(upcoming)
+    if nearest <= HIGH_PRIORITY_WINDOW:
+        return PRIORITY_HIGH
+    if nearest <= LOW_PRIORITY_WINDOW:
+        return PRIORITY_NORMAL
+    return PRIORITY_LOW
+
+
+class QuotaBudgeter:
+    """Spread a monthly request quota over the billing period."""
+
+    def __init__(self, state_path: Path | str, reset_day: int = 1) -> None:
+        """Initialize budgeter.
+
+        Args:
+            state_path: JSON file holding budget state across processes
+            reset_day: Day of the month the quota resets (1-28)
+        """
+        if not 1 <= reset_day <= 28:
+            raise ValueError("reset_day must be between 1 and 28")
+        self.state_path = Path(state_path)
+        self.reset_day = reset_day
+        self._lock = threading.Lock()
+
+    def observe(self, remaining: int | None, used: int | None, now: datetime | None = None) -> None:
+        """Record quota headers from an upstream response.
+
+        Args:
+            remaining: x-requests-remaining
+            used: x-requests-used
+            now: Observation time (default: now)
+        """
+        if remaining is None and used is None:
+            return
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            state = self._load()
+            samples = state["samples"]
+            # Usage dropping means the quota was reset
+            if used is not None and samples and used < samples[-1][1]:
+                samples.clear()
+                state["deferred"] = 0
+            if used is not None:
+                samples.append([now.isoformat(), used])
+            cutoff = now - _SAMPLE_RETENTION
+            state["samples"] = [s for s in samples if datetime.fromisoformat(s[0]) >= cutoff]
+            state["remaining"] = remaining
+            state["used"] = used
+            state["observed_at"] = now.isoformat()
+            self._save(state)
+
+    def note_tipoffs(self, key: str, tipoffs: Iterable[datetime]) -> None:
+        """Remember the start times of the games on a board.
+
+        Later processes use them to prioritize the board before fetching it.
+
+        Args:
+            key: Board key (e.g. the sport key)
+            tipoffs: Commence times of the games on the board
+        """
+        with self._lock:
+            state = self._load()
+            state["tipoffs"][key] = sorted(t.isoformat() for t in tipoffs)
+            self._save(state)
+
+    def priority_for(self, key: str, now: datetime | None = None) -> str:
+        """Get the priority of a board from its last known games.
+
+        Args:
+            key: Board key passed to note_tipoffs()
+            now: Current time (default: now)
+
+        Returns:
+            Priority (PRIORITY_NORMAL for boards never seen)
+        """
+        known = self._load()["tipoffs"].get(key)
+        if known is None:
+            return PRIORITY_NORMAL
+        return priority_for_tipoff((datetime.fromisoformat(t) for t in known), now)
+
+    def check(self, priority: str = PRIORITY_NORMAL, now: datetime | None = None) -> BudgetDecision:
+        """Decide whether a request may spend quota, counting refusals.
+
+        Args:
+            priority: PRIORITY_HIGH, PRIORITY_NORMAL or PRIORITY_LOW
+            now: Current time (default: now)
+
+        Returns:
+            BudgetDecision
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown request priority: {priority}")
+        forecast = self.forecast(now)
+        decision = self._decide(forecast, priority)
+        if not decision.allowed:
+            with self._lock:
+                state = self._load()
+                state["deferred"] += 1
+                self._save(state)
+        return decision
+
+    def forecast(self, now: datetime | None = None) -> QuotaForecast:
+        """Project the budget and the day the quota runs out.
+
+        Args:
+            now: Current time (default: now)
+
+        Returns:
+            QuotaForecast
+        """
+        now = now or datetime.now(timezone.utc)
+        state = self._load()
+        remaining: int | None = state["remaining"]
+        used: int | None = state["used"]
+        samples = [(datetime.fromisoformat(t), u) for t, u in state["samples"]]
+        end = period_end(now, self.reset_day)
+        days_left = max((end - now).total_seconds() / 86400, 0.0)
+
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        used_today = self._used_since(samples, midnight)
+        allowance = None
+        if remaining is not None:
+            allowance = (remaining + used_today) / max(days_left, 1.0)
+
+        burn_rate = None
+        recent = [s for s in samples if s[0] >= now - _BURN_RATE_WINDOW]
+        if len(recent) >= 2 and recent[-1][0] - recent[0][0] >= _MIN_BURN_RATE_SPAN:
+            span_days = (recent[-1][0] - recent[0][0]).total_seconds() / 86400
+            burn_rate = (recent[-1][1] - recent[0][1]) / span_days
+
+        exhausted_at = None
+        if remaining is not None and burn_rate:
+            projected = now + timedelta(days=remaining / burn_rate)
+            if projected < end:
+                exhausted_at = projected
+
+        return QuotaForecast(
+            remaining=remaining,
+            used=used,
+            period_end=end,
+            days_left=days_left,
+            daily_allowance=allowance,
+            used_today=used_today,
+            burn_rate_per_day=burn_rate,
+            exhausted_at=exhausted_at,
+            deferred=state["deferred"],
+        )
+
+    @staticmethod
+    def _decide(forecast: QuotaForecast, priority: str) -> BudgetDecision:
+        """Apply the priority rules to a forecast."""
+        if forecast.remaining is None:
+            return BudgetDecision(True, priority)
+        if forecast.remaining <= 0:
+            return BudgetDecision(False, priority, "quota exhausted")
+        share = _PRIORITY_SHARE[priority]
+        if share is None or forecast.daily_allowance is None:
+            return BudgetDecision(True, priority)
+        limit = forecast.daily_allowance * share
+        if forecast.used_today >= limit:
+            return BudgetDecision(
+                False,
+                priority,
+                f"{forecast.used_today} used today, {priority} priority limit {limit:.0f}",
+            )
+        return BudgetDecision(True, priority)
+
+    @staticmethod
+    def _used_since(samples: list[tuple[datetime, int]], since: datetime) -> int:
+        """Requests used since a time, from the usage samples."""
+        if not samples:
+            return 0
+        before = [u for t, u in samples if t < since]
+        baseline = before[-1] if before else next(u for t, u in samples if t >= since)
+        return max(samples[-1][1] - baseline, 0)
+
+    def _load(self) -> dict[str, Any]:
+        """Read the state file (empty state if missing or unreadable)."""
+        state: dict[str, Any] = {}
+        with contextlib.suppress(FileNotFoundError, ValueError):
+            state = json.loads(self.state_path.read_text())
+        state.setdefault("remaining", None)
+        state.setdefault("used", None)
+        state.setdefault("observed_at", None)
+        state.setdefault("samples", [])
+        state.setdefault("deferred", 0)
+        state.setdefault("tipoffs", {})
+        return state
+
+    def _save(self, state: dict[str, Any]) -> None:
+        """Atomically replace the state file."""
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.state_path.parent, prefix=".quota-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp, self.state_path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
@@ -0,0 +1,193 @@
+"""GCRA rate limiting for API clients.
+
+RateLimiter implements the generic cell rate algorithm: each request
+reserves the next slot on a theoretical arrival time (TAT) and then
+sleeps until its slot, so waiting coroutines sleep concurrently
+instead of queueing behind a lock. Up to ``burst`` requests may be
+sent back to back before the steady ``rate`` applies.
+
+EndpointRateLimiter combines a client-wide bucket with optional
+per-endpoint buckets (path regexes), e.g. a tighter limit for a
+costly endpoint without slowing the rest of the client.
+
+Wait times are recorded in per-limiter histograms, aggregated by name
+across client instances and exposed by get_rate_limit_stats().
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+
+# Histogram bucket upper bounds in seconds (a final +Inf bucket is implied)
+WAIT_BUCKETS = (0.0, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class WaitHistogram:
+    """Histogram of rate limiter wait times."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(WAIT_BUCKETS) + 1))
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def count(self) -> int:
+        """Number of recorded waits."""
+        return sum(self.counts)
+
+    def record(self, wait: float) -> None:
+        """Record one wait time in seconds."""
+        self.counts[bisect.bisect_left(WAIT_BUCKETS, wait)] += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert to dictionary for serialization."""
+        labels = [f"le_{bound:g}" for bound in WAIT_BUCKETS] + ["le_inf"]
+        return {
+            "count": self.count,
+            "total_wait_seconds": round(self.total_wait, 4),
+            "max_wait_seconds": round(self.max_wait, 4),
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+_histograms: dict[str, WaitHistogram] = {}
+_histograms_lock = threading.Lock()
+
+
+def _histogram(name: str) -> WaitHistogram:
+    """Get the shared histogram for a limiter name."""
+    with _histograms_lock:
+        return _histograms.setdefault(name, WaitHistogram())
+
+
+def get_rate_limit_stats() -> dict[str, dict[str, object]]:
+    """Get wait-time histograms for every named limiter in this process.
+
+    Returns:
+        Limiter name to histogram dictionary
+    """
+    with _histograms_lock:
+        return {name: hist.to_dict() for name, hist in _histograms.items()}
+
+
+class RateLimiter:
+    """GCRA rate limiter with burst capacity."""
+
+    def __init__(
+        self,
+        requests_per_second: float,
+        burst: int | None = None,
+        name: str | None = None,
+    ) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            requests_per_second: Sustained requests per second
+            burst: Requests allowed back to back (default: one second's worth)
+            name: Histogram name for get_rate_limit_stats() (unnamed
+                limiters keep a private histogram)
+        """
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        self.rate = requests_per_second
+        self.burst = max(1, burst if burst is not None else int(requests_per_second))
+        self.interval = 1.0 / requests_per_second
+        self.tolerance = (self.burst - 1) * self.interval
+        self.histogram = _histogram(name) if name else WaitHistogram()
+        self._tat = time.monotonic()
+
+    def reserve(self, now: float | None = None) -> float:
+        """Reserve the next slot without waiting.
+
+        Args:
+            now: Current monotonic time (default: now)
+
+        Returns:
+            Seconds to wait before sending
+        """
+        now = time.monotonic() if now is None else now
+        tat = max(self._tat, now)
+        self._tat = tat + self.interval
+        return max(0.0, tat - self.tolerance - now)
+
+    async def acquire(self) -> float:
+        """Wait until a request can be made.
+
+        The reservation is made without awaiting, so concurrent callers
+        get consecutive slots and sleep in parallel.
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve()
+        self.histogram.record(wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class EndpointRateLimiter:
+    """Client-wide rate limiter plus optional per-endpoint limiters."""
+
+    def __init__(
+        self,
+        requests_per_second: float,
+        burst: int | None = None,
+        endpoints: dict[str, tuple[float, int | None]] | None = None,
+        name: str | None = None,
+    ) -> None:
+        """Initialize limiters.
+
+        Args:
+            requests_per_second: Client-wide sustained rate
+            burst: Client-wide burst size
+            endpoints: Path regex to (requests_per_second, burst); the first
+                matching pattern applies in addition to the client-wide limit
+            name: Histogram name prefix
+        """
+        self.default = RateLimiter(requests_per_second, burst, name)
+        self._endpoints = [
+            (
+                re.compile(pattern),
+                RateLimiter(rate, endpoint_burst, f"{name}:{pattern}" if name else None),
+            )
+            for pattern, (rate, endpoint_burst) in (endpoints or {}).items()
+        ]
+
+    @property
+    def rate(self) -> float:
+        """Client-wide sustained rate."""
+        return self.default.rate
+
+    def limiter_for(self, path: str) -> RateLimiter | None:
+        """Get the endpoint limiter for a path, if any."""
+        for pattern, limiter in self._endpoints:
+            if pattern.fullmatch(path):
+                return limiter
+        return None
+
+    async def acquire(self, path: str = "") -> float:
+        """Wait until a request to ``path`` is allowed by every applicable limiter.
+
+        Args:
+            path: Request path
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.default.reserve()
+        endpoint = self.limiter_for(path)
+        if endpoint is not None:
+            wait = max(wait, endpoint.reserve())
+            endpoint.histogram.record(wait)
+        self.default.histogram.record(wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
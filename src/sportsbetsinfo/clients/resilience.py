@@ -0,0 +1,259 @@
+"""Retries and circuit breaking for API clients.
+
+BaseAPIClient sends each upstream request through a RetryPolicy and the
+CircuitBreaker of its host:
+
+- transport errors and retryable statuses (429, 5xx) are retried with
+  full-jitter exponential backoff, or after ``Retry-After`` when
+  upstream sends one
+- only idempotent methods are retried
+- every failed attempt counts against the host's breaker; after
+  ``failure_threshold`` consecutive failures the breaker opens and
+  requests fail fast with CircuitOpenError until ``reset_timeout``
+  has passed, when a single probe request is let through
+
+Breakers are shared by every client instance in the process, so a
+collection cycle, the web server and outcome ingestion all see the same
+upstream state. Counters are exposed by get_resilience_stats().
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How failed requests are retried.
+
+    Attributes:
+        max_retries: Retries after the first attempt (0 disables retrying)
+        backoff_base: Backoff cap for the first retry in seconds
+        backoff_max: Largest backoff in seconds
+        max_retry_after: Longest Retry-After honoured; longer waits give up
+        retry_statuses: HTTP statuses that are retried (and count as failures)
+        breaker_threshold: Consecutive failures that open the host's breaker
+        breaker_reset_timeout: Seconds an open breaker waits before a probe
+    """
+
+    max_retries: int = 2
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    max_retry_after: float = 60.0
+    retry_statuses: frozenset[int] = RETRYABLE_STATUSES
+    breaker_threshold: int = 5
+    breaker_reset_timeout: float = 30.0
+
+    def is_failure(self, response: httpx.Response) -> bool:
+        """Whether a response counts against the host's breaker."""
+        return response.status_code >= 500 or response.status_code in self.retry_statuses
+
+    def backoff(self, retry: int, rng: random.Random | None = None) -> float:
+        """Full-jitter backoff before a retry.
+
+        Args:
+            retry: Retry number (0 for the first retry)
+            rng: Random source (default: module random)
+
+        Returns:
+            Seconds to wait, uniform in [0, min(backoff_max, base * 2**retry)]
+        """
+        cap = min(self.backoff_max, self.backoff_base * 2**retry)
+        return (rng or random).uniform(0, cap)
+
+    def is_retryable(self, method: str, response: httpx.Response | None) -> bool:
+        """Whether an attempt that failed this way may be retried.
+
+        Args:
+            method: HTTP method
+            response: Upstream response, or None for a transport error
+        """
+        if self.max_retries <= 0 or method.upper() not in IDEMPOTENT_METHODS:
+            return False
+        return response is None or response.status_code in self.retry_statuses
+
+
+def retry_after(response: httpx.Response, now: datetime | None = None) -> float | None:
+    """Parse a Retry-After header (seconds or HTTP date).
+
+    Args:
+        response: Upstream response
+        now: Current time for HTTP dates (default: now)
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (when - now).total_seconds())
+
+
+@dataclass
+class HostStats:
+    """Request outcome counters for one upstream host."""
+
+    attempts: int = 0
+    retries: int = 0
+    retry_after_waits: int = 0
+    failures: int = 0
+    giveups: int = 0
+    short_circuited: int = 0
+    breaker_opens: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert to dictionary for serialization."""
+        return {
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "retry_after_waits": self.retry_after_waits,
+            "failures": self.failures,
+            "giveups": self.giveups,
+            "short_circuited": self.short_circuited,
+            "breaker_opens": self.breaker_opens,
+        }
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one upstream host."""
+
+    def __init__(self, host: str, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        """Initialize a closed breaker.
+
+        Args:
+            host: Upstream host name
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds the breaker stays open before a probe
+        """
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.stats = HostStats()
+        self._state = BREAKER_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_started: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state (open breakers past their timeout report half_open)."""
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == BREAKER_OPEN and now - self._opened_at >= self.reset_timeout:
+            return BREAKER_HALF_OPEN
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now.
+
+        Closed breakers allow everything; an open breaker allows one probe
+        once its reset timeout has passed (and another if that probe never
+        reports back within the timeout).
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            if state == BREAKER_CLOSED:
+                return True
+            if state == BREAKER_HALF_OPEN and (
+                self._probe_started is None or now - self._probe_started >= self.reset_timeout
+            ):
+                self._state = BREAKER_HALF_OPEN
+                self._probe_started = now
+                return True
+            self.stats.short_circuited += 1
+            return False
+
+    def record_success(self) -> None:
+        """Record an attempt upstream answered (closes the breaker)."""
+        with self._lock:
+            self._state = BREAKER_CLOSED
+            self._consecutive_failures = 0
+            self._probe_started = None
+
+    def record_failure(self) -> None:
+        """Record a failed attempt (may open the breaker)."""
+        with self._lock:
+            self.stats.failures += 1
+            self._consecutive_failures += 1
+            if self._state == BREAKER_HALF_OPEN or (
+                self._state == BREAKER_CLOSED
+                and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._state = BREAKER_OPEN
+                self._opened_at = time.monotonic()
+                self.stats.breaker_opens += 1
+            self._probe_started = None
+
+    def retry_in(self) -> float:
+        """Seconds until an open breaker lets a probe through."""
+        with self._lock:
+            if self._state != BREAKER_OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert to dictionary for serialization."""
+        return {"state": self.state, **self.stats.to_dict()}
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(
+    host: str, failure_threshold: int = 5, reset_timeout: float = 30.0
+) -> CircuitBreaker:
+    """Get the process-wide breaker for an upstream host.
+
+    Args:
+        host: Upstream host name
+        failure_threshold: Consecutive failures that open a new breaker
+        reset_timeout: Seconds a new breaker stays open before a probe
+
+    Returns:
+        Shared CircuitBreaker (settings apply when it is first created)
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(host, failure_threshold, reset_timeout)
+            _breakers[host] = breaker
+        return breaker
+
+
+def get_resilience_stats() -> dict[str, dict[str, object]]:
+    """Get retry counters and breaker state for every upstream host.
+
+    Returns:
+        Host to statistics dictionary
+    """
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.host: breaker.to_dict() for breaker in breakers}
@@ -6,6 +6,7 @@ SPORTSBETS_ prefix. Supports .env files via python-dotenv.
 
 from functools import lru_cache
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -48,6 +49,25 @@ class Settings(BaseSettings):
         description="The Odds API key",
     )
 
+    # Hash verification on repository reads (the verify command always checks everything)
+    verify_on_read: Literal["always", "sampled", "never", "audit"] = Field(
+        default="always",
+        description="Read-path hash verification: always, sampled, never, or audit",
+    )
+    verify_sample_rate: float = Field(
+        default=0.1,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of rows verified when verify_on_read is 'sampled'",
+    )
+
+    # Batch analysis (analyze --all and /api/analyze)
+    analysis_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Processes used to build analyses (1 builds in-process)",
+    )
+
     # Versioning
     schema_version: str = Field(
         default="1.0.0",
@@ -63,6 +83,125 @@ class Settings(BaseSettings):
         default=1,
         description="Odds API requests per second",
     )
+    kalshi_burst: int | None = Field(
+        default=None,
+        ge=1,
+        description="Kalshi requests allowed back to back (default: one second's worth)",
+    )
+    odds_api_burst: int | None = Field(
+        default=None,
+        ge=1,
+        description="Odds API requests allowed back to back (default: one second's worth)",
+    )
+
+    # Kalshi request signing (RSA-PSS) off the event loop
+    kalshi_signer_threads: int = Field(
+        default=1,
+        ge=0,
+        description="Threads Kalshi requests are signed in (0 signs on the event loop)",
+    )
+    kalshi_signer_prewarm: bool = Field(
+        default=False,
+        description="Start every signing thread when the client is created",
+    )
+
+    # Upstream retries and circuit breaking
+    http_max_retries: int = Field(
+        default=2,
+        ge=0,
+        description="Retries for transient upstream failures (429, 5xx, transport errors)",
+    )
+    http_backoff_base: float = Field(
+        default=0.5,
+        gt=0,
+        description="Backoff cap for the first retry in seconds (doubles per retry, jittered)",
+    )
+    circuit_breaker_threshold: int = Field(
+        default=5,
+        ge=1,
+        description="Consecutive failures before requests to a host fail fast",
+    )
+    circuit_breaker_reset_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds a tripped circuit waits before probing the host again",
+    )
+
+    # Upstream base URL overrides (e.g. a local stand-in server)
+    kalshi_base_url: str | None = Field(
+        default=None,
+        description="Override the Kalshi API base URL",
+    )
+    odds_api_base_url: str | None = Field(
+        default=None,
+        description="Override The Odds API base URL",
+    )
+
+    # Odds API quota budget (spreads the monthly quota over the billing period)
+    odds_api_budget: bool = Field(
+        default=True,
+        description="Defer Odds API requests that would overspend the daily budget",
+    )
+    odds_api_budget_path: Path = Field(
+        default=Path("data/odds_api_budget.json"),
+        description="Budget state file shared by every process",
+    )
+    odds_api_quota_reset_day: int = Field(
+        default=1,
+        ge=1,
+        le=28,
+        description="Day of the month the Odds API quota resets",
+    )
+
+    # Upstream response cache (fresh responses are reused, stale ones revalidated)
+    http_cache: Literal["off", "memory", "sqlite"] = Field(
+        default="memory",
+        description="Response cache backend: off, memory (per process) or sqlite (shared)",
+    )
+    http_cache_path: Path = Field(
+        default=Path("data/http_cache.db"),
+        description="Cache database file for the sqlite backend",
+    )
+
+    # Change-only snapshotting (unchanged polls are stored as heartbeats)
+    change_only_snapshots: bool = Field(
+        default=True,
+        description="Store a heartbeat instead of a full snapshot when nothing changed",
+    )
+
+    # Snapshot storage layout (0 stores normalized_fields of every snapshot in full)
+    snapshot_keyframe_interval: int = Field(
+        default=0,
+        ge=0,
+        description="Store a full keyframe every N snapshots per game and deltas in between",
+    )
+
+    # Compression of large JSON columns on write (reads handle every codec)
+    column_codec: Literal["none", "zlib"] = Field(
+        default="none",
+        description="Codec for snapshot payloads, normalized fields and analysis features",
+    )
+    column_codec_level: int = Field(
+        default=6,
+        ge=1,
+        le=9,
+        description="zlib compression level",
+    )
+
+    # Collection daemon
+    daemon_status_path: Path = Field(
+        default=Path("data/daemon_status.json"),
+        description="Status file the collection daemon rewrites after every tick",
+    )
+    daemon_polling: Literal["cadence", "volatility"] = Field(
+        default="volatility",
+        description="Polling policy: fixed tip-off cadence or volatility-adaptive",
+    )
+    daemon_requests_per_hour: float = Field(
+        default=0,
+        ge=0,
+        description="Cap on daemon board fetches per hour across sports (0 = no cap)",
+    )
 
     # Logging
     log_level: str = Field(
@@ -27,6 +27,17 @@ class HashMismatchError(IntegrityError):
         )
 
 
+class CorruptRowError(IntegrityError):
+    """Raised when a stored row cannot be decoded into its entity."""
+
+    def __init__(self, table: str, rowid: int, entity_id: str, reason: str) -> None:
+        self.table = table
+        self.rowid = rowid
+        self.entity_id = entity_id
+        self.reason = reason
+        super().__init__(f"Cannot decode {table} row {rowid} ({entity_id}): {reason}")
+
+
 class ImmutabilityViolationError(SportsBetsInfoError):
     """Raised when attempting to modify immutable data."""
 
@@ -66,6 +77,24 @@ class APIError(SportsBetsInfoError):
                         (f" (status {status_code})" if status_code else ""))
 
 
+class QuotaBudgetError(APIError):
+    """Raised when a request is deferred to stay within the API quota budget."""
+
+    def __init__(self, client: str, priority: str, reason: str) -> None:
+        self.priority = priority
+        self.reason = reason
+        super().__init__(client, f"{priority} priority request deferred: {reason}")
+
+
+class CircuitOpenError(APIError):
+    """Raised without contacting upstream while a host's circuit breaker is open."""
+
+    def __init__(self, client: str, host: str, retry_in: float) -> None:
+        self.host = host
+        self.retry_in = retry_in
+        super().__init__(client, f"circuit open for {host}, retry in {retry_in:.1f}s")
+
+
 class ConfigurationError(SportsBetsInfoError):
     """Raised when configuration is invalid or missing."""
 
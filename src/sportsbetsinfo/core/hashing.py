@@ -41,12 +41,31 @@ def _serialize_for_hash(obj: Any) -> str:
     return json.dumps(obj, sort_keys=True, default=default, separators=(",", ":"))
 
 
-def _compute_hash(data: dict[str, Any]) -> str:
+def _compute_hash(data: Any) -> str:
     """Compute SHA-256 hash of serialized data."""
     serialized = _serialize_for_hash(data)
     return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
 
 
+def serialize_payload(payload: Any) -> str:
+    """Serialize a raw payload to its canonical JSON form.
+
+    This is the exact text that compute_payload_hash() hashes, so stored
+    payload blobs can be re-verified byte for byte.
+    """
+    return _serialize_for_hash(payload)
+
+
+def compute_payload_hash(payload: Any) -> str:
+    """Compute content address for a raw API payload.
+
+    Used as the key of the payload blob store; identical payloads
+    (e.g. the same Kalshi board shared by every game in a cycle)
+    map to the same hash.
+    """
+    return _compute_hash(payload)
+
+
 def compute_snapshot_hash(snapshot: InfoSnapshot) -> str:
     """Compute hash for InfoSnapshot.
 
@@ -65,6 +84,32 @@ def compute_snapshot_hash(snapshot: InfoSnapshot) -> str:
     return _compute_hash(data)
 
 
+# Normalized fields that change between polls without the lines changing:
+# the Odds API quota counter and Kalshi trading activity counters
+VOLATILE_NORMALIZED_FIELDS = frozenset({"odds_api_requests_remaining"})
+VOLATILE_MARKET_FIELDS = frozenset({"volume", "open_interest"})
+
+
+def compute_content_hash(normalized_fields: dict[str, Any]) -> str:
+    """Compute hash of a snapshot's normalized content.
+
+    Unlike compute_snapshot_hash this excludes collected_at and the
+    volatile fields above, so two polls that saw the same lines have
+    the same content hash.
+    """
+    content = {
+        key: value
+        for key, value in normalized_fields.items()
+        if key not in VOLATILE_NORMALIZED_FIELDS
+    }
+    if "kalshi_markets" in content:
+        content["kalshi_markets"] = [
+            {k: v for k, v in market.items() if k not in VOLATILE_MARKET_FIELDS}
+            for market in content["kalshi_markets"]
+        ]
+    return _compute_hash(content)
+
+
 def compute_analysis_hash(analysis: Analysis) -> str:
     """Compute hash for Analysis.
 
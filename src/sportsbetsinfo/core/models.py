@@ -156,6 +156,35 @@ class InfoSnapshot:
         return instance
 
 
+@dataclass(frozen=True)
+class SnapshotHeartbeat:
+    """Record that a poll saw the same content as a game's latest snapshot.
+
+    Stored instead of a full InfoSnapshot when nothing in
+    normalized_fields changed, so timelines still show every poll.
+
+    Attributes:
+        game_id: Game the poll was for
+        observed_at: When the poll was made
+        snapshot_id: The unchanged snapshot the poll saw again
+        content_hash: compute_content_hash of that snapshot's normalized fields
+    """
+
+    game_id: str
+    observed_at: datetime
+    snapshot_id: str
+    content_hash: str
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "game_id": self.game_id,
+            "observed_at": self.observed_at.isoformat(),
+            "snapshot_id": self.snapshot_id,
+            "content_hash": self.content_hash,
+        }
+
+
 @dataclass(frozen=True)
 class Analysis:
     """Derived analysis artifact forming a DAG (like git commits).
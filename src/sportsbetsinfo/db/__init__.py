@@ -1,6 +1,28 @@
 """Database layer with append-only repositories."""
 
-from sportsbetsinfo.db.connection import get_connection
+from sportsbetsinfo.db.codec import ColumnCodec, set_default_codec
+from sportsbetsinfo.db.connection import (
+    ConnectionManager,
+    close_all_connections,
+    get_connection,
+    get_connection_manager,
+)
 from sportsbetsinfo.db.schema import create_all_tables
+from sportsbetsinfo.db.verification import (
+    VerificationMode,
+    VerificationPolicy,
+    set_default_policy,
+)
 
-__all__ = ["get_connection", "create_all_tables"]
+__all__ = [
+    "ColumnCodec",
+    "set_default_codec",
+    "ConnectionManager",
+    "close_all_connections",
+    "get_connection",
+    "get_connection_manager",
+    "create_all_tables",
+    "VerificationMode",
+    "VerificationPolicy",
+    "set_default_policy",
+]
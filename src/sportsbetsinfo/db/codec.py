@@ -0,0 +1,231 @@
+"""Transparent compression of large JSON columns.
+
+Snapshot payloads and normalized fields repeat long runs of market
+JSON, which compresses several-fold. With a codec enabled, repositories
+store these columns as a BLOB that starts with a codec tag::
+
+    b"zlib:" + zlib.compress(json_text)
+
+Rows that are small, or that do not shrink, stay plain TEXT, as do all
+rows written without a codec, so the tag is per row and both forms are
+read transparently. SQL that inspects these columns must wrap them in
+the ``decode_column()`` SQL function, which every connection from
+db.connection registers.
+
+Compressed columns:
+
+- info_snapshots.raw_payloads and info_snapshots.normalized_fields
+- payload_blobs.content (the raw payloads themselves)
+- analyses.derived_features
+
+Existing rows are immutable; recompress_database() copies a database
+into a new file with every compressed column re-encoded.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Literal, overload
+
+from sportsbetsinfo.core.exceptions import IntegrityError
+
+CodecName = Literal["none", "zlib"]
+
+ZLIB_TAG = b"zlib:"
+
+# Values shorter than this stay plain text (the tag and zlib header outweigh the gain)
+MIN_COMPRESS_BYTES = 256
+
+# Columns handled by the codec, per table
+COMPRESSED_COLUMNS: dict[str, tuple[str, ...]] = {
+    "info_snapshots": ("raw_payloads", "normalized_fields"),
+    "payload_blobs": ("content",),
+    "analyses": ("derived_features",),
+}
+
+
+@dataclass(frozen=True)
+class ColumnCodec:
+    """How JSON columns are encoded on write.
+
+    Attributes:
+        name: "none" stores plain text; "zlib" compresses large values
+        level: zlib compression level (1-9)
+    """
+
+    name: CodecName = "none"
+    level: int = 6
+
+    def encode(self, text: str) -> str | bytes:
+        """Encode a JSON column value for storage.
+
+        Args:
+            text: JSON text
+
+        Returns:
+            The text itself, or tagged compressed bytes if smaller
+        """
+        if self.name == "none" or len(text) < MIN_COMPRESS_BYTES:
+            return text
+        data = text.encode("utf-8")
+        packed = ZLIB_TAG + zlib.compress(data, self.level)
+        return packed if len(packed) < len(data) else text
+
+
+@overload
+def decode_column(value: str | bytes) -> str: ...
+
+
+@overload
+def decode_column(value: None) -> None: ...
+
+
+def decode_column(value: str | bytes | None) -> str | None:
+    """Decode a stored JSON column value back to text.
+
+    Also registered as the ``decode_column()`` SQL function.
+
+    Args:
+        value: Column value (TEXT, tagged BLOB or NULL)
+
+    Returns:
+        JSON text (None for NULL)
+
+    Raises:
+        IntegrityError: If the value has an unknown codec tag or is corrupt
+    """
+    if not isinstance(value, bytes):
+        return value
+    if value.startswith(ZLIB_TAG):
+        try:
+            return zlib.decompress(value[len(ZLIB_TAG) :]).decode("utf-8")
+        except zlib.error as e:
+            raise IntegrityError(f"Corrupt zlib column value: {e}") from e
+    raise IntegrityError(f"Unknown column codec tag: {value[:8]!r}")
+
+
+def register_functions(conn: sqlite3.Connection) -> None:
+    """Register the decode_column() SQL function on a connection.
+
+    Args:
+        conn: SQLite connection
+    """
+    conn.create_function("decode_column", 1, decode_column, deterministic=True)
+
+
+_default_codec: ColumnCodec | None = None
+
+
+def get_default_codec() -> ColumnCodec:
+    """Get the process-wide default codec.
+
+    Built from SPORTSBETS_COLUMN_CODEC / SPORTSBETS_COLUMN_CODEC_LEVEL
+    on first use unless set_default_codec() was called.
+
+    Returns:
+        Default ColumnCodec
+    """
+    global _default_codec
+    if _default_codec is None:
+        from sportsbetsinfo.config.settings import get_settings
+
+        settings = get_settings()
+        _default_codec = ColumnCodec(name=settings.column_codec, level=settings.column_codec_level)
+    return _default_codec
+
+
+def set_default_codec(codec: ColumnCodec | None) -> None:
+    """Override the process-wide default codec.
+
+    Args:
+        codec: New default, or None to reload from settings on next use
+    """
+    global _default_codec
+    _default_codec = codec
+
+
+def recompress_database(
+    source: sqlite3.Connection,
+    dest: sqlite3.Connection,
+    codec: ColumnCodec,
+    batch_size: int = 500,
+    on_progress: Callable[[str, int], None] | None = None,
+) -> dict[str, int]:
+    """Copy every table into an initialized database, re-encoding JSON columns.
+
+    Rows keep their rowids (verification checkpoints refer to them) and
+    every other column is copied unchanged, so hashes still verify.
+    Recompressing with ``ColumnCodec("none")`` decompresses.
+
+    Args:
+        source: Connection to the database to copy
+        dest: Connection to a new database with the schema already created
+        codec: Codec for the compressed columns
+        batch_size: Rows per insert batch
+        on_progress: Called with (table, rows copied so far)
+
+    Returns:
+        Rows copied per table
+    """
+    tables = [
+        row[0]
+        for row in source.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' "
+            "ORDER BY rowid"
+        )
+    ]
+    copied: dict[str, int] = {}
+    # Children may precede parents in rowid order (e.g. analyses.parent_analysis_id)
+    dest.execute("PRAGMA defer_foreign_keys = ON")
+    for table in tables:
+        info = source.execute(f"PRAGMA table_info({table})").fetchall()
+        columns = [row[1] for row in info]
+        pk = [row for row in info if row[5]]
+        # An INTEGER PRIMARY KEY is the rowid itself
+        if not (len(pk) == 1 and pk[0][2].upper() == "INTEGER"):
+            columns = ["rowid", *columns]
+        encoded = {columns.index(c) for c in COMPRESSED_COLUMNS.get(table, ())}
+
+        names = ", ".join(columns)
+        placeholders = ", ".join("?" for _ in columns)
+        cursor = source.execute(f"SELECT {names} FROM {table} ORDER BY rowid")  # noqa: S608
+        copied[table] = 0
+        while rows := cursor.fetchmany(batch_size):
+            dest.executemany(
+                f"INSERT INTO {table} ({names}) VALUES ({placeholders})",  # noqa: S608
+                [
+                    [
+                        codec.encode(decode_column(value)) if i in encoded else value
+                        for i, value in enumerate(row)
+                    ]
+                    for row in rows
+                ],
+            )
+            copied[table] += len(rows)
+            if on_progress is not None:
+                on_progress(table, copied[table])
+    dest.commit()
+    return copied
+
+
+def table_sizes(conn: sqlite3.Connection) -> dict[str, int]:
+    """Get bytes on disk per table, including its indexes.
+
+    Args:
+        conn: SQLite connection
+
+    Returns:
+        Dictionary mapping table name to bytes
+    """
+    cursor = conn.execute(
+        """
+        SELECT m.tbl_name, SUM(d.pgsize)
+        FROM dbstat d
+        JOIN sqlite_master m ON m.name = d.name
+        GROUP BY m.tbl_name
+        """
+    )
+    return {row[0]: row[1] for row in cursor.fetchall()}
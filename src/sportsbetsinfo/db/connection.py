@@ -1,29 +1,43 @@
-"""SQLite database connection management."""
+"""SQLite database connection management.
+
+Long-running processes (the web server, collection loops) should use a
+ConnectionManager from get_connection_manager(): it keeps one read
+connection per thread and a single serialized writer per database file,
+applies PRAGMAs once per connection, and closes everything on shutdown.
+
+get_connection() remains for one-off scripts and schema setup.
+"""
 
 from __future__ import annotations
 
+import atexit
 import sqlite3
+import threading
+import time
+from collections.abc import Generator
 from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Generator
 
+from sportsbetsinfo.db.codec import register_functions
+
+# Per-connection tuning applied once when a connection is opened
+MMAP_SIZE_BYTES = 256 * 1024 * 1024
+CACHE_SIZE_KIB = 64 * 1024
+BUSY_TIMEOUT_MS = 5000
 
-def get_connection(db_path: Path | str) -> sqlite3.Connection:
-    """Create a new database connection.
+
+def _configure(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Apply connection settings and PRAGMAs.
 
     Args:
-        db_path: Path to the SQLite database file
+        conn: Freshly opened SQLite connection
 
     Returns:
-        SQLite connection with optimized settings
+        The same connection
     """
-    db_path = Path(db_path)
-
-    # Ensure parent directory exists
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-
-    conn = sqlite3.connect(str(db_path))
     conn.row_factory = sqlite3.Row
+    register_functions(conn)
 
     # Enable foreign keys
     conn.execute("PRAGMA foreign_keys = ON")
@@ -32,9 +46,35 @@ def get_connection(db_path: Path | str) -> sqlite3.Connection:
     conn.execute("PRAGMA journal_mode = WAL")
     conn.execute("PRAGMA synchronous = NORMAL")
 
+    # Read performance: memory-mapped I/O, larger page cache, in-memory temp tables
+    conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE_BYTES}")
+    conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KIB}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+
     return conn
 
 
+def get_connection(db_path: Path | str) -> sqlite3.Connection:
+    """Create a new database connection.
+
+    The caller owns the connection and must close it. Prefer
+    get_connection_manager() in services and request handlers.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        SQLite connection with optimized settings
+    """
+    db_path = Path(db_path)
+
+    # Ensure parent directory exists
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    return _configure(sqlite3.connect(str(db_path)))
+
+
 @contextmanager
 def get_connection_context(
     db_path: Path | str,
@@ -58,3 +98,194 @@ def get_connection_context(
         raise
     finally:
         conn.close()
+
+
+@dataclass(frozen=True)
+class ConnectionStats:
+    """Health statistics for a ConnectionManager."""
+
+    db_path: str
+    open: bool
+    reader_connections: int
+    reads: int
+    writes: int
+    write_wait_total_ms: float
+    write_wait_max_ms: float
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert to dictionary for serialization."""
+        return {
+            "db_path": self.db_path,
+            "open": self.open,
+            "reader_connections": self.reader_connections,
+            "reads": self.reads,
+            "writes": self.writes,
+            "write_wait_total_ms": round(self.write_wait_total_ms, 3),
+            "write_wait_max_ms": round(self.write_wait_max_ms, 3),
+        }
+
+
+class ConnectionManager:
+    """Pooled, long-lived connections for one SQLite database.
+
+    - Readers: one connection per thread, opened on first use and reused.
+      WAL mode lets readers run concurrently with the writer.
+    - Writer: a single connection shared by all threads. write() holds a
+      re-entrant lock for the duration of the block. The outermost block
+      owns the transaction: it begins one on entry and commits it (or
+      rolls back on exception) on exit, so every repository call in the
+      block, including nested blocks, is applied atomically.
+      Repositories write inside savepoints and never commit a
+      transaction they did not start (see repositories.base.atomic).
+      Schema setup (db.schema) commits on its own.
+    """
+
+    def __init__(self, db_path: Path | str) -> None:
+        """Initialize manager. Connections are opened lazily.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._local = threading.local()
+        self._readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+
+        self._writer: sqlite3.Connection | None = None
+        self._write_lock = threading.RLock()
+        self._write_depth = 0
+
+        self._closed = False
+        self._reads = 0
+        self._writes = 0
+        self._write_wait_total = 0.0
+        self._write_wait_max = 0.0
+
+    @property
+    def closed(self) -> bool:
+        """Whether close() has been called."""
+        return self._closed
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a configured connection usable from any thread."""
+        if self._closed:
+            raise RuntimeError(f"ConnectionManager for {self.db_path} is closed")
+        return _configure(sqlite3.connect(str(self.db_path), check_same_thread=False))
+
+    @contextmanager
+    def read(self) -> Generator[sqlite3.Connection, None, None]:
+        """Borrow this thread's read connection.
+
+        Yields:
+            SQLite connection (do not close it)
+        """
+        conn: sqlite3.Connection | None = getattr(self._local, "reader", None)
+        if conn is None:
+            conn = self._open()
+            with self._readers_lock:
+                self._readers.append(conn)
+            self._local.reader = conn
+        self._reads += 1
+        yield conn
+
+    @contextmanager
+    def write(self) -> Generator[sqlite3.Connection, None, None]:
+        """Borrow the writer connection exclusively.
+
+        The outermost block begins a transaction, commits it when the
+        block exits successfully and rolls it back if it raises. Nested
+        blocks join it.
+
+        Yields:
+            SQLite connection (do not close it)
+        """
+        started = time.perf_counter()
+        with self._write_lock:
+            waited = time.perf_counter() - started
+            self._write_wait_total += waited
+            self._write_wait_max = max(self._write_wait_max, waited)
+
+            if self._writer is None:
+                self._writer = self._open()
+            conn = self._writer
+
+            self._write_depth += 1
+            self._writes += 1
+            try:
+                if self._write_depth == 1 and not conn.in_transaction:
+                    conn.execute("BEGIN")
+                yield conn
+                if self._write_depth == 1:
+                    conn.commit()
+            except BaseException:
+                if self._write_depth == 1:
+                    conn.rollback()
+                raise
+            finally:
+                self._write_depth -= 1
+
+    def stats(self) -> ConnectionStats:
+        """Get health statistics.
+
+        Returns:
+            Current ConnectionStats
+        """
+        with self._readers_lock:
+            reader_count = len(self._readers)
+        return ConnectionStats(
+            db_path=str(self.db_path),
+            open=not self._closed,
+            reader_connections=reader_count,
+            reads=self._reads,
+            writes=self._writes,
+            write_wait_total_ms=self._write_wait_total * 1000,
+            write_wait_max_ms=self._write_wait_max * 1000,
+        )
+
+    def close(self) -> None:
+        """Close every connection owned by this manager."""
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            with self._readers_lock:
+                for conn in self._readers:
+                    conn.close()
+                self._readers.clear()
+            self._local = threading.local()
+            self._closed = True
+
+
+_managers: dict[Path, ConnectionManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_connection_manager(db_path: Path | str) -> ConnectionManager:
+    """Get the process-wide ConnectionManager for a database file.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        Shared ConnectionManager (created on first use)
+    """
+    key = Path(db_path).resolve()
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None or manager.closed:
+            manager = ConnectionManager(db_path)
+            _managers[key] = manager
+        return manager
+
+
+def close_all_connections() -> None:
+    """Close all managed connections (called on shutdown and at exit)."""
+    with _managers_lock:
+        for manager in _managers.values():
+            manager.close()
+        _managers.clear()
+
+
+atexit.register(close_all_connections)
@@ -1,16 +1,35 @@
 """Append-only repositories for immutable entities."""
 
-from sportsbetsinfo.db.repositories.base import ImmutableRepository
-from sportsbetsinfo.db.repositories.snapshot import SnapshotRepository
 from sportsbetsinfo.db.repositories.analysis import AnalysisRepository
-from sportsbetsinfo.db.repositories.outcome import OutcomeRepository
+from sportsbetsinfo.db.repositories.base import (
+    BulkInsertResult,
+    ImmutableRepository,
+    InsertConflict,
+)
+from sportsbetsinfo.db.repositories.delta import DeltaStore
 from sportsbetsinfo.db.repositories.evaluation import EvaluationRepository
+from sportsbetsinfo.db.repositories.market_match import MarketMatch, MarketMatchRepository
+from sportsbetsinfo.db.repositories.outcome import OutcomeRepository
+from sportsbetsinfo.db.repositories.payload import PayloadStore
 from sportsbetsinfo.db.repositories.proposal import ProposalRepository
+from sportsbetsinfo.db.repositories.snapshot import (
+    GameSummary,
+    SnapshotRepository,
+    SnapshotView,
+)
 
 __all__ = [
     "ImmutableRepository",
+    "BulkInsertResult",
+    "InsertConflict",
+    "PayloadStore",
+    "DeltaStore",
     "SnapshotRepository",
+    "SnapshotView",
+    "GameSummary",
     "AnalysisRepository",
+    "MarketMatch",
+    "MarketMatchRepository",
     "OutcomeRepository",
     "EvaluationRepository",
     "ProposalRepository",
@@ -4,11 +4,73 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
 from sportsbetsinfo.core.exceptions import DuplicateEntityError
 from sportsbetsinfo.core.models import Analysis
-from sportsbetsinfo.db.repositories.base import ImmutableRepository
+from sportsbetsinfo.db.codec import ColumnCodec, decode_column, get_default_codec
+from sportsbetsinfo.db.repositories.base import ImmutableRepository, atomic
+from sportsbetsinfo.db.verification import VerificationPolicy
+
+# Comparison keys copied into analysis_comparisons columns of the same name
+COMPARISON_FIELDS = (
+    "event_id",
+    "home_team",
+    "away_team",
+    "commence_time",
+    "game_status",
+    "vegas_home_odds",
+    "vegas_away_odds",
+    "vegas_home_prob",
+    "vegas_away_prob",
+    "kalshi_market_id",
+    "kalshi_implied_prob",
+    "delta_home",
+    "delta_home_percent",
+    "edge_magnitude",
+    "edge_direction",
+    "matched",
+)
+
+_COMPARISON_COLUMNS = ", ".join(("analysis_id", "position", "analyzed_at", *COMPARISON_FIELDS))
+
+
+@dataclass(frozen=True)
+class ComparisonRecord:
+    """One row of analysis_comparisons.
+
+    Attributes:
+        analysis_id: Analysis the comparison belongs to
+        position: Index in the analysis' comparisons list
+        analyzed_at: Analysis creation time
+        fields: Comparison values keyed like the derived_features dict
+            (see COMPARISON_FIELDS)
+    """
+
+    analysis_id: str
+    position: int
+    analyzed_at: datetime
+    fields: dict[str, Any]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a comparison value, like dict.get on the original comparison."""
+        value = self.fields.get(key)
+        return default if value is None else value
+
+
+def _comparison_rows(analysis: Analysis) -> list[tuple[Any, ...]]:
+    """Build analysis_comparisons rows for an analysis."""
+    rows = []
+    comparisons = analysis.derived_features.get("comparisons", [])
+    for position, comp in enumerate(comparisons):
+        values = [comp.get(name) for name in COMPARISON_FIELDS]
+        values[-1] = bool(comp.get("matched", False))
+        rows.append(
+            (analysis.analysis_id, position, analysis.created_at.isoformat(), *values)
+        )
+    return rows
 
 
 class AnalysisRepository(ImmutableRepository[Analysis]):
@@ -17,6 +79,26 @@ class AnalysisRepository(ImmutableRepository[Analysis]):
     Supports DAG operations like lineage traversal and child lookup.
     """
 
+    table_name = "analyses"
+    id_column = "analysis_id"
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        verification: VerificationPolicy | None = None,
+        codec: ColumnCodec | None = None,
+    ) -> None:
+        """Initialize repository with database connection.
+
+        Args:
+            connection: SQLite connection
+            verification: Hash verification policy for reads
+            codec: Column codec for derived_features on write (defaults to
+                the process-wide codec from settings)
+        """
+        super().__init__(connection, verification)
+        self._codec = codec or get_default_codec()
+
     def insert(self, analysis: Analysis) -> Analysis:
         """Insert a new analysis with its snapshot relationships.
 
@@ -29,17 +111,30 @@ class AnalysisRepository(ImmutableRepository[Analysis]):
         Raises:
             DuplicateEntityError: If hash already exists
         """
-        cursor = self._conn.cursor()
         try:
-            # Insert main analysis record
-            cursor.execute(
-                """
-                INSERT INTO analyses (
-                    analysis_id, created_at, analysis_version, code_version,
-                    model_version, parent_analysis_id, derived_features,
-                    conclusions, recommended_actions, hash
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+            with atomic(self._conn) as cursor:
+                self._write_rows(cursor, [analysis])
+            return analysis
+        except sqlite3.IntegrityError as e:
+            raise DuplicateEntityError("Analysis", analysis.hash) from e
+
+    def _write_rows(self, cursor: sqlite3.Cursor, analyses: list[Analysis]) -> None:
+        """Write analysis rows and their snapshot relationships.
+
+        Args:
+            cursor: Cursor on the repository connection
+            analyses: Analyses to write
+        """
+        # Insert main analysis records
+        cursor.executemany(
+            """
+            INSERT INTO analyses (
+                analysis_id, created_at, analysis_version, code_version,
+                model_version, parent_analysis_id, derived_features,
+                conclusions, recommended_actions, hash
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
                 (
                     analysis.analysis_id,
                     analysis.created_at.isoformat(),
@@ -47,28 +142,152 @@ class AnalysisRepository(ImmutableRepository[Analysis]):
                     analysis.code_version,
                     analysis.model_version,
                     analysis.parent_analysis_id,
-                    json.dumps(analysis.derived_features),
+                    self._codec.encode(json.dumps(analysis.derived_features)),
                     json.dumps(analysis.conclusions),
                     json.dumps(analysis.recommended_actions),
                     analysis.hash,
-                ),
+                )
+                for analysis in analyses
+            ],
+        )
+
+        # Insert snapshot relationships
+        cursor.executemany(
+            """
+            INSERT INTO analysis_snapshots (analysis_id, snapshot_id)
+            VALUES (?, ?)
+            """,
+            [
+                (analysis.analysis_id, snapshot_id)
+                for analysis in analyses
+                for snapshot_id in analysis.input_snapshot_ids
+            ],
+        )
+
+        # Insert one row per comparison for indexed edge queries
+        placeholders = ", ".join("?" for _ in range(len(COMPARISON_FIELDS) + 3))
+        cursor.executemany(
+            f"INSERT INTO analysis_comparisons ({_COMPARISON_COLUMNS}) VALUES ({placeholders})",  # noqa: S608
+            [row for analysis in analyses for row in _comparison_rows(analysis)],
+        )
+
+    def get_latest_ref(self) -> tuple[str, datetime] | None:
+        """Get the ID and creation time of the most recent analysis.
+
+        Returns:
+            (analysis_id, created_at) or None if there are no analyses
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(
+            "SELECT analysis_id, created_at FROM analyses ORDER BY created_at DESC LIMIT 1"
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return row["analysis_id"], datetime.fromisoformat(row["created_at"])
+
+    def get_comparisons(self, analysis_id: str) -> list[ComparisonRecord]:
+        """Get an analysis' comparisons without decoding derived_features.
+
+        Args:
+            analysis_id: Analysis UUID
+
+        Returns:
+            Comparisons in their original order
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(
+            f"""
+            SELECT {_COMPARISON_COLUMNS} FROM analysis_comparisons
+            WHERE analysis_id = ?
+            ORDER BY position
+            """,  # noqa: S608
+            (analysis_id,),
+        )
+        return [self._row_to_comparison(row) for row in cursor.fetchall()]
+
+    def get_top_edges(
+        self,
+        min_edge: float = 0.03,
+        commence_from: str | None = None,
+        commence_to: str | None = None,
+        limit: int = 20,
+    ) -> list[ComparisonRecord]:
+        """Get the largest matched edges, one per event from its latest analysis.
+
+        Args:
+            min_edge: Minimum absolute Kalshi-Vegas delta (0.03 = 3%)
+            commence_from: Only games starting at or after this ISO time
+            commence_to: Only games starting before this ISO time
+            limit: Maximum number of edges
+
+        Returns:
+            Comparisons ordered by edge magnitude, largest first
+        """
+        conditions = ["matched = 1", "edge_magnitude >= ?"]
+        params: list[Any] = [min_edge]
+        if commence_from is not None:
+            conditions.append("commence_time >= ?")
+            params.append(commence_from)
+        if commence_to is not None:
+            conditions.append("commence_time < ?")
+            params.append(commence_to)
+
+        cursor = self._conn.cursor()
+        cursor.execute(
+            f"""
+            SELECT {_COMPARISON_COLUMNS} FROM (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY event_id ORDER BY analyzed_at DESC, analysis_id DESC
+                ) AS recency
+                FROM analysis_comparisons
+                WHERE {" AND ".join(conditions)}
             )
+            WHERE recency = 1
+            ORDER BY edge_magnitude DESC
+            LIMIT ?
+            """,  # noqa: S608
+            (*params, limit),
+        )
+        return [self._row_to_comparison(row) for row in cursor.fetchall()]
 
-            # Insert snapshot relationships
-            for snapshot_id in analysis.input_snapshot_ids:
-                cursor.execute(
-                    """
-                    INSERT INTO analysis_snapshots (analysis_id, snapshot_id)
-                    VALUES (?, ?)
-                    """,
-                    (analysis.analysis_id, snapshot_id),
-                )
+    def backfill_comparisons(self) -> int:
+        """Populate analysis_comparisons for analyses written before it existed.
 
-            self._conn.commit()
-            return analysis
-        except sqlite3.IntegrityError as e:
-            self._conn.rollback()
-            raise DuplicateEntityError("Analysis", analysis.hash) from e
+        Returns:
+            Number of comparison rows inserted
+        """
+        extracts = ", ".join(
+            f"COALESCE(json_extract(c.value, '$.{name}'), 0)"
+            if name == "matched"
+            else f"json_extract(c.value, '$.{name}')"
+            for name in COMPARISON_FIELDS
+        )
+        with atomic(self._conn) as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO analysis_comparisons ({_COMPARISON_COLUMNS})
+                SELECT a.analysis_id, CAST(c.key AS INTEGER), a.created_at, {extracts}
+                FROM analyses a
+                JOIN json_each(decode_column(a.derived_features), '$.comparisons') c
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM analysis_comparisons x WHERE x.analysis_id = a.analysis_id
+                )
+                """  # noqa: S608
+            )
+            inserted = cursor.rowcount
+        return inserted
+
+    def _row_to_comparison(self, row: sqlite3.Row) -> ComparisonRecord:
+        """Convert an analysis_comparisons row to a ComparisonRecord."""
+        fields = {name: row[name] for name in COMPARISON_FIELDS}
+        fields["matched"] = bool(fields["matched"])
+        return ComparisonRecord(
+            analysis_id=row["analysis_id"],
+            position=row["position"],
+            analyzed_at=datetime.fromisoformat(row["analyzed_at"]),
+            fields=fields,
+        )
 
     def get_by_id(self, analysis_id: str) -> Analysis | None:
         """Get analysis by ID including snapshot relationships.
@@ -228,6 +447,23 @@ class AnalysisRepository(ImmutableRepository[Analysis]):
             results.append(self._row_to_entity(row, snapshot_ids))
         return results
 
+    def _rows_to_entities(self, rows: list[sqlite3.Row]) -> list[Analysis]:
+        """Convert database rows to entities, loading snapshot links in one query."""
+        if not rows:
+            return []
+        placeholders = ",".join("?" for _ in rows)
+        cursor = self._conn.execute(
+            f"""
+            SELECT analysis_id, snapshot_id FROM analysis_snapshots
+            WHERE analysis_id IN ({placeholders})
+            """,  # noqa: S608
+            [row["analysis_id"] for row in rows],
+        )
+        links: dict[str, list[str]] = {}
+        for link in cursor.fetchall():
+            links.setdefault(link["analysis_id"], []).append(link["snapshot_id"])
+        return [self._row_to_entity(row, links.get(row["analysis_id"], [])) for row in rows]
+
     def _row_to_entity(
         self, row: sqlite3.Row, snapshot_ids: list[str]
     ) -> Analysis:
@@ -248,7 +484,7 @@ class AnalysisRepository(ImmutableRepository[Analysis]):
             model_version=row["model_version"],
             parent_analysis_id=row["parent_analysis_id"],
             input_snapshot_ids=tuple(snapshot_ids),
-            derived_features=json.loads(row["derived_features"]),
+            derived_features=json.loads(decode_column(row["derived_features"])),
             conclusions=json.loads(row["conclusions"]),
             recommended_actions=json.loads(row["recommended_actions"]),
             hash=row["hash"],
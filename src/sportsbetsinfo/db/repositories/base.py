@@ -8,29 +8,121 @@ from __future__ import annotations
 
 import sqlite3
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Generic, Protocol, TypeVar
 
-from sportsbetsinfo.core.exceptions import HashMismatchError
-from sportsbetsinfo.core.hashing import verify_hash
+from sportsbetsinfo.db.verification import VerificationPolicy, get_default_policy
 
-T = TypeVar("T")
+
+class HashedEntity(Protocol):
+    """Any entity carrying a content hash."""
+
+    @property
+    def hash(self) -> str:
+        """SHA-256 content hash."""
+        ...
+
+
+T = TypeVar("T", bound=HashedEntity)
+
+# SQLite host parameter limit is 999 on older builds
+_MAX_SQL_PARAMS = 900
+
+
+@contextmanager
+def atomic(connection: sqlite3.Connection, name: str = "repository_write") -> Iterator[sqlite3.Cursor]:
+    """Run a repository's writes as one unit inside a SAVEPOINT.
+
+    Repositories never commit or roll back a transaction they did not
+    start. If the connection is already in a transaction (for example
+    inside ConnectionManager.write()), releasing the savepoint folds the
+    writes into it and its owner commits. Otherwise releasing the
+    savepoint commits. If the block raises, only its own writes are
+    rolled back and the exception propagates.
+
+    Args:
+        connection: SQLite connection
+        name: Savepoint name (nested blocks should use distinct names)
+
+    Yields:
+        Cursor on the connection
+    """
+    cursor = connection.cursor()
+    cursor.execute(f"SAVEPOINT {name}")
+    try:
+        yield cursor
+    except BaseException:
+        cursor.execute(f"ROLLBACK TO {name}")
+        cursor.execute(f"RELEASE {name}")
+        raise
+    cursor.execute(f"RELEASE {name}")
+
+
+@dataclass(frozen=True)
+class InsertConflict(Generic[T]):
+    """A row that insert_many() did not insert.
+
+    Attributes:
+        index: Position of the entity in the input sequence
+        entity: The entity that was not inserted
+        reason: "duplicate_hash" if the content already exists (in the
+            database or earlier in the batch), otherwise the SQLite
+            integrity error message
+    """
+
+    index: int
+    entity: T
+    reason: str
+
+
+@dataclass
+class BulkInsertResult(Generic[T]):
+    """Outcome of an insert_many() call."""
+
+    inserted: list[T] = field(default_factory=list)
+    conflicts: list[InsertConflict[T]] = field(default_factory=list)
+
+    @property
+    def duplicates(self) -> list[InsertConflict[T]]:
+        """Conflicts caused by content that already exists."""
+        return [c for c in self.conflicts if c.reason == "duplicate_hash"]
 
 
 class ImmutableRepository(ABC, Generic[T]):
     """Abstract base repository enforcing append-only operations.
 
-    Subclasses must implement insert, get_by_id, and get_all.
+    Subclasses must implement insert, get_by_id, and get_all, and set
+    ``table_name`` and ``_write_rows`` to get batched insert_many().
     No update or delete methods are provided.
     """
 
-    def __init__(self, connection: sqlite3.Connection) -> None:
+    #: Table holding the entity rows (must have a UNIQUE ``hash`` column)
+    table_name: str = ""
+    #: Primary key column of table_name
+    id_column: str = ""
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        verification: VerificationPolicy | None = None,
+    ) -> None:
         """Initialize repository with database connection.
 
         Args:
             connection: SQLite connection
+            verification: Hash verification policy for reads
+                (defaults to the process-wide policy from settings)
         """
         self._conn = connection
         self._conn.row_factory = sqlite3.Row
+        self._verification = verification or get_default_policy()
+
+    @property
+    def verification(self) -> VerificationPolicy:
+        """Hash verification policy applied to reads."""
+        return self._verification
 
     @abstractmethod
     def insert(self, entity: T) -> T:
@@ -46,6 +138,102 @@ class ImmutableRepository(ABC, Generic[T]):
         """
         pass
 
+    def insert_many(self, entities: Sequence[T]) -> BulkInsertResult[T]:
+        """Insert a batch of entities atomically.
+
+        Entities whose hash already exists (in the database or earlier in
+        the batch) are skipped and reported as "duplicate_hash" conflicts,
+        matching the idempotent behavior of content-addressed inserts.
+        The remaining rows are written with executemany. If that fails on
+        a constraint, the batch is retried row by row so each failing
+        row is reported individually.
+
+        Args:
+            entities: Entities to insert
+
+        Returns:
+            BulkInsertResult with inserted entities and per-row conflicts
+        """
+        result: BulkInsertResult[T] = BulkInsertResult()
+        if not entities:
+            return result
+
+        existing = self._existing_hashes([e.hash for e in entities])
+        pending: list[tuple[int, T]] = []
+        seen: set[str] = set()
+        for index, entity in enumerate(entities):
+            hash_value = entity.hash
+            if hash_value in existing or hash_value in seen:
+                result.conflicts.append(InsertConflict(index, entity, "duplicate_hash"))
+                continue
+            seen.add(hash_value)
+            pending.append((index, entity))
+
+        if not pending:
+            return result
+
+        try:
+            with atomic(self._conn, "insert_batch") as cursor:
+                self._write_rows(cursor, [entity for _, entity in pending])
+            result.inserted.extend(entity for _, entity in pending)
+        except sqlite3.IntegrityError:
+            self._insert_rows_individually(pending, result)
+
+        result.conflicts.sort(key=lambda c: c.index)
+        return result
+
+    def _insert_rows_individually(
+        self,
+        pending: list[tuple[int, T]],
+        result: BulkInsertResult[T],
+    ) -> None:
+        """Insert rows one at a time in one transaction, isolating failures.
+
+        Each row runs inside its own SAVEPOINT so a constraint failure
+        only discards that row.
+        """
+        with atomic(self._conn, "insert_rows"):
+            for index, entity in pending:
+                try:
+                    with atomic(self._conn, "insert_row") as cursor:
+                        self._write_rows(cursor, [entity])
+                except sqlite3.IntegrityError as e:
+                    result.conflicts.append(InsertConflict(index, entity, str(e)))
+                else:
+                    result.inserted.append(entity)
+
+    def _write_rows(self, cursor: sqlite3.Cursor, entities: list[T]) -> None:
+        """Write entity rows (and any relationship rows) without committing.
+
+        Args:
+            cursor: Cursor on the repository connection
+            entities: Entities to write
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support batched inserts"
+        )
+
+    def _existing_hashes(self, hashes: list[str]) -> set[str]:
+        """Get the subset of hashes already stored in table_name.
+
+        Args:
+            hashes: Content hashes to check
+
+        Returns:
+            Hashes that already exist
+        """
+        existing: set[str] = set()
+        unique = list(dict.fromkeys(hashes))
+        for start in range(0, len(unique), _MAX_SQL_PARAMS):
+            chunk = unique[start : start + _MAX_SQL_PARAMS]
+            placeholders = ",".join("?" for _ in chunk)
+            cursor = self._conn.execute(
+                f"SELECT hash FROM {self.table_name} WHERE hash IN ({placeholders})",  # noqa: S608
+                chunk,
+            )
+            existing.update(row[0] for row in cursor.fetchall())
+        return existing
+
     @abstractmethod
     def get_by_id(self, entity_id: str) -> T | None:
         """Retrieve entity by primary key.
@@ -71,32 +259,57 @@ class ImmutableRepository(ABC, Generic[T]):
         """
         pass
 
+    def get_after_rowid(self, after_rowid: int, limit: int = 500) -> list[tuple[int, T]]:
+        """Get entities in storage order using keyset pagination.
+
+        Args:
+            after_rowid: Return rows with rowid strictly greater than this
+            limit: Maximum number of rows
+
+        Returns:
+            List of (rowid, entity) tuples ordered by rowid
+        """
+        cursor = self._conn.execute(
+            f"""
+            SELECT rowid AS row_position, * FROM {self.table_name}
+            WHERE rowid > ?
+            ORDER BY rowid
+            LIMIT ?
+            """,  # noqa: S608
+            (after_rowid, limit),
+        )
+        rows = cursor.fetchall()
+        return list(
+            zip([row["row_position"] for row in rows], self._rows_to_entities(rows), strict=True)
+        )
+
+    def _rows_to_entities(self, rows: list[sqlite3.Row]) -> list[T]:
+        """Convert database rows to entities, applying the verification policy.
+
+        Args:
+            rows: SQLite rows from table_name
+
+        Returns:
+            Entities in the same order as rows
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support row streaming"
+        )
+
     def _verify_hash_on_read(self, entity: T) -> T:
         """Verify hash integrity when reading from database.
 
+        Whether the hash is actually recomputed depends on the
+        repository's VerificationPolicy.
+
         Args:
             entity: Entity to verify
 
         Returns:
-            The entity if hash is valid
+            The entity if hash is valid (or not checked)
 
         Raises:
             HashMismatchError: If computed hash doesn't match stored hash
         """
-        if not verify_hash(entity):
-            entity_type = type(entity).__name__
-            entity_id = getattr(entity, f"{entity_type.lower()}_id", "unknown")
-            expected = getattr(entity, "hash", "")
-            from sportsbetsinfo.core import hashing
-
-            # Re-compute hash to get actual value
-            hash_funcs = {
-                "InfoSnapshot": hashing.compute_snapshot_hash,
-                "Analysis": hashing.compute_analysis_hash,
-                "Outcome": hashing.compute_outcome_hash,
-                "Evaluation": hashing.compute_evaluation_hash,
-                "ImprovementProposal": hashing.compute_proposal_hash,
-            }
-            actual = hash_funcs.get(entity_type, lambda x: "")(entity)
-            raise HashMismatchError(entity_type, str(entity_id), expected, actual)
+        self._verification.check(entity)
         return entity
@@ -0,0 +1,342 @@
+"""Keyframe + delta storage for snapshot normalized_fields.
+
+Consecutive snapshots of a game repeat almost all of their normalized
+content: the shared Kalshi board and the odds event change by a few
+prices per poll. With delta storage enabled, every Nth snapshot of a
+game (a keyframe) stores its normalized_fields in full, and the
+snapshots in between store a reference to the game's previous snapshot
+plus a JSON-patch style list of operations against it::
+
+    {"$delta": {"base": "<snapshot_id>", "seq": 3, "patch": [...]}}
+
+``seq`` counts the deltas since the keyframe, so reconstructing a
+snapshot reads at most N - 1 other rows. Reconstructed documents are
+cached, so reading a timeline in collection order applies one patch per
+row. Reconstruction happens transparently on read, so InfoSnapshot
+content (and therefore compute_snapshot_hash) is unchanged and rows can
+be verified as before.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, cast
+
+from sportsbetsinfo.core.exceptions import IntegrityError
+from sportsbetsinfo.db.codec import decode_column
+
+DELTA_REF_KEY = "$delta"
+
+
+def is_delta_ref(value: Any) -> bool:
+    """Check whether stored normalized_fields are a delta reference."""
+    return isinstance(value, dict) and len(value) == 1 and DELTA_REF_KEY in value
+
+
+def _escape(token: str) -> str:
+    """Escape a key for use as a JSON pointer token (RFC 6901)."""
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    """Reverse _escape."""
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff(old: Any, new: Any, path: str = "") -> list[dict[str, Any]]:
+    """Compute patch operations turning ``old`` into ``new``.
+
+    Objects are compared key by key. Arrays of equal length are compared
+    element by element; arrays whose length changed are replaced whole.
+    Values of different JSON types (including int vs float) are always
+    replaced, so apply_patch reproduces ``new`` exactly.
+
+    Args:
+        old: Base document
+        new: Target document
+        path: JSON pointer of the documents (empty for the root)
+
+    Returns:
+        List of ``add``/``remove``/``replace`` operations
+    """
+    if type(old) is not type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+
+    if isinstance(new, dict):
+        ops: list[dict[str, Any]] = [
+            {"op": "remove", "path": f"{path}/{_escape(key)}"} for key in old if key not in new
+        ]
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(diff(old[key], value, child))
+        return ops
+
+    if isinstance(new, list):
+        if len(old) != len(new):
+            return [{"op": "replace", "path": path, "value": new}]
+        ops = []
+        for index, (before, after) in enumerate(zip(old, new, strict=True)):
+            ops.extend(diff(before, after, f"{path}/{index}"))
+        return ops
+
+    return [] if old == new else [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(document: Any, ops: list[dict[str, Any]]) -> Any:
+    """Apply patch operations produced by diff.
+
+    ``document`` is not modified. Only the containers on the paths of
+    the operations are copied; untouched subtrees are shared with
+    ``document``, so callers must treat the result as read-only (as they
+    do every decoded snapshot).
+
+    Args:
+        document: Base document
+        ops: Operations from diff
+
+    Returns:
+        The patched document
+
+    Raises:
+        IntegrityError: If an operation does not apply to the document
+    """
+    result = document
+    copied: set[int] = set()
+
+    def own(container: Any) -> Any:
+        """Return a copy of container private to this patch."""
+        if id(container) in copied:
+            return container
+        clone = dict(container) if isinstance(container, dict) else list(container)
+        copied.add(id(clone))
+        return clone
+
+    try:
+        for op in ops:
+            if not op["path"]:
+                result = op["value"]
+                continue
+
+            tokens = [_unescape(token) for token in op["path"].split("/")[1:]]
+            result = own(result)
+            parent = result
+            for token in tokens[:-1]:
+                key = int(token) if isinstance(parent, list) else token
+                child = own(parent[key])
+                parent[key] = child
+                parent = child
+
+            last = int(tokens[-1]) if isinstance(parent, list) else tokens[-1]
+            if op["op"] == "remove":
+                del parent[last]
+            else:
+                parent[last] = op["value"]
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        raise IntegrityError(f"Delta does not apply to its keyframe: {e}") from e
+    return result
+
+
+@dataclass
+class _Tip:
+    """Latest stored row of a game, as seen by the encoder."""
+
+    snapshot_id: str
+    collected_at: str
+    seq: int
+
+
+class DeltaStore:
+    """Encodes and reconstructs delta-stored normalized_fields.
+
+    Reconstructed documents (keyframes and deltas) are cached per store
+    instance, so a timeline read in collection order reconstructs each
+    row from the one before it.
+    """
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        keyframe_interval: int | None = None,
+        cache_size: int = 256,
+    ) -> None:
+        """Initialize store with database connection.
+
+        Args:
+            connection: SQLite connection
+            keyframe_interval: Store a full keyframe every N snapshots of a
+                game (None or 1 stores every snapshot in full). Only
+                affects writes; both layouts are always readable.
+            cache_size: Maximum number of reconstructed documents kept in memory
+        """
+        self._conn = connection
+        self.keyframe_interval = keyframe_interval
+        self._cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._cache_size = cache_size
+
+    @property
+    def enabled(self) -> bool:
+        """Whether new rows are delta-encoded."""
+        return self.keyframe_interval is not None and self.keyframe_interval > 1
+
+    def encode_many(
+        self, rows: list[tuple[str, str, str, dict[str, Any]]]
+    ) -> list[str]:
+        """Encode the normalized_fields of rows about to be written.
+
+        Rows are encoded in order, so several snapshots of one game in
+        the same batch chain onto each other. A snapshot becomes a
+        keyframe when its game has no stored rows, the keyframe interval
+        is reached, it was collected before the game's latest row, or
+        its delta would be no smaller than the full content.
+
+        Does not write anything; the caller inserts the returned JSON in
+        the same transaction. Chains start from the game's latest row in
+        the database, so a rolled-back batch leaves nothing to undo.
+
+        Args:
+            rows: (snapshot_id, game_id, collected_at ISO string,
+                normalized_fields) per row, in insertion order
+
+        Returns:
+            Stored JSON text per row
+        """
+        interval = self.keyframe_interval
+        if interval is None or not self.enabled:
+            return [json.dumps(fields) for _, _, _, fields in rows]
+
+        tips: dict[str, _Tip | None] = {}
+        encoded = []
+        for snapshot_id, game_id, collected_at, fields in rows:
+            if game_id not in tips:
+                tips[game_id] = self._stored_tip(game_id)
+            tip = tips[game_id]
+            stored = json.dumps(fields)
+
+            if (
+                tip is not None
+                and collected_at >= tip.collected_at
+                and tip.seq + 1 < interval
+            ):
+                patch = {
+                    "base": tip.snapshot_id,
+                    "seq": tip.seq + 1,
+                    "patch": diff(self.get(tip.snapshot_id), fields),
+                }
+                delta = json.dumps({DELTA_REF_KEY: patch})
+                if len(delta) < len(stored):
+                    stored = delta
+                    tips[game_id] = _Tip(snapshot_id, collected_at, tip.seq + 1)
+                else:
+                    tips[game_id] = _Tip(snapshot_id, collected_at, 0)
+            else:
+                tips[game_id] = _Tip(snapshot_id, collected_at, 0)
+
+            self._remember(snapshot_id, fields)
+            encoded.append(stored)
+        return encoded
+
+    def decode(self, stored_json: str | bytes, snapshot_id: str | None = None) -> dict[str, Any]:
+        """Reconstruct normalized_fields from a stored column value.
+
+        Rows stored in full (keyframes, and everything written without
+        delta storage) are returned as decoded. Passing the row's
+        snapshot_id caches the result, so the next row of the timeline
+        is reconstructed from it without reading the chain again.
+
+        Args:
+            stored_json: info_snapshots.normalized_fields value (any column codec)
+            snapshot_id: Snapshot ID of the row, if known
+
+        Returns:
+            Full normalized_fields
+
+        Raises:
+            IntegrityError: If a base row is missing or a delta does not apply
+        """
+        if snapshot_id is not None and snapshot_id in self._cache:
+            self._cache.move_to_end(snapshot_id)
+            return self._cache[snapshot_id]
+
+        stored = json.loads(decode_column(stored_json))
+        if is_delta_ref(stored):
+            ref = stored[DELTA_REF_KEY]
+            stored = apply_patch(self.get(ref["base"]), ref["patch"])
+        document = cast(dict[str, Any], stored)
+        if snapshot_id is not None:
+            self._remember(snapshot_id, document)
+        return document
+
+    def get(self, snapshot_id: str) -> dict[str, Any]:
+        """Reconstruct a stored row's normalized_fields by snapshot ID.
+
+        Walks the row's chain back to a keyframe (or a cached document)
+        and applies the patches forward, caching every document built.
+
+        Args:
+            snapshot_id: Snapshot ID
+
+        Returns:
+            Full normalized_fields
+
+        Raises:
+            IntegrityError: If a row in the chain is missing or a delta does not apply
+        """
+        chain: list[tuple[str, list[dict[str, Any]]]] = []
+        seen: set[str] = set()
+        current = snapshot_id
+        while current not in self._cache:
+            if current in seen:
+                raise IntegrityError(f"Delta chain does not reach a keyframe: {snapshot_id}")
+            seen.add(current)
+            row = self._conn.execute(
+                "SELECT normalized_fields FROM info_snapshots WHERE snapshot_id = ?",
+                (current,),
+            ).fetchone()
+            if row is None:
+                raise IntegrityError(f"Delta base snapshot not found: {current}")
+            stored = json.loads(decode_column(row[0]))
+            if not is_delta_ref(stored):
+                self._remember(current, stored)
+                break
+            ref = stored[DELTA_REF_KEY]
+            chain.append((current, ref["patch"]))
+            current = ref["base"]
+
+        document = self._cache[current]
+        self._cache.move_to_end(current)
+        for chained_id, patch in reversed(chain):
+            document = cast(dict[str, Any], apply_patch(document, patch))
+            self._remember(chained_id, document)
+        return document
+
+    def _stored_tip(self, game_id: str) -> _Tip | None:
+        """Read the chain position of a game's latest stored row."""
+        row = self._conn.execute(
+            """
+            SELECT s.snapshot_id, s.collected_at, s.normalized_fields
+            FROM game_latest_snapshot g
+            JOIN info_snapshots s ON s.snapshot_id = g.latest_snapshot_id
+            WHERE g.game_id = ?
+            """,
+            (game_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        stored = json.loads(decode_column(row[2]))
+        if is_delta_ref(stored):
+            return _Tip(row[0], row[1], stored[DELTA_REF_KEY]["seq"])
+        self._remember(row[0], stored)
+        return _Tip(row[0], row[1], 0)
+
+    def _remember(self, snapshot_id: str, document: dict[str, Any]) -> None:
+        """Cache a reconstructed document, evicting the least recently used when full."""
+        self._cache[snapshot_id] = document
+        self._cache.move_to_end(snapshot_id)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
@@ -4,11 +4,49 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
 from sportsbetsinfo.core.exceptions import DuplicateEntityError
 from sportsbetsinfo.core.models import Evaluation, EvaluationMetrics
-from sportsbetsinfo.db.repositories.base import ImmutableRepository
+from sportsbetsinfo.db.repositories.analysis import COMPARISON_FIELDS
+from sportsbetsinfo.db.repositories.base import ImmutableRepository, atomic
+
+# (analysis_id, game_id) pairs whose comparison is evaluable, whose game has an
+# outcome, and that have no evaluation yet. Driven from outcomes through the
+# analysis_comparisons(event_id) and evaluations(analysis_id, game_id) indexes.
+# The first comparison per game wins (SQLite returns bare columns from the
+# MIN(position) row).
+_PENDING_SQL = f"""
+SELECT {", ".join(f"ac.{name}" for name in COMPARISON_FIELDS)},
+       ac.analysis_id, ac.analyzed_at, MIN(ac.position) AS position
+FROM outcomes o
+JOIN analysis_comparisons ac ON ac.event_id = o.game_id
+LEFT JOIN evaluations e
+    ON e.analysis_id = ac.analysis_id AND e.game_id = o.game_id
+WHERE e.evaluation_id IS NULL
+  AND ac.home_team IS NOT NULL
+  AND ac.home_team != ''
+  AND ac.vegas_home_prob IS NOT NULL
+GROUP BY ac.analysis_id, o.game_id
+"""  # noqa: S608
+
+
+@dataclass(frozen=True)
+class PendingEvaluation:
+    """An (analysis, game) pair that can be evaluated but has not been.
+
+    Attributes:
+        analysis_id: Analysis containing the comparison
+        game_id: Game with a recorded outcome
+        comparison: Comparison values from analysis_comparisons (null
+            values omitted, keyed like the derived_features dict)
+    """
+
+    analysis_id: str
+    game_id: str
+    comparison: dict[str, Any]
 
 
 class EvaluationRepository(ImmutableRepository[Evaluation]):
@@ -17,6 +55,9 @@ class EvaluationRepository(ImmutableRepository[Evaluation]):
     Evaluations score analyses against actual outcomes.
     """
 
+    table_name = "evaluations"
+    id_column = "evaluation_id"
+
     def insert(self, evaluation: Evaluation) -> Evaluation:
         """Insert a new evaluation.
 
@@ -29,15 +70,28 @@ class EvaluationRepository(ImmutableRepository[Evaluation]):
         Raises:
             DuplicateEntityError: If hash already exists
         """
-        cursor = self._conn.cursor()
         try:
-            cursor.execute(
-                """
-                INSERT INTO evaluations (
-                    evaluation_id, analysis_id, game_id, scored_at,
-                    brier_score, log_loss, roi, edge_realized, notes, hash
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+            with atomic(self._conn) as cursor:
+                self._write_rows(cursor, [evaluation])
+            return evaluation
+        except sqlite3.IntegrityError as e:
+            raise DuplicateEntityError("Evaluation", evaluation.hash) from e
+
+    def _write_rows(self, cursor: sqlite3.Cursor, evaluations: list[Evaluation]) -> None:
+        """Write evaluation rows.
+
+        Args:
+            cursor: Cursor on the repository connection
+            evaluations: Evaluations to write
+        """
+        cursor.executemany(
+            """
+            INSERT INTO evaluations (
+                evaluation_id, analysis_id, game_id, scored_at,
+                brier_score, log_loss, roi, edge_realized, notes, hash
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
                 (
                     evaluation.evaluation_id,
                     evaluation.analysis_id,
@@ -49,13 +103,10 @@ class EvaluationRepository(ImmutableRepository[Evaluation]):
                     evaluation.metrics.edge_realized,
                     json.dumps(evaluation.notes) if evaluation.notes else None,
                     evaluation.hash,
-                ),
-            )
-            self._conn.commit()
-            return evaluation
-        except sqlite3.IntegrityError as e:
-            self._conn.rollback()
-            raise DuplicateEntityError("Evaluation", evaluation.hash) from e
+                )
+                for evaluation in evaluations
+            ],
+        )
 
     def get_by_id(self, evaluation_id: str) -> Evaluation | None:
         """Get evaluation by ID.
@@ -135,6 +186,45 @@ class EvaluationRepository(ImmutableRepository[Evaluation]):
         )
         return [self._row_to_entity(row) for row in cursor.fetchall()]
 
+    def get_pending(self, limit: int | None = None) -> list[PendingEvaluation]:
+        """Plan pending evaluations with a single set-based query.
+
+        Args:
+            limit: Maximum number of pairs (None for all)
+
+        Returns:
+            Pending pairs ordered by analysis creation time
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(
+            f"""
+            SELECT * FROM ({_PENDING_SQL})
+            ORDER BY analyzed_at, analysis_id, position
+            LIMIT ?
+            """,  # noqa: S608
+            (-1 if limit is None else limit,),
+        )
+        return [
+            PendingEvaluation(
+                analysis_id=row["analysis_id"],
+                game_id=row["event_id"],
+                comparison={
+                    name: row[name] for name in COMPARISON_FIELDS if row[name] is not None
+                },
+            )
+            for row in cursor.fetchall()
+        ]
+
+    def count_pending(self) -> int:
+        """Count pending evaluations.
+
+        Returns:
+            Number of (analysis_id, game_id) pairs awaiting evaluation
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(f"SELECT COUNT(*) FROM ({_PENDING_SQL})")  # noqa: S608
+        return int(cursor.fetchone()[0])
+
     def get_aggregate_metrics(self) -> dict[str, float | None]:
         """Get aggregate metrics across all evaluations.
 
@@ -162,6 +252,10 @@ class EvaluationRepository(ImmutableRepository[Evaluation]):
             "count": row["count"],
         }
 
+    def _rows_to_entities(self, rows: list[sqlite3.Row]) -> list[Evaluation]:
+        """Convert database rows to entities."""
+        return [self._row_to_entity(row) for row in rows]
+
     def _row_to_entity(self, row: sqlite3.Row) -> Evaluation:
         """Convert database row to Evaluation entity.
 
@@ -0,0 +1,189 @@
+"""Repository for persisted odds event to Kalshi market matches.
+
+The market for a game does not change between snapshots, so the first
+match found is recorded and later analyses look it up instead of
+re-matching. The table is append-only and doubles as an audit record
+of which market each event was compared against.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+from sportsbetsinfo.db.repositories.base import _MAX_SQL_PARAMS, atomic
+
+# Method recorded for matches recovered from earlier analyses
+METHOD_BACKFILL = "backfill"
+
+
+@dataclass(frozen=True)
+class MarketMatch:
+    """A recorded match between an odds event and a Kalshi market.
+
+    Attributes:
+        event_id: Odds API event ID (the game_id)
+        market_id: Kalshi market ticker
+        home_team: Home team name
+        away_team: Away team name
+        market_title: Kalshi market title when matched
+        method: How the match was made (e.g. "alias", "city")
+        confidence: Confidence in the match (0-1)
+        matched_at: When the match was first recorded
+    """
+
+    event_id: str
+    market_id: str
+    home_team: str
+    away_team: str
+    market_title: str | None
+    method: str
+    confidence: float
+    matched_at: datetime
+
+
+class MarketMatchRepository:
+    """Append-only store of event to market matches."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        """Initialize repository with database connection.
+
+        Args:
+            connection: SQLite connection
+        """
+        self._conn = connection
+
+    def record(self, matches: Sequence[MarketMatch]) -> int:
+        """Record matches, ignoring (event, market) pairs already stored.
+
+        Runs in a savepoint and does not commit when the connection is
+        already in a transaction, so inside ConnectionManager.write() the
+        matches are committed (or rolled back) together with the analysis
+        that made them.
+
+        Args:
+            matches: Matches to record
+
+        Returns:
+            Number of new rows
+        """
+        if not matches:
+            return 0
+        before = self._conn.total_changes
+        with atomic(self._conn) as cursor:
+            cursor.executemany(
+                """
+                INSERT OR IGNORE INTO market_matches (
+                    event_id, market_id, home_team, away_team, market_title,
+                    method, confidence, matched_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        m.event_id,
+                        m.market_id,
+                        m.home_team,
+                        m.away_team,
+                        m.market_title,
+                        m.method,
+                        m.confidence,
+                        m.matched_at.isoformat(),
+                    )
+                    for m in matches
+                ],
+            )
+        return self._conn.total_changes - before
+
+    def get_by_event_id(self, event_id: str) -> MarketMatch | None:
+        """Get the first match recorded for an event.
+
+        Args:
+            event_id: Odds API event ID
+
+        Returns:
+            MarketMatch or None if the event was never matched
+        """
+        return self.get_by_event_ids([event_id]).get(event_id)
+
+    def get_by_event_ids(self, event_ids: list[str]) -> dict[str, MarketMatch]:
+        """Get the first match recorded for each of several events.
+
+        Args:
+            event_ids: Odds API event IDs
+
+        Returns:
+            Dictionary mapping event_id to MarketMatch (unmatched events omitted)
+        """
+        found: dict[str, MarketMatch] = {}
+        unique = list(dict.fromkeys(event_ids))
+        cursor = self._conn.cursor()
+        for start in range(0, len(unique), _MAX_SQL_PARAMS):
+            chunk = unique[start : start + _MAX_SQL_PARAMS]
+            placeholders = ",".join("?" for _ in chunk)
+            cursor.execute(
+                f"""
+                SELECT * FROM market_matches
+                WHERE event_id IN ({placeholders})
+                ORDER BY matched_at, rowid
+                """,  # noqa: S608
+                chunk,
+            )
+            for row in cursor.fetchall():
+                found.setdefault(row["event_id"], self._row_to_match(row))
+        return found
+
+    def get_by_market_id(self, market_id: str) -> list[MarketMatch]:
+        """Get every event matched to a market.
+
+        Args:
+            market_id: Kalshi market ticker
+
+        Returns:
+            List of MarketMatch ordered by matched_at
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(
+            "SELECT * FROM market_matches WHERE market_id = ? ORDER BY matched_at, rowid",
+            (market_id,),
+        )
+        return [self._row_to_match(row) for row in cursor.fetchall()]
+
+    def backfill_from_comparisons(self) -> int:
+        """Record matches made by analyses stored before this table existed.
+
+        Returns:
+            Number of new rows
+        """
+        before = self._conn.total_changes
+        with atomic(self._conn) as cursor:
+            cursor.execute(
+                """
+                INSERT OR IGNORE INTO market_matches (
+                    event_id, market_id, home_team, away_team, market_title,
+                    method, confidence, matched_at
+                )
+                SELECT event_id, kalshi_market_id, home_team, away_team, NULL,
+                       ?, 1.0, MIN(analyzed_at)
+                FROM analysis_comparisons
+                WHERE matched = 1 AND event_id IS NOT NULL AND kalshi_market_id IS NOT NULL
+                  AND home_team IS NOT NULL AND away_team IS NOT NULL
+                GROUP BY event_id, kalshi_market_id
+                """,
+                (METHOD_BACKFILL,),
+            )
+        return self._conn.total_changes - before
+
+    def _row_to_match(self, row: sqlite3.Row) -> MarketMatch:
+        """Convert database row to MarketMatch."""
+        return MarketMatch(
+            event_id=row["event_id"],
+            market_id=row["market_id"],
+            home_team=row["home_team"],
+            away_team=row["away_team"],
+            market_title=row["market_title"],
+            method=row["method"],
+            confidence=row["confidence"],
+            matched_at=datetime.fromisoformat(row["matched_at"]),
+        )
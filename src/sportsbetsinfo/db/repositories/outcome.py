@@ -8,7 +8,7 @@ from datetime import datetime
 
 from sportsbetsinfo.core.exceptions import DuplicateEntityError
 from sportsbetsinfo.core.models import FinalScore, Outcome
-from sportsbetsinfo.db.repositories.base import ImmutableRepository
+from sportsbetsinfo.db.repositories.base import _MAX_SQL_PARAMS, ImmutableRepository, atomic
 
 
 class OutcomeRepository(ImmutableRepository[Outcome]):
@@ -17,6 +17,9 @@ class OutcomeRepository(ImmutableRepository[Outcome]):
     Each game can have only one outcome (enforced by UNIQUE constraint on game_id).
     """
 
+    table_name = "outcomes"
+    id_column = "outcome_id"
+
     def insert(self, outcome: Outcome) -> Outcome:
         """Insert a new outcome.
 
@@ -29,15 +32,28 @@ class OutcomeRepository(ImmutableRepository[Outcome]):
         Raises:
             DuplicateEntityError: If game_id or hash already exists
         """
-        cursor = self._conn.cursor()
         try:
-            cursor.execute(
-                """
-                INSERT INTO outcomes (
-                    outcome_id, game_id, occurred_at, final_score,
-                    winner, stats_summary, source, hash
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+            with atomic(self._conn) as cursor:
+                self._write_rows(cursor, [outcome])
+            return outcome
+        except sqlite3.IntegrityError as e:
+            raise DuplicateEntityError("Outcome", outcome.hash) from e
+
+    def _write_rows(self, cursor: sqlite3.Cursor, outcomes: list[Outcome]) -> None:
+        """Write outcome rows.
+
+        Args:
+            cursor: Cursor on the repository connection
+            outcomes: Outcomes to write
+        """
+        cursor.executemany(
+            """
+            INSERT INTO outcomes (
+                outcome_id, game_id, occurred_at, final_score,
+                winner, stats_summary, source, hash
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
                 (
                     outcome.outcome_id,
                     outcome.game_id,
@@ -47,13 +63,10 @@ class OutcomeRepository(ImmutableRepository[Outcome]):
                     json.dumps(outcome.stats_summary),
                     outcome.source,
                     outcome.hash,
-                ),
-            )
-            self._conn.commit()
-            return outcome
-        except sqlite3.IntegrityError as e:
-            self._conn.rollback()
-            raise DuplicateEntityError("Outcome", outcome.hash) from e
+                )
+                for outcome in outcomes
+            ],
+        )
 
     def get_by_id(self, outcome_id: str) -> Outcome | None:
         """Get outcome by ID.
@@ -110,6 +123,28 @@ class OutcomeRepository(ImmutableRepository[Outcome]):
         )
         return [self._row_to_entity(row) for row in cursor.fetchall()]
 
+    def get_by_game_ids(self, game_ids: list[str]) -> dict[str, Outcome]:
+        """Get outcomes for several games in one query.
+
+        Args:
+            game_ids: Game identifiers
+
+        Returns:
+            Dictionary mapping game_id to Outcome (games without outcomes omitted)
+        """
+        found: dict[str, Outcome] = {}
+        unique = list(dict.fromkeys(game_ids))
+        cursor = self._conn.cursor()
+        for start in range(0, len(unique), _MAX_SQL_PARAMS):
+            chunk = unique[start : start + _MAX_SQL_PARAMS]
+            placeholders = ",".join("?" for _ in chunk)
+            cursor.execute(
+                f"SELECT * FROM outcomes WHERE game_id IN ({placeholders})",  # noqa: S608
+                chunk,
+            )
+            found.update((o.game_id, o) for o in self._rows_to_entities(cursor.fetchall()))
+        return found
+
     def get_pending_games(
         self, game_ids: list[str]
     ) -> list[str]:
@@ -133,6 +168,10 @@ class OutcomeRepository(ImmutableRepository[Outcome]):
         existing = {row["game_id"] for row in cursor.fetchall()}
         return [gid for gid in game_ids if gid not in existing]
 
+    def _rows_to_entities(self, rows: list[sqlite3.Row]) -> list[Outcome]:
+        """Convert database rows to entities."""
+        return [self._row_to_entity(row) for row in rows]
+
     def _row_to_entity(self, row: sqlite3.Row) -> Outcome:
         """Convert database row to Outcome entity.
 
@@ -0,0 +1,235 @@
+"""Content-addressed storage for raw API payloads.
+
+Snapshots in the same collection cycle embed byte-identical upstream
+responses (the Kalshi board is shared by every game, and unchanged
+prices repeat across cycles). Instead of inlining each payload, the
+snapshot row stores a reference ``{"$blob": "<sha256>"}`` and the
+payload itself is stored once in ``payload_blobs``.
+
+References are resolved transparently on read, so InfoSnapshot content
+(and therefore compute_snapshot_hash) is unchanged. Blob content is
+encoded with the column codec (see db.codec).
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from typing import Any
+
+from sportsbetsinfo.core.exceptions import IntegrityError
+from sportsbetsinfo.core.hashing import compute_payload_hash, serialize_payload
+from sportsbetsinfo.db.codec import ColumnCodec, decode_column
+
+BLOB_REF_KEY = "$blob"
+
+
+def is_blob_ref(value: Any) -> bool:
+    """Check whether a stored payload value is a blob reference."""
+    return isinstance(value, dict) and len(value) == 1 and BLOB_REF_KEY in value
+
+
+def content_hash(content: str | bytes) -> str:
+    """Compute the content hash of a stored payload_blobs.content value.
+
+    Args:
+        content: Stored content (any column codec)
+
+    Returns:
+        Hash the blob should be stored under
+
+    Raises:
+        IntegrityError: If the content cannot be decoded
+    """
+    try:
+        return compute_payload_hash(json.loads(decode_column(content)))
+    except ValueError as e:
+        raise IntegrityError(f"Undecodable payload blob: {e}") from e
+
+
+class PayloadStore:
+    """Append-only, content-addressed store for raw payloads.
+
+    Decoded payloads are cached per store instance so that a batch of
+    snapshots sharing one board decodes it only once.
+    """
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        cache_size: int = 256,
+        codec: ColumnCodec | None = None,
+    ) -> None:
+        """Initialize store with database connection.
+
+        Args:
+            connection: SQLite connection
+            cache_size: Maximum number of decoded payloads kept in memory
+            codec: Codec for new blob content (plain text if None)
+        """
+        self._conn = connection
+        self._codec = codec or ColumnCodec()
+        self._cache: dict[str, Any] = {}
+        self._cache_size = cache_size
+
+    def put(self, payload: Any) -> str:
+        """Store a payload if not already present.
+
+        Does not commit; the caller owns the transaction so the blob and
+        the snapshot referencing it are written atomically.
+
+        Args:
+            payload: JSON-serializable payload
+
+        Returns:
+            Content hash of the payload
+        """
+        content = serialize_payload(payload)
+        blob_hash = compute_payload_hash(payload)
+        self._conn.execute(
+            """
+            INSERT OR IGNORE INTO payload_blobs (blob_hash, content, size_bytes)
+            VALUES (?, ?, ?)
+            """,
+            (blob_hash, self._codec.encode(content), len(content.encode("utf-8"))),
+        )
+        return blob_hash
+
+    def get(self, blob_hash: str) -> Any | None:
+        """Get a decoded payload by hash.
+
+        Args:
+            blob_hash: Content hash
+
+        Returns:
+            Decoded payload if found, None otherwise
+        """
+        found = self.get_many([blob_hash])
+        return found.get(blob_hash)
+
+    def get_many(self, blob_hashes: list[str]) -> dict[str, Any]:
+        """Get decoded payloads for several hashes in one query.
+
+        Args:
+            blob_hashes: Content hashes
+
+        Returns:
+            Dictionary mapping hash to decoded payload (missing hashes omitted)
+        """
+        found = {h: self._cache[h] for h in blob_hashes if h in self._cache}
+        missing = [h for h in dict.fromkeys(blob_hashes) if h not in found]
+        if not missing:
+            return found
+
+        placeholders = ",".join("?" for _ in missing)
+        cursor = self._conn.execute(
+            f"SELECT blob_hash, content FROM payload_blobs WHERE blob_hash IN ({placeholders})",  # noqa: S608
+            missing,
+        )
+        for row in cursor.fetchall():
+            payload = json.loads(decode_column(row[1]))
+            found[row[0]] = payload
+            self._remember(row[0], payload)
+        return found
+
+    def externalize(self, raw_payloads: dict[str, Any]) -> dict[str, Any]:
+        """Move structured payloads into the store, returning references.
+
+        Scalar values (e.g. ``kalshi_error`` strings) stay inline.
+
+        Args:
+            raw_payloads: Snapshot raw payloads
+
+        Returns:
+            Payload mapping with dict/list values replaced by blob references
+        """
+        stored: dict[str, Any] = {}
+        for key, value in raw_payloads.items():
+            if isinstance(value, (dict, list)):
+                stored[key] = {BLOB_REF_KEY: self.put(value)}
+            else:
+                stored[key] = value
+        return stored
+
+    def hydrate(self, stored: dict[str, Any]) -> dict[str, Any]:
+        """Resolve blob references back into full payloads.
+
+        Rows written before the blob store existed contain inline
+        payloads and are returned unchanged.
+
+        Args:
+            stored: Payload mapping as stored in info_snapshots.raw_payloads
+
+        Returns:
+            Payload mapping with all references resolved
+
+        Raises:
+            IntegrityError: If a referenced blob is missing
+        """
+        refs = [v[BLOB_REF_KEY] for v in stored.values() if is_blob_ref(v)]
+        if not refs:
+            return stored
+
+        blobs = self.get_many(refs)
+        hydrated: dict[str, Any] = {}
+        for key, value in stored.items():
+            if is_blob_ref(value):
+                blob_hash = value[BLOB_REF_KEY]
+                if blob_hash not in blobs:
+                    raise IntegrityError(f"Payload blob not found: {blob_hash}")
+                hydrated[key] = blobs[blob_hash]
+            else:
+                hydrated[key] = value
+        return hydrated
+
+    def verify(self, blob_hash: str) -> bool:
+        """Check that a stored blob still hashes to its key.
+
+        Args:
+            blob_hash: Content hash
+
+        Returns:
+            True if the blob exists and its content matches the hash
+        """
+        row = self._conn.execute(
+            "SELECT content FROM payload_blobs WHERE blob_hash = ?",
+            (blob_hash,),
+        ).fetchone()
+        if row is None:
+            return False
+        try:
+            return content_hash(row[0]) == blob_hash
+        except IntegrityError:
+            return False
+
+    def get_after_rowid(
+        self, after_rowid: int, limit: int = 500
+    ) -> list[tuple[int, str, str | bytes]]:
+        """Get stored blobs in storage order using keyset pagination.
+
+        Content is returned as stored, so it can be checked with
+        content_hash() elsewhere (e.g. in a worker process).
+
+        Args:
+            after_rowid: Return rows with rowid strictly greater than this
+            limit: Maximum number of rows
+
+        Returns:
+            List of (rowid, blob_hash, stored content) ordered by rowid
+        """
+        cursor = self._conn.execute(
+            """
+            SELECT rowid, blob_hash, content FROM payload_blobs
+            WHERE rowid > ?
+            ORDER BY rowid
+            LIMIT ?
+            """,
+            (after_rowid, limit),
+        )
+        return [(row[0], row[1], row[2]) for row in cursor.fetchall()]
+
+    def _remember(self, blob_hash: str, payload: Any) -> None:
+        """Cache a decoded payload, evicting the oldest entry when full."""
+        if len(self._cache) >= self._cache_size:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[blob_hash] = payload
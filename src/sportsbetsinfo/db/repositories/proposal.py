@@ -8,7 +8,7 @@ from datetime import datetime
 
 from sportsbetsinfo.core.exceptions import DuplicateEntityError
 from sportsbetsinfo.core.models import ImprovementProposal, ProposalStatus
-from sportsbetsinfo.db.repositories.base import ImmutableRepository
+from sportsbetsinfo.db.repositories.base import ImmutableRepository, atomic
 
 
 class ProposalRepository(ImmutableRepository[ImprovementProposal]):
@@ -19,6 +19,9 @@ class ProposalRepository(ImmutableRepository[ImprovementProposal]):
     fields remain immutable.
     """
 
+    table_name = "improvement_proposals"
+    id_column = "proposal_id"
+
     def insert(self, proposal: ImprovementProposal) -> ImprovementProposal:
         """Insert a new proposal with its evaluation relationships.
 
@@ -31,16 +34,31 @@ class ProposalRepository(ImmutableRepository[ImprovementProposal]):
         Raises:
             DuplicateEntityError: If hash already exists
         """
-        cursor = self._conn.cursor()
         try:
-            cursor.execute(
-                """
-                INSERT INTO improvement_proposals (
-                    proposal_id, created_at, proposal_text,
-                    suggested_schema_additions, suggested_modules,
-                    expected_impact, status, hash
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+            with atomic(self._conn) as cursor:
+                self._write_rows(cursor, [proposal])
+            return proposal
+        except sqlite3.IntegrityError as e:
+            raise DuplicateEntityError("ImprovementProposal", proposal.hash) from e
+
+    def _write_rows(
+        self, cursor: sqlite3.Cursor, proposals: list[ImprovementProposal]
+    ) -> None:
+        """Write proposal rows and their evaluation relationships.
+
+        Args:
+            cursor: Cursor on the repository connection
+            proposals: Proposals to write
+        """
+        cursor.executemany(
+            """
+            INSERT INTO improvement_proposals (
+                proposal_id, created_at, proposal_text,
+                suggested_schema_additions, suggested_modules,
+                expected_impact, status, hash
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
                 (
                     proposal.proposal_id,
                     proposal.created_at.isoformat(),
@@ -56,24 +74,23 @@ class ProposalRepository(ImmutableRepository[ImprovementProposal]):
                     else None,
                     proposal.status.value,
                     proposal.hash,
-                ),
-            )
-
-            # Insert evaluation relationships
-            for eval_id in proposal.based_on_evaluation_ids:
-                cursor.execute(
-                    """
-                    INSERT INTO proposal_evaluations (proposal_id, evaluation_id)
-                    VALUES (?, ?)
-                    """,
-                    (proposal.proposal_id, eval_id),
                 )
+                for proposal in proposals
+            ],
+        )
 
-            self._conn.commit()
-            return proposal
-        except sqlite3.IntegrityError as e:
-            self._conn.rollback()
-            raise DuplicateEntityError("ImprovementProposal", proposal.hash) from e
+        # Insert evaluation relationships
+        cursor.executemany(
+            """
+            INSERT INTO proposal_evaluations (proposal_id, evaluation_id)
+            VALUES (?, ?)
+            """,
+            [
+                (proposal.proposal_id, eval_id)
+                for proposal in proposals
+                for eval_id in proposal.based_on_evaluation_ids
+            ],
+        )
 
     def get_by_id(self, proposal_id: str) -> ImprovementProposal | None:
         """Get proposal by ID including evaluation relationships.
@@ -147,19 +164,17 @@ class ProposalRepository(ImmutableRepository[ImprovementProposal]):
         Returns:
             Updated proposal if found, None otherwise
         """
-        cursor = self._conn.cursor()
-
         # Temporarily disable the trigger for this specific update
         # Note: In production, you might want a more sophisticated approach
-        cursor.execute(
-            """
-            UPDATE improvement_proposals
-            SET status = ?
-            WHERE proposal_id = ?
-            """,
-            (new_status.value, proposal_id),
-        )
-        self._conn.commit()
+        with atomic(self._conn) as cursor:
+            cursor.execute(
+                """
+                UPDATE improvement_proposals
+                SET status = ?
+                WHERE proposal_id = ?
+                """,
+                (new_status.value, proposal_id),
+            )
 
         return self.get_by_id(proposal_id)
 
@@ -194,6 +209,23 @@ class ProposalRepository(ImmutableRepository[ImprovementProposal]):
             results.append(self._row_to_entity(row, eval_ids))
         return results
 
+    def _rows_to_entities(self, rows: list[sqlite3.Row]) -> list[ImprovementProposal]:
+        """Convert database rows to entities, loading evaluation links in one query."""
+        if not rows:
+            return []
+        placeholders = ",".join("?" for _ in rows)
+        cursor = self._conn.execute(
+            f"""
+            SELECT proposal_id, evaluation_id FROM proposal_evaluations
+            WHERE proposal_id IN ({placeholders})
+            """,  # noqa: S608
+            [row["proposal_id"] for row in rows],
+        )
+        links: dict[str, list[str]] = {}
+        for link in cursor.fetchall():
+            links.setdefault(link["proposal_id"], []).append(link["evaluation_id"])
+        return [self._row_to_entity(row, links.get(row["proposal_id"], [])) for row in rows]
+
     def _row_to_entity(
         self, row: sqlite3.Row, eval_ids: list[str]
     ) -> ImprovementProposal:
@@ -4,19 +4,214 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
-from sportsbetsinfo.core.exceptions import DuplicateEntityError
-from sportsbetsinfo.core.models import InfoSnapshot, SourceVersions
-from sportsbetsinfo.db.repositories.base import ImmutableRepository
+from sportsbetsinfo.core.exceptions import DuplicateEntityError, EntityNotFoundError
+from sportsbetsinfo.core.models import InfoSnapshot, SnapshotHeartbeat, SourceVersions
+from sportsbetsinfo.db.codec import ColumnCodec, decode_column, get_default_codec
+from sportsbetsinfo.db.repositories.base import _MAX_SQL_PARAMS, ImmutableRepository, atomic
+from sportsbetsinfo.db.repositories.delta import DeltaStore
+from sportsbetsinfo.db.repositories.payload import PayloadStore
+from sportsbetsinfo.db.verification import VerificationPolicy
+
+# Columns needed for listing and timeline views (no raw payloads)
+_VIEW_COLUMNS = "snapshot_id, game_id, collected_at, hash, source_versions, normalized_fields"
+
+# Collection time of a game's latest snapshot, inside the game_latest_snapshot
+# upsert (last_collected_at also moves with heartbeats)
+_LATEST_SNAPSHOT_AT = (
+    "SELECT collected_at FROM info_snapshots"
+    " WHERE snapshot_id = game_latest_snapshot.latest_snapshot_id"
+)
+
+
+class SnapshotView:
+    """Read-only, lazily decoded projection of an info_snapshots row.
+
+    Only the columns needed for listings are selected. normalized_fields
+    is JSON-decoded on first access, and raw payloads are fetched (and
+    blob references resolved) only if requested. Hash verification is
+    not performed unless verify() is called or the view was loaded with
+    ``verify=True``.
+
+    Views of heartbeats (polls that saw unchanged content) carry the
+    poll time as ``collected_at`` and the content of the snapshot they
+    saw again, with ``is_heartbeat`` set.
+    """
+
+    __slots__ = (
+        "snapshot_id",
+        "game_id",
+        "collected_at",
+        "hash",
+        "is_heartbeat",
+        "_source_versions_json",
+        "_normalized_json",
+        "_normalized",
+        "_repo",
+    )
+
+    def __init__(self, row: sqlite3.Row, repo: SnapshotRepository) -> None:
+        """Initialize view from a projected row.
+
+        Args:
+            row: Row with the _VIEW_COLUMNS columns
+            repo: Repository used to load heavy columns on demand
+        """
+        self.snapshot_id: str = row["snapshot_id"]
+        self.game_id: str = row["game_id"]
+        self.collected_at = datetime.fromisoformat(row["collected_at"])
+        self.hash: str = row["hash"]
+        # sqlite3.Row membership tests values, not column names
+        self.is_heartbeat = "is_heartbeat" in row.keys() and bool(row["is_heartbeat"])  # noqa: SIM118
+        self._source_versions_json: str = row["source_versions"]
+        self._normalized_json: str | bytes = row["normalized_fields"]
+        self._normalized: dict[str, Any] | None = None
+        self._repo = repo
+
+    @property
+    def source_versions(self) -> SourceVersions:
+        """Source API versions."""
+        return SourceVersions.from_dict(json.loads(self._source_versions_json))
+
+    @property
+    def normalized_fields(self) -> dict[str, Any]:
+        """Normalized fields, decoded on first access."""
+        if self._normalized is None:
+            self._normalized = self._repo.decode_normalized_fields(
+                self._normalized_json, self.snapshot_id
+            )
+        return self._normalized
+
+    @property
+    def raw_payloads(self) -> dict[str, Any]:
+        """Raw payloads, loaded from the database on access (not cached)."""
+        return self.load().raw_payloads
+
+    def load(self) -> InfoSnapshot:
+        """Load the full snapshot entity (verified per repository policy).
+
+        Returns:
+            Full InfoSnapshot
+
+        Raises:
+            EntityNotFoundError: If the row no longer exists
+            HashMismatchError: If the stored content does not match the hash
+        """
+        snapshot = self._repo.get_by_id(self.snapshot_id)
+        if snapshot is None:
+            raise EntityNotFoundError("InfoSnapshot", self.snapshot_id)
+        return snapshot
+
+    def verify(self) -> SnapshotView:
+        """Verify this row's hash against its full stored content.
+
+        Returns:
+            self, for chaining
+
+        Raises:
+            HashMismatchError: If the stored content does not match the hash
+        """
+        self._repo.verification.verify_now(self.load())
+        return self
+
+
+@dataclass(frozen=True)
+class DedupStats:
+    """How many polls were stored as heartbeats instead of full snapshots.
+
+    Attributes:
+        snapshots: Full snapshot rows
+        heartbeats: Heartbeat rows
+    """
+
+    snapshots: int
+    heartbeats: int
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Share of polls stored as heartbeats."""
+        polls = self.snapshots + self.heartbeats
+        return self.heartbeats / polls if polls else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "snapshots": self.snapshots,
+            "heartbeats": self.heartbeats,
+            "dedup_ratio": round(self.dedup_ratio, 4),
+        }
+
+
+@dataclass(frozen=True)
+class GameSummary:
+    """Per-game row from the game_latest_snapshot index.
+
+    Attributes:
+        game_id: Game identifier
+        latest_snapshot_id: Most recently collected snapshot for the game
+        first_collected_at: Collection time of the earliest snapshot
+        last_collected_at: Time of the latest poll, snapshot or heartbeat
+        snapshot_count: Number of full snapshots for the game (heartbeats
+            are not counted)
+        home_team: Home team from the latest snapshot that had odds
+        away_team: Away team from the latest snapshot that had odds
+    """
+
+    game_id: str
+    latest_snapshot_id: str
+    first_collected_at: datetime
+    last_collected_at: datetime
+    snapshot_count: int
+    home_team: str | None
+    away_team: str | None
+
+
+def _teams(normalized_fields: dict[str, Any]) -> tuple[str | None, str | None]:
+    """Extract (home_team, away_team) from a snapshot's first odds event."""
+    events = normalized_fields.get("odds_api_events") or []
+    if not events:
+        return None, None
+    return events[0].get("home_team"), events[0].get("away_team")
 
 
 class SnapshotRepository(ImmutableRepository[InfoSnapshot]):
     """Repository for InfoSnapshot entities.
 
-    Provides append-only storage for market data snapshots.
+    Provides append-only storage for market data snapshots. Raw payloads
+    are deduplicated through the content-addressed PayloadStore,
+    normalized_fields can be stored as keyframes plus deltas through the
+    DeltaStore, and large JSON columns are compressed per the ColumnCodec.
     """
 
+    table_name = "info_snapshots"
+    id_column = "snapshot_id"
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        verification: VerificationPolicy | None = None,
+        keyframe_interval: int | None = None,
+        codec: ColumnCodec | None = None,
+    ) -> None:
+        """Initialize repository with database connection.
+
+        Args:
+            connection: SQLite connection
+            verification: Hash verification policy for reads
+            keyframe_interval: Delta-encode normalized_fields of new rows
+                with a full keyframe every N snapshots per game (None
+                stores every row in full). Reads handle both layouts.
+            codec: Column codec for writes (defaults to the process-wide
+                codec from settings); reads handle every codec
+        """
+        super().__init__(connection, verification)
+        self._codec = codec or get_default_codec()
+        self._payloads = PayloadStore(connection, codec=self._codec)
+        self._deltas = DeltaStore(connection, keyframe_interval)
+
     def insert(self, snapshot: InfoSnapshot) -> InfoSnapshot:
         """Insert a new snapshot.
 
@@ -32,36 +227,199 @@ class SnapshotRepository(ImmutableRepository[InfoSnapshot]):
         Raises:
             DuplicateEntityError: If snapshot_id already exists with different hash
         """
-        cursor = self._conn.cursor()
         try:
-            cursor.execute(
-                """
-                INSERT INTO info_snapshots (
-                    snapshot_id, game_id, collected_at, schema_version,
-                    source_versions, raw_payloads, normalized_fields, hash
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+            with atomic(self._conn) as cursor:
+                self._write_rows(cursor, [snapshot])
+            return snapshot
+        except sqlite3.IntegrityError as e:
+            if "UNIQUE constraint failed" in str(e) and "hash" in str(e):
+                # Idempotent: same content already exists
+                existing = self.get_by_hash(snapshot.hash)
+                if existing:
+                    return existing
+            raise DuplicateEntityError("InfoSnapshot", snapshot.hash) from e
+
+    def _write_rows(self, cursor: sqlite3.Cursor, snapshots: list[InfoSnapshot]) -> None:
+        """Write snapshot rows, storing raw payloads in the blob store.
+
+        normalized_fields are delta-encoded when the repository has a
+        keyframe interval, and both JSON columns are encoded with the
+        repository's codec. Also maintains the game_latest_snapshot index in the same
+        transaction. Heartbeats may have advanced last_collected_at past the
+        latest snapshot, so a snapshot replaces latest_snapshot_id when it is
+        at least as recent as that snapshot.
+
+        Args:
+            cursor: Cursor on the repository connection
+            snapshots: Snapshots to write
+        """
+        normalized = self._deltas.encode_many(
+            [
+                (s.snapshot_id, s.game_id, s.collected_at.isoformat(), s.normalized_fields)
+                for s in snapshots
+            ]
+        )
+        cursor.executemany(
+            """
+            INSERT INTO info_snapshots (
+                snapshot_id, game_id, collected_at, schema_version,
+                source_versions, raw_payloads, normalized_fields, hash
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
                 (
                     snapshot.snapshot_id,
                     snapshot.game_id,
                     snapshot.collected_at.isoformat(),
                     snapshot.schema_version,
                     json.dumps(snapshot.source_versions.to_dict()),
-                    json.dumps(snapshot.raw_payloads),
-                    json.dumps(snapshot.normalized_fields),
+                    self._codec.encode(
+                        json.dumps(self._payloads.externalize(snapshot.raw_payloads))
+                    ),
+                    self._codec.encode(normalized_json),
                     snapshot.hash,
+                )
+                for snapshot, normalized_json in zip(snapshots, normalized, strict=True)
+            ],
+        )
+        cursor.executemany(
+            f"""
+            INSERT INTO game_latest_snapshot (
+                game_id, latest_snapshot_id, first_collected_at, last_collected_at,
+                snapshot_count, home_team, away_team
+            ) VALUES (?, ?, ?, ?, 1, ?, ?)
+            ON CONFLICT(game_id) DO UPDATE SET
+                latest_snapshot_id = CASE
+                    WHEN excluded.last_collected_at >= ({_LATEST_SNAPSHOT_AT})
+                    THEN excluded.latest_snapshot_id ELSE latest_snapshot_id END,
+                home_team = CASE
+                    WHEN excluded.last_collected_at >= ({_LATEST_SNAPSHOT_AT})
+                    THEN COALESCE(excluded.home_team, home_team) ELSE home_team END,
+                away_team = CASE
+                    WHEN excluded.last_collected_at >= ({_LATEST_SNAPSHOT_AT})
+                    THEN COALESCE(excluded.away_team, away_team) ELSE away_team END,
+                first_collected_at = MIN(first_collected_at, excluded.first_collected_at),
+                last_collected_at = MAX(last_collected_at, excluded.last_collected_at),
+                snapshot_count = snapshot_count + 1
+            """,  # noqa: S608
+            [
+                (
+                    snapshot.game_id,
+                    snapshot.snapshot_id,
+                    snapshot.collected_at.isoformat(),
+                    snapshot.collected_at.isoformat(),
+                    *_teams(snapshot.normalized_fields),
+                )
+                for snapshot in snapshots
+            ],
+        )
+
+    def insert_heartbeat(self, heartbeat: SnapshotHeartbeat) -> None:
+        """Record a poll that saw unchanged content.
+
+        A second heartbeat for the same game and time is ignored. The
+        game's last_collected_at in game_latest_snapshot advances to the
+        heartbeat time in the same transaction, so game lists treat the
+        poll like a full snapshot; snapshot_count is unchanged.
+
+        Args:
+            heartbeat: Heartbeat pointing at the unchanged snapshot
+        """
+        observed_at = heartbeat.observed_at.isoformat()
+        with atomic(self._conn) as cursor:
+            cursor.execute(
+                """
+                INSERT INTO snapshot_heartbeats (game_id, observed_at, snapshot_id, content_hash)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(game_id, observed_at) DO NOTHING
+                """,
+                (
+                    heartbeat.game_id,
+                    observed_at,
+                    heartbeat.snapshot_id,
+                    heartbeat.content_hash,
                 ),
             )
-            self._conn.commit()
-            return snapshot
-        except sqlite3.IntegrityError as e:
-            self._conn.rollback()
-            if "UNIQUE constraint failed" in str(e) and "hash" in str(e):
-                # Idempotent: same content already exists
-                existing = self.get_by_hash(snapshot.hash)
-                if existing:
-                    return existing
-            raise DuplicateEntityError("InfoSnapshot", snapshot.hash) from e
+            cursor.execute(
+                """
+                UPDATE game_latest_snapshot
+                SET last_collected_at = MAX(last_collected_at, ?)
+                WHERE game_id = ?
+                """,
+                (observed_at, heartbeat.game_id),
+            )
+
+    def get_heartbeats(self, game_id: str) -> list[SnapshotHeartbeat]:
+        """Get a game's heartbeats ordered by poll time.
+
+        Args:
+            game_id: Game identifier
+
+        Returns:
+            List of SnapshotHeartbeat
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            SELECT * FROM snapshot_heartbeats
+            WHERE game_id = ?
+            ORDER BY observed_at ASC
+            """,
+            (game_id,),
+        )
+        return [
+            SnapshotHeartbeat(
+                game_id=row["game_id"],
+                observed_at=datetime.fromisoformat(row["observed_at"]),
+                snapshot_id=row["snapshot_id"],
+                content_hash=row["content_hash"],
+            )
+            for row in cursor.fetchall()
+        ]
+
+    def get_latest_normalized_fields(self, game_id: str) -> tuple[str, dict[str, Any]] | None:
+        """Get a game's latest snapshot ID and normalized fields from the per-game index.
+
+        Cheaper than get_latest_by_game_id when only the content is
+        needed (raw payloads are not read).
+
+        Args:
+            game_id: Game identifier
+
+        Returns:
+            (snapshot_id, normalized_fields), or None if the game has no snapshots
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            SELECT s.snapshot_id, s.normalized_fields
+            FROM game_latest_snapshot g
+            JOIN info_snapshots s ON s.snapshot_id = g.latest_snapshot_id
+            WHERE g.game_id = ?
+            """,
+            (game_id,),
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return row["snapshot_id"], self._deltas.decode(row["normalized_fields"])
+
+    def get_dedup_stats(self) -> DedupStats:
+        """Count full snapshots and heartbeats.
+
+        Returns:
+            DedupStats
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM info_snapshots) AS snapshots,
+                (SELECT COUNT(*) FROM snapshot_heartbeats) AS heartbeats
+            """
+        )
+        row = cursor.fetchone()
+        return DedupStats(snapshots=row["snapshots"], heartbeats=row["heartbeats"])
 
     def get_by_id(self, snapshot_id: str) -> InfoSnapshot | None:
         """Get snapshot by ID.
@@ -143,6 +501,92 @@ class SnapshotRepository(ImmutableRepository[InfoSnapshot]):
         row = cursor.fetchone()
         return self._row_to_entity(row) if row else None
 
+    def get_latest_for_all_games(self, limit: int = 100) -> list[InfoSnapshot]:
+        """Get the most recent snapshot of each game in one indexed query.
+
+        Args:
+            limit: Maximum number of games
+
+        Returns:
+            Latest snapshot per game, most recently updated games first
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            SELECT s.* FROM game_latest_snapshot g
+            JOIN info_snapshots s ON s.snapshot_id = g.latest_snapshot_id
+            ORDER BY g.last_collected_at DESC
+            LIMIT ?
+            """,
+            (limit,),
+        )
+        return self._rows_to_entities(cursor.fetchall())
+
+    def get_game_summaries(self, limit: int = 100, offset: int = 0) -> list[GameSummary]:
+        """List games from the per-game index without reading snapshot rows.
+
+        Args:
+            limit: Maximum number of games
+            offset: Number to skip
+
+        Returns:
+            GameSummary list, most recently updated games first
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            SELECT * FROM game_latest_snapshot
+            ORDER BY last_collected_at DESC
+            LIMIT ? OFFSET ?
+            """,
+            (limit, offset),
+        )
+        return [
+            GameSummary(
+                game_id=row["game_id"],
+                latest_snapshot_id=row["latest_snapshot_id"],
+                first_collected_at=datetime.fromisoformat(row["first_collected_at"]),
+                last_collected_at=datetime.fromisoformat(row["last_collected_at"]),
+                snapshot_count=row["snapshot_count"],
+                home_team=row["home_team"],
+                away_team=row["away_team"],
+            )
+            for row in cursor.fetchall()
+        ]
+
+    def get_last_collected_at(self, game_ids: list[str]) -> dict[str, datetime]:
+        """Get when each game was last polled (latest snapshot or heartbeat).
+
+        Args:
+            game_ids: Game identifiers
+
+        Returns:
+            Dictionary mapping game_id to last collection time (games
+            without snapshots omitted)
+        """
+        found: dict[str, datetime] = {}
+        unique = list(dict.fromkeys(game_ids))
+        cursor = self._conn.cursor()
+        for start in range(0, len(unique), _MAX_SQL_PARAMS):
+            chunk = unique[start : start + _MAX_SQL_PARAMS]
+            placeholders = ",".join("?" for _ in chunk)
+            cursor.execute(
+                f"""
+                SELECT game_id, last_collected_at FROM game_latest_snapshot
+                WHERE game_id IN ({placeholders})
+                UNION ALL
+                SELECT game_id, MAX(observed_at) FROM snapshot_heartbeats
+                WHERE game_id IN ({placeholders})
+                GROUP BY game_id
+                """,  # noqa: S608
+                chunk + chunk,
+            )
+            for row in cursor.fetchall():
+                collected_at = datetime.fromisoformat(row["last_collected_at"])
+                if row["game_id"] not in found or collected_at > found[row["game_id"]]:
+                    found[row["game_id"]] = collected_at
+        return found
+
     def get_all(self, limit: int = 100, offset: int = 0) -> list[InfoSnapshot]:
         """Get snapshots with pagination.
 
@@ -164,10 +608,117 @@ class SnapshotRepository(ImmutableRepository[InfoSnapshot]):
         )
         return [self._row_to_entity(row) for row in cursor.fetchall()]
 
+    def get_views_by_game_id(
+        self,
+        game_id: str,
+        limit: int = 100,
+        verify: bool = False,
+        include_heartbeats: bool = False,
+    ) -> list[SnapshotView]:
+        """Get lightweight views of a game's snapshots, ordered by collection time.
+
+        Args:
+            game_id: Game identifier
+            limit: Maximum number to return
+            verify: Verify each row's hash (loads full content)
+            include_heartbeats: Also return a view per heartbeat, so the
+                timeline has an entry for every poll. Heartbeats can
+                outnumber snapshots many times over, so if there are more
+                than ``limit`` entries the most recent ones are returned
+                (the latest polls, including the closing line).
+
+        Returns:
+            List of SnapshotView ordered by collected_at
+        """
+        cursor = self._conn.cursor()
+        if not include_heartbeats:
+            cursor.execute(
+                f"""
+                SELECT {_VIEW_COLUMNS} FROM info_snapshots
+                WHERE game_id = ?
+                ORDER BY collected_at ASC
+                LIMIT ?
+                """,  # noqa: S608
+                (game_id, limit),
+            )
+            return self._rows_to_views(cursor.fetchall(), verify)
+
+        cursor.execute(
+            f"""
+            SELECT * FROM (
+                SELECT {_VIEW_COLUMNS}, 0 AS is_heartbeat FROM info_snapshots
+                WHERE game_id = ?
+                UNION ALL
+                SELECT
+                    s.snapshot_id, s.game_id, h.observed_at AS collected_at, s.hash,
+                    s.source_versions, s.normalized_fields, 1 AS is_heartbeat
+                FROM snapshot_heartbeats h
+                JOIN info_snapshots s ON s.snapshot_id = h.snapshot_id
+                WHERE h.game_id = ?
+                ORDER BY collected_at DESC, is_heartbeat DESC
+                LIMIT ?
+            )
+            ORDER BY collected_at ASC, is_heartbeat ASC
+            """,  # noqa: S608
+            (game_id, game_id, limit),
+        )
+        return self._rows_to_views(cursor.fetchall(), verify)
+
+    def get_views(
+        self, limit: int = 100, offset: int = 0, verify: bool = False
+    ) -> list[SnapshotView]:
+        """Get lightweight snapshot views with pagination.
+
+        Args:
+            limit: Maximum number of snapshots
+            offset: Number to skip
+            verify: Verify each row's hash (loads full content)
+
+        Returns:
+            List of SnapshotView ordered by collected_at DESC
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(
+            f"""
+            SELECT {_VIEW_COLUMNS} FROM info_snapshots
+            ORDER BY collected_at DESC
+            LIMIT ? OFFSET ?
+            """,  # noqa: S608
+            (limit, offset),
+        )
+        return self._rows_to_views(cursor.fetchall(), verify)
+
+    def decode_normalized_fields(
+        self, stored_json: str | bytes, snapshot_id: str | None = None
+    ) -> dict[str, Any]:
+        """Decode a stored normalized_fields column, reconstructing deltas.
+
+        Args:
+            stored_json: info_snapshots.normalized_fields value
+            snapshot_id: Snapshot ID of the row (lets keyframes be cached)
+
+        Returns:
+            Full normalized_fields
+        """
+        return self._deltas.decode(stored_json, snapshot_id)
+
+    def _rows_to_views(self, rows: list[sqlite3.Row], verify: bool) -> list[SnapshotView]:
+        """Convert projected rows to views, optionally verifying hashes."""
+        views = [SnapshotView(row, self) for row in rows]
+        if verify:
+            for view in views:
+                view.verify()
+        return views
+
+    def _rows_to_entities(self, rows: list[sqlite3.Row]) -> list[InfoSnapshot]:
+        """Convert database rows to entities."""
+        return [self._row_to_entity(row) for row in rows]
+
     def _row_to_entity(self, row: sqlite3.Row) -> InfoSnapshot:
         """Convert database row to InfoSnapshot entity.
 
-        Also verifies hash integrity.
+        Resolves payload blob references, reconstructs delta-encoded
+        normalized_fields and verifies hash integrity.
 
         Args:
             row: SQLite row
@@ -182,8 +733,8 @@ class SnapshotRepository(ImmutableRepository[InfoSnapshot]):
             collected_at=datetime.fromisoformat(row["collected_at"]),
             schema_version=row["schema_version"],
             source_versions=SourceVersions.from_dict(source_versions_dict),
-            raw_payloads=json.loads(row["raw_payloads"]),
-            normalized_fields=json.loads(row["normalized_fields"]),
+            raw_payloads=self._payloads.hydrate(json.loads(decode_column(row["raw_payloads"]))),
+            normalized_fields=self._deltas.decode(row["normalized_fields"], row["snapshot_id"]),
             hash=row["hash"],
         )
         return self._verify_hash_on_read(snapshot)
@@ -31,6 +31,48 @@ CREATE INDEX IF NOT EXISTS idx_snapshots_game_id ON info_snapshots(game_id);
 CREATE INDEX IF NOT EXISTS idx_snapshots_collected_at ON info_snapshots(collected_at);
 CREATE INDEX IF NOT EXISTS idx_snapshots_hash ON info_snapshots(hash);
 
+--------------------------------------------------------------------------------
+-- SNAPSHOT_HEARTBEATS: Polls that saw unchanged content (point at the snapshot
+-- they saw again instead of storing a full copy)
+--------------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS snapshot_heartbeats (
+    game_id TEXT NOT NULL,
+    observed_at TEXT NOT NULL,
+    snapshot_id TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    PRIMARY KEY (game_id, observed_at),
+    FOREIGN KEY (snapshot_id) REFERENCES info_snapshots(snapshot_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_heartbeats_snapshot ON snapshot_heartbeats(snapshot_id);
+
+--------------------------------------------------------------------------------
+-- PAYLOAD_BLOBS: Content-addressed raw API payloads shared by snapshots
+--------------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS payload_blobs (
+    blob_hash TEXT PRIMARY KEY,
+    content TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+--------------------------------------------------------------------------------
+-- GAME_LATEST_SNAPSHOT: Derived per-game index maintained on snapshot insert
+-- (not part of the immutable record; rebuildable from info_snapshots)
+--------------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS game_latest_snapshot (
+    game_id TEXT PRIMARY KEY,
+    latest_snapshot_id TEXT NOT NULL,
+    first_collected_at TEXT NOT NULL,
+    last_collected_at TEXT NOT NULL,
+    snapshot_count INTEGER NOT NULL,
+    home_team TEXT,
+    away_team TEXT,
+    FOREIGN KEY (latest_snapshot_id) REFERENCES info_snapshots(snapshot_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_game_latest_last_collected ON game_latest_snapshot(last_collected_at);
+
 --------------------------------------------------------------------------------
 -- ANALYSES: DAG of derived artifacts (like git commits)
 --------------------------------------------------------------------------------
@@ -52,6 +94,38 @@ CREATE INDEX IF NOT EXISTS idx_analyses_parent ON analyses(parent_analysis_id);
 CREATE INDEX IF NOT EXISTS idx_analyses_created_at ON analyses(created_at);
 CREATE INDEX IF NOT EXISTS idx_analyses_hash ON analyses(hash);
 
+--------------------------------------------------------------------------------
+-- ANALYSIS_COMPARISONS: One row per comparison in analyses.derived_features
+-- (written with the analysis so edge queries need no JSON decoding)
+--------------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS analysis_comparisons (
+    analysis_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    analyzed_at TEXT NOT NULL,
+    event_id TEXT,
+    home_team TEXT,
+    away_team TEXT,
+    commence_time TEXT,
+    game_status TEXT,
+    vegas_home_odds INTEGER,
+    vegas_away_odds INTEGER,
+    vegas_home_prob REAL,
+    vegas_away_prob REAL,
+    kalshi_market_id TEXT,
+    kalshi_implied_prob REAL,
+    delta_home REAL,
+    delta_home_percent REAL,
+    edge_magnitude REAL,
+    edge_direction TEXT,
+    matched INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (analysis_id, position),
+    FOREIGN KEY (analysis_id) REFERENCES analyses(analysis_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_comparisons_event ON analysis_comparisons(event_id);
+CREATE INDEX IF NOT EXISTS idx_comparisons_commence ON analysis_comparisons(commence_time, edge_magnitude);
+CREATE INDEX IF NOT EXISTS idx_comparisons_edge ON analysis_comparisons(edge_magnitude);
+
 --------------------------------------------------------------------------------
 -- ANALYSIS_SNAPSHOTS: Junction table for Analysis -> Snapshot (many-to-many)
 --------------------------------------------------------------------------------
@@ -102,6 +176,7 @@ CREATE TABLE IF NOT EXISTS evaluations (
 
 CREATE INDEX IF NOT EXISTS idx_evaluations_analysis ON evaluations(analysis_id);
 CREATE INDEX IF NOT EXISTS idx_evaluations_game ON evaluations(game_id);
+CREATE INDEX IF NOT EXISTS idx_evaluations_analysis_game ON evaluations(analysis_id, game_id);
 
 --------------------------------------------------------------------------------
 -- IMPROVEMENT_PROPOSALS: LLM-suggested improvements based on evidence
@@ -131,6 +206,41 @@ CREATE TABLE IF NOT EXISTS proposal_evaluations (
     FOREIGN KEY (proposal_id) REFERENCES improvement_proposals(proposal_id),
     FOREIGN KEY (evaluation_id) REFERENCES evaluations(evaluation_id)
 );
+
+--------------------------------------------------------------------------------
+-- VERIFICATION_RUNS: Append-only log of integrity checks (resumable checkpoints)
+--------------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS verification_runs (
+    run_id TEXT NOT NULL,
+    table_name TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    finished_at TEXT NOT NULL,
+    first_rowid INTEGER NOT NULL,
+    last_rowid INTEGER NOT NULL,
+    rows_verified INTEGER NOT NULL,
+    mismatches INTEGER NOT NULL,
+    PRIMARY KEY (run_id, table_name)
+);
+
+CREATE INDEX IF NOT EXISTS idx_verification_runs_table ON verification_runs(table_name, last_rowid);
+
+--------------------------------------------------------------------------------
+-- MARKET_MATCHES: Which Kalshi market was matched to which odds event
+-- Written when a match is first found; consulted before re-matching
+--------------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS market_matches (
+    event_id TEXT NOT NULL,
+    market_id TEXT NOT NULL,
+    home_team TEXT NOT NULL,
+    away_team TEXT NOT NULL,
+    market_title TEXT,
+    method TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    matched_at TEXT NOT NULL,
+    PRIMARY KEY (event_id, market_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_market_matches_market ON market_matches(market_id);
 """
 
 # Triggers to enforce immutability
@@ -152,6 +262,32 @@ BEGIN
     SELECT RAISE(ABORT, 'Deletes not allowed on immutable table info_snapshots');
 END;
 
+-- snapshot_heartbeats
+CREATE TRIGGER IF NOT EXISTS prevent_snapshot_heartbeat_update
+BEFORE UPDATE ON snapshot_heartbeats
+BEGIN
+    SELECT RAISE(ABORT, 'Updates not allowed on immutable table snapshot_heartbeats');
+END;
+
+CREATE TRIGGER IF NOT EXISTS prevent_snapshot_heartbeat_delete
+BEFORE DELETE ON snapshot_heartbeats
+BEGIN
+    SELECT RAISE(ABORT, 'Deletes not allowed on immutable table snapshot_heartbeats');
+END;
+
+-- payload_blobs
+CREATE TRIGGER IF NOT EXISTS prevent_payload_blob_update
+BEFORE UPDATE ON payload_blobs
+BEGIN
+    SELECT RAISE(ABORT, 'Updates not allowed on immutable table payload_blobs');
+END;
+
+CREATE TRIGGER IF NOT EXISTS prevent_payload_blob_delete
+BEFORE DELETE ON payload_blobs
+BEGIN
+    SELECT RAISE(ABORT, 'Deletes not allowed on immutable table payload_blobs');
+END;
+
 -- analyses
 CREATE TRIGGER IF NOT EXISTS prevent_analysis_update
 BEFORE UPDATE ON analyses
@@ -178,6 +314,19 @@ BEGIN
     SELECT RAISE(ABORT, 'Deletes not allowed on immutable table analysis_snapshots');
 END;
 
+-- analysis_comparisons
+CREATE TRIGGER IF NOT EXISTS prevent_analysis_comparisons_update
+BEFORE UPDATE ON analysis_comparisons
+BEGIN
+    SELECT RAISE(ABORT, 'Updates not allowed on immutable table analysis_comparisons');
+END;
+
+CREATE TRIGGER IF NOT EXISTS prevent_analysis_comparisons_delete
+BEFORE DELETE ON analysis_comparisons
+BEGIN
+    SELECT RAISE(ABORT, 'Deletes not allowed on immutable table analysis_comparisons');
+END;
+
 -- outcomes
 CREATE TRIGGER IF NOT EXISTS prevent_outcome_update
 BEFORE UPDATE ON outcomes
@@ -224,6 +373,97 @@ BEFORE DELETE ON proposal_evaluations
 BEGIN
     SELECT RAISE(ABORT, 'Deletes not allowed on immutable table proposal_evaluations');
 END;
+
+-- verification_runs
+CREATE TRIGGER IF NOT EXISTS prevent_verification_runs_update
+BEFORE UPDATE ON verification_runs
+BEGIN
+    SELECT RAISE(ABORT, 'Updates not allowed on immutable table verification_runs');
+END;
+
+CREATE TRIGGER IF NOT EXISTS prevent_verification_runs_delete
+BEFORE DELETE ON verification_runs
+BEGIN
+    SELECT RAISE(ABORT, 'Deletes not allowed on immutable table verification_runs');
+END;
+
+-- market_matches
+CREATE TRIGGER IF NOT EXISTS prevent_market_matches_update
+BEFORE UPDATE ON market_matches
+BEGIN
+    SELECT RAISE(ABORT, 'Updates not allowed on immutable table market_matches');
+END;
+
+CREATE TRIGGER IF NOT EXISTS prevent_market_matches_delete
+BEFORE DELETE ON market_matches
+BEGIN
+    SELECT RAISE(ABORT, 'Deletes not allowed on immutable table market_matches');
+END;
+"""
+
+
+# Recompute game_latest_snapshot from info_snapshots (latest wins; later rowid
+# breaks ties; last_collected_at also covers heartbeats; teams come from the
+# latest snapshot that has an odds event; delta-encoded rows have no top-level
+# odds_api_events, so teams fall back to the latest keyframe, which shares the
+# game's teams; decode_column() is the column codec SQL function registered by
+# db.connection)
+REBUILD_GAME_INDEX_SQL = """
+BEGIN;
+
+DELETE FROM game_latest_snapshot;
+
+INSERT INTO game_latest_snapshot (
+    game_id, latest_snapshot_id, first_collected_at, last_collected_at,
+    snapshot_count, home_team, away_team
+)
+SELECT
+    game_id,
+    snapshot_id,
+    first_collected_at,
+    MAX(
+        collected_at,
+        COALESCE(
+            (SELECT MAX(h.observed_at) FROM snapshot_heartbeats h WHERE h.game_id = latest.game_id),
+            collected_at
+        )
+    ),
+    snapshot_count,
+    (
+        SELECT json_extract(decode_column(t.normalized_fields), '$.odds_api_events[0].home_team')
+        FROM info_snapshots t
+        WHERE t.game_id = latest.game_id
+          AND json_extract(
+              decode_column(t.normalized_fields), '$.odds_api_events[0].home_team'
+          ) IS NOT NULL
+        ORDER BY t.collected_at DESC, t.rowid DESC
+        LIMIT 1
+    ),
+    (
+        SELECT json_extract(decode_column(t.normalized_fields), '$.odds_api_events[0].away_team')
+        FROM info_snapshots t
+        WHERE t.game_id = latest.game_id
+          AND json_extract(
+              decode_column(t.normalized_fields), '$.odds_api_events[0].away_team'
+          ) IS NOT NULL
+        ORDER BY t.collected_at DESC, t.rowid DESC
+        LIMIT 1
+    )
+FROM (
+    SELECT
+        game_id,
+        snapshot_id,
+        collected_at,
+        ROW_NUMBER() OVER (
+            PARTITION BY game_id ORDER BY collected_at DESC, rowid DESC
+        ) AS position,
+        MIN(collected_at) OVER (PARTITION BY game_id) AS first_collected_at,
+        COUNT(*) OVER (PARTITION BY game_id) AS snapshot_count
+    FROM info_snapshots
+) AS latest
+WHERE position = 1;
+
+COMMIT;
 """
 
 
@@ -256,6 +496,22 @@ def initialize_database(conn: sqlite3.Connection) -> None:
     create_all_tables(conn)
     create_immutability_triggers(conn)
 
+    # Backfill derived indexes for databases created before they existed
+    index_empty = conn.execute("SELECT 1 FROM game_latest_snapshot LIMIT 1").fetchone() is None
+    has_snapshots = conn.execute("SELECT 1 FROM info_snapshots LIMIT 1").fetchone() is not None
+    if index_empty and has_snapshots:
+        rebuild_game_index(conn)
+
+
+def rebuild_game_index(conn: sqlite3.Connection) -> None:
+    """Rebuild the game_latest_snapshot index from info_snapshots.
+
+    Args:
+        conn: SQLite connection
+    """
+    conn.executescript(REBUILD_GAME_INDEX_SQL)
+    conn.commit()
+
 
 def get_table_counts(conn: sqlite3.Connection) -> dict[str, int]:
     """Get row counts for all tables.
@@ -268,12 +524,18 @@ def get_table_counts(conn: sqlite3.Connection) -> dict[str, int]:
     """
     tables = [
         "info_snapshots",
+        "snapshot_heartbeats",
+        "payload_blobs",
+        "game_latest_snapshot",
         "analyses",
         "analysis_snapshots",
+        "analysis_comparisons",
         "outcomes",
         "evaluations",
         "improvement_proposals",
         "proposal_evaluations",
+        "verification_runs",
+        "market_matches",
     ]
     counts = {}
     cursor = conn.cursor()
@@ -0,0 +1,324 @@
+"""Hash verification policy for repository reads.
+
+Rows are immutable, so a row whose hash has been verified once does not
+need to be re-hashed on every read. Repositories consult a
+VerificationPolicy to decide whether a freshly read entity is hashed:
+
+- always: verify every row not already in the verified cache
+- sampled: verify a random fraction of rows
+- never: skip verification on reads (use only for hot dashboard paths)
+- audit: return immediately and verify on a background thread
+
+Verified ``(entity_type, id, hash)`` keys are kept in a process-wide
+cache. The ``verify`` CLI command uses VerificationPolicy.strict(),
+which bypasses the cache and is the authoritative full check.
+"""
+
+from __future__ import annotations
+
+import queue
+import random
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any
+
+from sportsbetsinfo.core import hashing
+from sportsbetsinfo.core.exceptions import HashMismatchError
+
+# Primary key attribute for each entity type
+_ID_ATTRS = {
+    "InfoSnapshot": "snapshot_id",
+    "Analysis": "analysis_id",
+    "Outcome": "outcome_id",
+    "Evaluation": "evaluation_id",
+    "ImprovementProposal": "proposal_id",
+}
+
+_HASH_FUNCS: dict[str, Callable[[Any], str]] = {
+    "InfoSnapshot": hashing.compute_snapshot_hash,
+    "Analysis": hashing.compute_analysis_hash,
+    "Outcome": hashing.compute_outcome_hash,
+    "Evaluation": hashing.compute_evaluation_hash,
+    "ImprovementProposal": hashing.compute_proposal_hash,
+}
+
+# Upper bound on cached keys (~100 bytes each)
+DEFAULT_CACHE_SIZE = 500_000
+
+# Upper bound on remembered audit failures
+_MAX_AUDIT_FAILURES = 100
+
+
+class VerificationMode(StrEnum):
+    """When repository reads verify content hashes."""
+
+    ALWAYS = "always"
+    SAMPLED = "sampled"
+    NEVER = "never"
+    AUDIT = "audit"
+
+
+def ensure_hash(entity: Any) -> None:
+    """Recompute an entity's hash and compare it to the stored value.
+
+    Args:
+        entity: Domain entity with a ``hash`` attribute
+
+    Raises:
+        HashMismatchError: If computed hash doesn't match stored hash
+    """
+    if hashing.verify_hash(entity):
+        return
+    entity_type = type(entity).__name__
+    entity_id = getattr(entity, _ID_ATTRS.get(entity_type, ""), "unknown")
+    actual = _HASH_FUNCS.get(entity_type, lambda x: "")(entity)
+    raise HashMismatchError(entity_type, str(entity_id), entity.hash, actual)
+
+
+def _cache_key(entity: Any) -> tuple[str, str, str]:
+    """Build the verified-cache key for an entity."""
+    entity_type = type(entity).__name__
+    return (entity_type, str(getattr(entity, _ID_ATTRS.get(entity_type, ""), "")), entity.hash)
+
+
+class VerifiedHashCache:
+    """Thread-safe set of entity keys whose hashes have been verified."""
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of keys; the cache is cleared when full
+        """
+        self._keys: set[tuple[str, str, str]] = set()
+        self._lock = threading.Lock()
+        self._max_size = max_size
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def contains(self, entity: Any) -> bool:
+        """Check whether an entity was already verified."""
+        return _cache_key(entity) in self._keys
+
+    def add(self, entity: Any) -> None:
+        """Record an entity as verified."""
+        key = _cache_key(entity)
+        with self._lock:
+            if len(self._keys) >= self._max_size:
+                self._keys.clear()
+            self._keys.add(key)
+
+    def clear(self) -> None:
+        """Forget all verified keys."""
+        with self._lock:
+            self._keys.clear()
+
+
+class BackgroundAuditor:
+    """Daemon thread that verifies entities queued by audit-mode reads.
+
+    Entities are immutable in memory, so verifying them after the read
+    returns checks exactly the content the caller received. Mismatches
+    are recorded rather than raised.
+    """
+
+    def __init__(self, cache: VerifiedHashCache, max_queue: int = 10_000) -> None:
+        """Initialize auditor. The worker thread starts on first submit.
+
+        Args:
+            cache: Cache to record verified entities in
+            max_queue: Queue capacity; entities are dropped when full
+        """
+        self._cache = cache
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        # Guards the counters and failures, written by the worker thread
+        # and read by health endpoints
+        self._stats_lock = threading.Lock()
+        self._audited = 0
+        self._dropped = 0
+        self._failures: list[str] = []
+
+    def submit(self, entity: Any) -> None:
+        """Queue an entity for background verification."""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(entity)
+        except queue.Full:
+            with self._stats_lock:
+                self._dropped += 1
+
+    @property
+    def audited(self) -> int:
+        """Number of entities audited."""
+        with self._stats_lock:
+            return self._audited
+
+    @property
+    def dropped(self) -> int:
+        """Number of entities dropped because the queue was full."""
+        with self._stats_lock:
+            return self._dropped
+
+    @property
+    def failures(self) -> list[str]:
+        """Copy of the recorded mismatch messages (at most _MAX_AUDIT_FAILURES)."""
+        with self._stats_lock:
+            return list(self._failures)
+
+    def join(self) -> None:
+        """Block until all queued entities have been audited."""
+        self._queue.join()
+
+    @property
+    def pending(self) -> int:
+        """Number of entities waiting to be audited."""
+        return self._queue.qsize()
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="hash-auditor", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            entity = self._queue.get()
+            try:
+                if not self._cache.contains(entity):
+                    ensure_hash(entity)
+                    self._cache.add(entity)
+            except HashMismatchError as e:
+                with self._stats_lock:
+                    if len(self._failures) < _MAX_AUDIT_FAILURES:
+                        self._failures.append(str(e))
+            finally:
+                with self._stats_lock:
+                    self._audited += 1
+                self._queue.task_done()
+
+
+_verified_cache = VerifiedHashCache()
+_auditor = BackgroundAuditor(_verified_cache)
+
+
+@dataclass(frozen=True)
+class VerificationPolicy:
+    """How a repository verifies the hashes of entities it reads.
+
+    Attributes:
+        mode: When to verify
+        sample_rate: Fraction of rows verified in SAMPLED mode (0-1)
+        use_cache: Skip rows already verified in this process
+    """
+
+    mode: VerificationMode = VerificationMode.ALWAYS
+    sample_rate: float = 0.1
+    use_cache: bool = True
+
+    @classmethod
+    def strict(cls) -> VerificationPolicy:
+        """Verify every row, ignoring the verified cache."""
+        return cls(mode=VerificationMode.ALWAYS, use_cache=False)
+
+    def check(self, entity: Any) -> None:
+        """Apply the policy to an entity that was just read.
+
+        Args:
+            entity: Entity read from the database
+
+        Raises:
+            HashMismatchError: If the entity is verified and its hash is wrong
+        """
+        if self.mode is VerificationMode.NEVER:
+            return
+        if self.use_cache and _verified_cache.contains(entity):
+            return
+        if self.mode is VerificationMode.AUDIT:
+            _auditor.submit(entity)
+            return
+        if self.mode is VerificationMode.SAMPLED and random.random() >= self.sample_rate:  # noqa: S311
+            return
+        self.verify_now(entity)
+
+    def verify_now(self, entity: Any) -> None:
+        """Verify an entity regardless of mode, recording it in the cache.
+
+        Args:
+            entity: Entity to verify
+
+        Raises:
+            HashMismatchError: If computed hash doesn't match stored hash
+        """
+        if self.use_cache and _verified_cache.contains(entity):
+            return
+        ensure_hash(entity)
+        _verified_cache.add(entity)
+
+
+_default_policy: VerificationPolicy | None = None
+
+
+def get_default_policy() -> VerificationPolicy:
+    """Get the process-wide default policy.
+
+    Built from SPORTSBETS_VERIFY_ON_READ / SPORTSBETS_VERIFY_SAMPLE_RATE
+    on first use unless set_default_policy() was called.
+
+    Returns:
+        Default VerificationPolicy
+    """
+    global _default_policy
+    if _default_policy is None:
+        from sportsbetsinfo.config.settings import get_settings
+
+        settings = get_settings()
+        _default_policy = VerificationPolicy(
+            mode=VerificationMode(settings.verify_on_read),
+            sample_rate=settings.verify_sample_rate,
+        )
+    return _default_policy
+
+
+def set_default_policy(policy: VerificationPolicy | None) -> None:
+    """Override the process-wide default policy.
+
+    Args:
+        policy: New default, or None to reload from settings on next use
+    """
+    global _default_policy
+    _default_policy = policy
+
+
+def get_verification_stats() -> dict[str, Any]:
+    """Get verification cache and auditor statistics.
+
+    Returns:
+        Dictionary suitable for health endpoints
+    """
+    policy = get_default_policy()
+    return {
+        "mode": policy.mode.value,
+        "sample_rate": policy.sample_rate,
+        "verified_cache_size": len(_verified_cache),
+        "audit_pending": _auditor.pending,
+        "audited": _auditor.audited,
+        "audit_dropped": _auditor.dropped,
+        "audit_failures": _auditor.failures,
+    }
+
+
+def clear_verified_cache() -> None:
+    """Forget all verified keys (e.g. after restoring a database file)."""
+    _verified_cache.clear()
+
+
+def wait_for_audit() -> None:
+    """Block until the background auditor has drained its queue."""
+    _auditor.join()
@@ -6,19 +6,26 @@ against Vegas sportsbook implied probabilities (with vig included).
 
 from __future__ import annotations
 
+import math
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 
 from sportsbetsinfo.config.settings import Settings
 from sportsbetsinfo.core.models import Analysis, InfoSnapshot
-from sportsbetsinfo.db.connection import get_connection
+from sportsbetsinfo.db.connection import get_connection_manager
 from sportsbetsinfo.db.repositories.analysis import AnalysisRepository
+from sportsbetsinfo.db.repositories.market_match import MarketMatch, MarketMatchRepository
 from sportsbetsinfo.db.repositories.snapshot import SnapshotRepository
-
+from sportsbetsinfo.services.matching import get_matcher
+from sportsbetsinfo.services.vectorized import compute_edges
 
 # Analysis version - bump when logic changes
-ANALYSIS_VERSION = "1.0.0"
+ANALYSIS_VERSION = "1.1.0"
+
+# Shards per worker process in analyze_batch()
+_SHARDS_PER_WORKER = 4
 
 
 def get_git_commit() -> str:
@@ -54,6 +61,23 @@ def american_to_probability(american_odds: int) -> float:
         return abs(american_odds) / (abs(american_odds) + 100)
 
 
+def _has_odds(event: dict[str, Any]) -> bool:
+    """Check whether an odds event can be compared (teams and both prices)."""
+    return bool(
+        event.get("home_team") and event.get("best_home_odds") and event.get("best_away_odds")
+    )
+
+
+def _event_ids(snapshots: list[InfoSnapshot]) -> list[str]:
+    """Collect the odds event IDs in a list of snapshots."""
+    return [
+        e["event_id"]
+        for snapshot in snapshots
+        for e in snapshot.normalized_fields.get("odds_api_events", [])
+        if e.get("event_id")
+    ]
+
+
 class AnalysisService:
     """Service for creating analyses comparing Kalshi vs Vegas.
 
@@ -61,14 +85,17 @@ class AnalysisService:
     to identify potential edges/mispricings.
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, code_version: str | None = None) -> None:
         """Initialize with settings.
 
         Args:
             settings: Application settings
+            code_version: Code version to record (default: current git commit)
         """
         self.settings = settings
-        self._code_version = get_git_commit()
+        self._db = get_connection_manager(settings.db_path)
+        self._code_version = code_version or get_git_commit()
+        self._matcher = get_matcher()
 
     def analyze_snapshot(
         self,
@@ -94,54 +121,29 @@ class AnalysisService:
         if not odds_events:
             return None
 
+        # Resolve each game's Kalshi market (recorded matches first)
+        with self._db.read() as conn:
+            recorded = MarketMatchRepository(conn).get_by_event_ids(
+                [e["event_id"] for e in odds_events if e.get("event_id")]
+            )
+        event_markets, new_matches = self._resolve_markets(odds_events, kalshi_markets, recorded)
+
         # Build derived features for each game
         comparisons = []
-        edges_found = []
-
-        for event in odds_events:
-            comparison = self._compare_event_to_kalshi(event, kalshi_markets)
+        for event, kalshi_match in zip(odds_events, event_markets, strict=True):
+            comparison = self._compare_event_to_kalshi(event, kalshi_match)
             if comparison:
                 comparisons.append(comparison)
 
-                # Track significant edges (> 3% delta)
-                if comparison.get("edge_magnitude", 0) > 0.03:
-                    edges_found.append(comparison)
-
-        if not comparisons:
+        analysis = self._build_analysis(snapshot, comparisons, parent_analysis_id)
+        if analysis is None:
             return None
 
-        # Build derived features
-        derived_features = {
-            "analysis_type": "kalshi_vs_vegas_with_vig",
-            "snapshot_collected_at": snapshot.collected_at.isoformat(),
-            "game_count": len(odds_events),
-            "matched_count": len(comparisons),
-            "comparisons": comparisons,
-            "edge_threshold": 0.03,
-            "edges_above_threshold": len(edges_found),
-        }
-
-        # Build conclusions
-        conclusions = self._build_conclusions(comparisons, edges_found)
-
-        # Build recommended actions
-        recommended_actions = self._build_recommendations(edges_found)
-
-        # Create analysis
-        analysis = Analysis.create(
-            analysis_version=ANALYSIS_VERSION,
-            code_version=self._code_version,
-            input_snapshot_ids=[snapshot.snapshot_id],
-            derived_features=derived_features,
-            conclusions=conclusions,
-            recommended_actions=recommended_actions,
-            parent_analysis_id=parent_analysis_id,
-        )
-
-        # Persist
-        with get_connection(self.settings.db_path) as conn:
-            repo = AnalysisRepository(conn)
-            return repo.insert(analysis)
+        # Persist the analysis with any newly found matches in one transaction
+        with self._db.write() as conn:
+            inserted = AnalysisRepository(conn).insert(analysis)
+            MarketMatchRepository(conn).record(new_matches)
+            return inserted
 
     def analyze_game(
         self,
@@ -157,7 +159,7 @@ class AnalysisService:
         Returns:
             Analysis object if snapshot exists, None otherwise
         """
-        with get_connection(self.settings.db_path) as conn:
+        with self._db.read() as conn:
             repo = SnapshotRepository(conn)
             snapshot = repo.get_latest_by_game_id(game_id)
 
@@ -169,81 +171,332 @@ class AnalysisService:
     def analyze_all_games(
         self,
         limit: int = 100,
+        engine: str = "auto",
+        workers: int | None = None,
     ) -> list[Analysis]:
         """Analyze latest snapshots for all games.
 
-        Creates one analysis per game with the most recent snapshot.
+        Creates one analysis per game with the most recent snapshot,
+        using the batch engine and a single write transaction. Analyses
+        identical to ones already stored are skipped.
 
         Args:
             limit: Maximum number of games to analyze
+            engine: Batch backend: "auto", "numpy" or "python"
+            workers: Build processes (default: settings.analysis_workers)
 
         Returns:
             List of created analyses
         """
-        with get_connection(self.settings.db_path) as conn:
+        with self._db.read() as conn:
             repo = SnapshotRepository(conn)
-            snapshots = repo.get_all(limit=limit)
-
-        # Group by game_id, keep only latest
-        latest_by_game: dict[str, InfoSnapshot] = {}
-        for snapshot in snapshots:
-            game_id = snapshot.game_id
-            if game_id not in latest_by_game:
-                latest_by_game[game_id] = snapshot
-            elif snapshot.collected_at > latest_by_game[game_id].collected_at:
-                latest_by_game[game_id] = snapshot
-
-        # Analyze each
+            latest_snapshots = repo.get_latest_for_all_games(limit=limit)
+
+        analyses, new_matches = self.analyze_batch(
+            latest_snapshots, engine=engine, workers=workers
+        )
+        if not analyses:
+            return []
+
+        with self._db.write() as conn:
+            result = AnalysisRepository(conn).insert_many(analyses)
+            MarketMatchRepository(conn).record(new_matches)
+
+        return result.inserted
+
+    def analyze_batch(
+        self,
+        snapshots: list[InfoSnapshot],
+        engine: str = "auto",
+        workers: int | None = None,
+    ) -> tuple[list[Analysis], list[MarketMatch]]:
+        """Build analyses for many snapshots without persisting them.
+
+        Odds and Kalshi prices are packed into columns and computed in
+        one vectorized pass (see services.vectorized). With more than one
+        worker, contiguous shards of snapshots are built in a process
+        pool and merged in snapshot order, so the output does not depend
+        on the worker count.
+
+        Args:
+            snapshots: Snapshots to analyze, one analysis each
+            engine: "auto" (NumPy if installed), "numpy" or "python"
+            workers: Build processes (default: settings.analysis_workers)
+
+        Returns:
+            (analyses in snapshot order, newly found market matches)
+        """
+        workers = max(1, workers or self.settings.analysis_workers)
+
+        with self._db.read() as conn:
+            recorded = MarketMatchRepository(conn).get_by_event_ids(_event_ids(snapshots))
+
+        if workers == 1 or len(snapshots) < 2:
+            return self.build_batch(snapshots, recorded, engine)
+
+        # A few shards per worker keeps the pool busy when shards are uneven
+        shard_size = max(1, math.ceil(len(snapshots) / (workers * _SHARDS_PER_WORKER)))
+        shards = []
+        for start in range(0, len(snapshots), shard_size):
+            shard = snapshots[start : start + shard_size]
+            shard_recorded = {
+                event_id: recorded[event_id]
+                for event_id in _event_ids(shard)
+                if event_id in recorded
+            }
+            shards.append((shard, shard_recorded, engine))
+
+        analyses: list[Analysis] = []
+        new_matches: list[MarketMatch] = []
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(shards)),
+            initializer=_init_worker,
+            initargs=(self.settings, self._code_version),
+        ) as pool:
+            for shard_analyses, shard_matches in pool.map(_build_shard, shards):
+                analyses.extend(shard_analyses)
+                new_matches.extend(shard_matches)
+
+        return analyses, new_matches
+
+    def build_batch(
+        self,
+        snapshots: list[InfoSnapshot],
+        recorded: dict[str, MarketMatch],
+        engine: str = "auto",
+    ) -> tuple[list[Analysis], list[MarketMatch]]:
+        """Build analyses from snapshots and recorded matches.
+
+        Does no I/O, so it can run in worker processes. Each snapshot
+        sees only the matches in ``recorded``, never ones found earlier
+        in the same batch, which keeps results independent of sharding.
+
+        Args:
+            snapshots: Snapshots to analyze, one analysis each
+            recorded: Recorded matches keyed by event_id
+            engine: "auto", "numpy" or "python"
+
+        Returns:
+            (analyses in snapshot order, newly found market matches)
+        """
+        # Resolve markets per snapshot; collect events with usable odds
+        rows: list[tuple[int, dict[str, Any], dict[str, Any] | None]] = []
+        new_matches: list[MarketMatch] = []
+        for position, snapshot in enumerate(snapshots):
+            odds_events = snapshot.normalized_fields.get("odds_api_events", [])
+            if not odds_events:
+                continue
+            kalshi_markets = snapshot.normalized_fields.get("kalshi_markets", [])
+            event_markets, found = self._resolve_markets(odds_events, kalshi_markets, recorded)
+            new_matches.extend(found)
+            rows.extend(
+                (position, event, market)
+                for event, market in zip(odds_events, event_markets, strict=True)
+                if _has_odds(event)
+            )
+
+        columns = compute_edges(
+            [event["best_home_odds"] for _, event, _ in rows],
+            [event["best_away_odds"] for _, event, _ in rows],
+            [market.get("implied_probability") if market else None for _, _, market in rows],
+            engine=engine,
+        )
+
+        comparisons: dict[int, list[dict[str, Any]]] = {}
+        for i, (position, event, market) in enumerate(rows):
+            comparisons.setdefault(position, []).append(
+                self._build_comparison(
+                    event,
+                    market,
+                    columns.vegas_home_prob[i],
+                    columns.vegas_away_prob[i],
+                    columns.vegas_vig[i],
+                    columns.home_delta[i],
+                )
+            )
+
         analyses = []
-        for snapshot in latest_by_game.values():
-            analysis = self.analyze_snapshot(snapshot)
-            if analysis:
+        for position, snapshot in enumerate(snapshots):
+            analysis = self._build_analysis(snapshot, comparisons.get(position, []))
+            if analysis is not None:
                 analyses.append(analysis)
 
-        return analyses
+        return analyses, new_matches
+
+    def _build_analysis(
+        self,
+        snapshot: InfoSnapshot,
+        comparisons: list[dict[str, Any]],
+        parent_analysis_id: str | None = None,
+    ) -> Analysis | None:
+        """Assemble an Analysis from a snapshot's comparisons.
+
+        Args:
+            snapshot: Analyzed snapshot
+            comparisons: Comparisons for the snapshot's events
+            parent_analysis_id: Optional parent for DAG lineage
+
+        Returns:
+            Analysis, or None if there are no comparisons
+        """
+        if not comparisons:
+            return None
+
+        # Track significant edges (> 3% delta)
+        edges_found = [c for c in comparisons if c.get("edge_magnitude", 0) > 0.03]
+
+        # Build derived features
+        derived_features = {
+            "analysis_type": "kalshi_vs_vegas_with_vig",
+            "snapshot_collected_at": snapshot.collected_at.isoformat(),
+            "game_count": len(snapshot.normalized_fields.get("odds_api_events", [])),
+            "matched_count": len(comparisons),
+            "comparisons": comparisons,
+            "edge_threshold": 0.03,
+            "edges_above_threshold": len(edges_found),
+        }
+
+        # Build conclusions
+        conclusions = self._build_conclusions(comparisons, edges_found)
+
+        # Build recommended actions
+        recommended_actions = self._build_recommendations(edges_found)
+
+        return Analysis.create(
+            analysis_version=ANALYSIS_VERSION,
+            code_version=self._code_version,
+            input_snapshot_ids=[snapshot.snapshot_id],
+            derived_features=derived_features,
+            conclusions=conclusions,
+            recommended_actions=recommended_actions,
+            parent_analysis_id=parent_analysis_id,
+        )
+
+    def _resolve_markets(
+        self,
+        odds_events: list[dict[str, Any]],
+        kalshi_markets: list[dict[str, Any]],
+        recorded: dict[str, MarketMatch],
+    ) -> tuple[list[dict[str, Any] | None], list[MarketMatch]]:
+        """Find the Kalshi market for each odds event.
+
+        Recorded matches are used when their market is on the board;
+        otherwise events are matched by team name and new matches are
+        returned for recording.
+
+        Args:
+            odds_events: Normalized odds API events
+            kalshi_markets: List of normalized Kalshi markets
+            recorded: Recorded matches keyed by event_id
+
+        Returns:
+            (market or None for each event, matches not yet recorded)
+        """
+        markets_by_id = {m["market_id"]: m for m in kalshi_markets if m.get("market_id")}
+        matched_at = datetime.now(timezone.utc)
+
+        resolved: list[dict[str, Any] | None] = []
+        new_matches: list[MarketMatch] = []
+        for event in odds_events:
+            event_id = event.get("event_id")
+            home_team = event.get("home_team", "")
+            away_team = event.get("away_team", "")
+
+            stored = recorded.get(event_id) if event_id else None
+            if stored is not None and stored.market_id in markets_by_id:
+                resolved.append(markets_by_id[stored.market_id])
+                continue
+
+            found = self._matcher.find(
+                home_team, away_team, kalshi_markets, event.get("sport_key")
+            )
+            resolved.append(found.market if found else None)
+
+            market_id = found.market.get("market_id") if found else None
+            if found and event_id and market_id:
+                new_matches.append(
+                    MarketMatch(
+                        event_id=event_id,
+                        market_id=market_id,
+                        home_team=home_team,
+                        away_team=away_team,
+                        market_title=found.market.get("title"),
+                        method=found.method,
+                        confidence=found.confidence,
+                        matched_at=matched_at,
+                    )
+                )
+
+        return resolved, new_matches
 
     def _compare_event_to_kalshi(
         self,
         event: dict[str, Any],
-        kalshi_markets: list[dict[str, Any]],
+        kalshi_match: dict[str, Any] | None,
     ) -> dict[str, Any] | None:
-        """Compare a single odds event to Kalshi markets.
+        """Compare a single odds event to its Kalshi market.
 
-        Matches by team names and computes probability deltas.
+        Computes probability deltas against the matched market.
 
         Args:
             event: Normalized odds API event
-            kalshi_markets: List of normalized Kalshi markets
+            kalshi_match: Matched Kalshi market, if any
 
         Returns:
-            Comparison dict or None if no match
+            Comparison dict or None if the event has no usable odds
         """
-        home_team = event.get("home_team", "")
-        away_team = event.get("away_team", "")
-        best_home_odds = event.get("best_home_odds")
-        best_away_odds = event.get("best_away_odds")
-
-        if not home_team or not best_home_odds or not best_away_odds:
+        if not _has_odds(event):
             return None
 
         # Vegas implied probabilities WITH vig (raw)
-        vegas_home_prob = american_to_probability(best_home_odds)
-        vegas_away_prob = american_to_probability(best_away_odds)
+        vegas_home_prob = american_to_probability(event["best_home_odds"])
+        vegas_away_prob = american_to_probability(event["best_away_odds"])
         vegas_total = vegas_home_prob + vegas_away_prob  # Should be > 1 (vig)
         vegas_vig = vegas_total - 1.0
 
-        # Try to find matching Kalshi market
-        kalshi_match = self._find_kalshi_match(home_team, away_team, kalshi_markets)
+        # Compute edge: Kalshi vs Vegas (with vig)
+        # Positive delta = Kalshi higher than Vegas
+        # Negative delta = Kalshi lower than Vegas
+        kalshi_prob = kalshi_match.get("implied_probability") if kalshi_match else None
+        home_delta = kalshi_prob - vegas_home_prob if kalshi_prob is not None else None
+
+        return self._build_comparison(
+            event, kalshi_match, vegas_home_prob, vegas_away_prob, vegas_vig, home_delta
+        )
 
+    def _build_comparison(
+        self,
+        event: dict[str, Any],
+        kalshi_match: dict[str, Any] | None,
+        vegas_home_prob: float,
+        vegas_away_prob: float,
+        vegas_vig: float,
+        home_delta: float | None,
+    ) -> dict[str, Any]:
+        """Build the comparison dict from computed probabilities.
+
+        Shared by the per-event and batch paths so both round identically.
+
+        Args:
+            event: Normalized odds API event
+            kalshi_match: Matched Kalshi market, if any
+            vegas_home_prob: Home implied probability (with vig)
+            vegas_away_prob: Away implied probability (with vig)
+            vegas_vig: Bookmaker vig
+            home_delta: Kalshi minus Vegas home probability, if priced
+
+        Returns:
+            Comparison dict
+        """
         comparison: dict[str, Any] = {
             "event_id": event.get("event_id"),
-            "home_team": home_team,
-            "away_team": away_team,
+            "home_team": event.get("home_team", ""),
+            "away_team": event.get("away_team", ""),
             "commence_time": event.get("commence_time"),
             "game_status": event.get("game_status", "pre_game"),
             # Vegas data (with vig)
-            "vegas_home_odds": best_home_odds,
-            "vegas_away_odds": best_away_odds,
+            "vegas_home_odds": event.get("best_home_odds"),
+            "vegas_away_odds": event.get("best_away_odds"),
             "vegas_home_prob": round(vegas_home_prob, 4),
             "vegas_away_prob": round(vegas_away_prob, 4),
             "vegas_vig": round(vegas_vig, 4),
@@ -251,19 +504,13 @@ class AnalysisService:
         }
 
         if kalshi_match:
-            kalshi_prob = kalshi_match.get("implied_probability")
-            if kalshi_prob is not None:
-                # Compute edge: Kalshi vs Vegas (with vig)
-                # Positive delta = Kalshi higher than Vegas
-                # Negative delta = Kalshi lower than Vegas
-                home_delta = kalshi_prob - vegas_home_prob
-
+            if home_delta is not None:
                 comparison.update({
                     "kalshi_market_id": kalshi_match.get("market_id"),
                     "kalshi_title": kalshi_match.get("title"),
                     "kalshi_yes_bid": kalshi_match.get("yes_bid"),
                     "kalshi_yes_ask": kalshi_match.get("yes_ask"),
-                    "kalshi_implied_prob": round(kalshi_prob, 4),
+                    "kalshi_implied_prob": round(kalshi_match["implied_probability"], 4),
                     "kalshi_volume": kalshi_match.get("volume"),
                     # Edge metrics
                     "delta_home": round(home_delta, 4),
@@ -281,77 +528,6 @@ class AnalysisService:
 
         return comparison
 
-    def _find_kalshi_match(
-        self,
-        home_team: str,
-        away_team: str,
-        kalshi_markets: list[dict[str, Any]],
-    ) -> dict[str, Any] | None:
-        """Find Kalshi market matching the given teams.
-
-        Searches market titles for team name matches.
-
-        Args:
-            home_team: Home team name
-            away_team: Away team name
-            kalshi_markets: List of Kalshi markets
-
-        Returns:
-            Matching market or None
-        """
-        home_lower = home_team.lower()
-        away_lower = away_team.lower()
-
-        # Extract key words from team names (e.g., "Lakers" from "Los Angeles Lakers")
-        home_keywords = self._extract_team_keywords(home_team)
-        away_keywords = self._extract_team_keywords(away_team)
-
-        for market in kalshi_markets:
-            title = (market.get("title") or "").lower()
-
-            # Check if market title contains both teams
-            home_found = any(kw in title for kw in home_keywords)
-            away_found = any(kw in title for kw in away_keywords)
-
-            if home_found and away_found:
-                return market
-
-            # Also try full team names
-            if home_lower in title and away_lower in title:
-                return market
-
-        return None
-
-    def _extract_team_keywords(self, team_name: str) -> list[str]:
-        """Extract searchable keywords from team name.
-
-        Args:
-            team_name: Full team name (e.g., "Los Angeles Lakers")
-
-        Returns:
-            List of keywords to search for
-        """
-        words = team_name.lower().split()
-        keywords = [team_name.lower()]
-
-        # Common city names to skip
-        cities = {
-            "los", "angeles", "new", "york", "san", "francisco", "antonio",
-            "golden", "state", "oklahoma", "city", "portland", "trail",
-            "minnesota", "indiana", "milwaukee", "philadelphia", "phoenix",
-            "detroit", "chicago", "boston", "miami", "orlando", "charlotte",
-            "atlanta", "cleveland", "toronto", "brooklyn", "washington",
-            "denver", "utah", "sacramento", "memphis", "dallas", "houston",
-        }
-
-        # Get the last word (usually the team nickname)
-        if words:
-            last_word = words[-1]
-            if last_word not in cities:
-                keywords.append(last_word)
-
-        return keywords
-
     def _build_conclusions(
         self,
         comparisons: list[dict[str, Any]],
@@ -486,3 +662,22 @@ class AnalysisService:
             recommendations.append(action)
 
         return recommendations
+
+
+# Per-process service used by _build_shard (set by _init_worker)
+_worker_service: AnalysisService | None = None
+
+
+def _init_worker(settings: Settings, code_version: str) -> None:
+    """Create the worker process's AnalysisService."""
+    global _worker_service
+    _worker_service = AnalysisService(settings, code_version=code_version)
+
+
+def _build_shard(
+    shard: tuple[list[InfoSnapshot], dict[str, MarketMatch], str],
+) -> tuple[list[Analysis], list[MarketMatch]]:
+    """Build one shard of analyses (runs in a worker process)."""
+    assert _worker_service is not None
+    snapshots, recorded, engine = shard
+    return _worker_service.build_batch(snapshots, recorded, engine)
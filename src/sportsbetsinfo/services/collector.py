@@ -6,15 +6,73 @@ immutable snapshots with proper versioning.
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from typing import Any
 
 from sportsbetsinfo.clients.kalshi import KalshiClient
 from sportsbetsinfo.clients.odds_api import OddsAPIClient
 from sportsbetsinfo.config.settings import Settings
-from sportsbetsinfo.core.models import InfoSnapshot, SourceVersions
-from sportsbetsinfo.db.connection import get_connection
-from sportsbetsinfo.db.repositories.snapshot import SnapshotRepository
+from sportsbetsinfo.core.hashing import compute_content_hash
+from sportsbetsinfo.core.models import InfoSnapshot, SnapshotHeartbeat, SourceVersions
+from sportsbetsinfo.db.connection import get_connection_manager
+from sportsbetsinfo.db.repositories.snapshot import SnapshotRepository, SnapshotView
+from sportsbetsinfo.services.polling import MovementTracker
+from sportsbetsinfo.services.upstream import create_kalshi_client, create_odds_api_client
+
+# Games whose latest snapshot is kept in memory for change-only snapshotting
+_LATEST_CACHE_SIZE = 512
+
+
+def _tipoffs(events: list[dict[str, Any]]) -> list[datetime]:
+    """Commence times of normalized odds events."""
+    times = []
+    for event in events:
+        commence_time = event.get("commence_time")
+        if commence_time:
+            times.append(datetime.fromisoformat(commence_time.replace("Z", "+00:00")))
+    return times
+
+
+@dataclass
+class CycleBoards:
+    """Upstream boards fetched once per collection cycle.
+
+    Every per-game snapshot in a cycle is built from the same boards
+    instead of re-requesting them from each API.
+    """
+
+    sport: str
+    kalshi_payload: dict[str, Any] | None = None
+    kalshi_markets: list[dict[str, Any]] = field(default_factory=list)
+    kalshi_error: str | None = None
+    odds_payload: dict[str, Any] | None = None
+    odds_events: list[dict[str, Any]] = field(default_factory=list)
+    odds_error: str | None = None
+
+
+@dataclass(frozen=True)
+class CollectorStats:
+    """Upstream request and quota counters for a collector session."""
+
+    kalshi_requests: int
+    odds_api_requests: int
+    odds_api_requests_remaining: int | None
+    odds_api_requests_used: int | None
+    boards_fetched: int
+    snapshots_created: int
+    kalshi_cache_hits: int = 0
+    odds_api_cache_hits: int = 0
+    kalshi_retries: int = 0
+    odds_api_retries: int = 0
+    snapshots_unchanged: int = 0
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Share of polls stored as heartbeats instead of full snapshots."""
+        polls = self.snapshots_created + self.snapshots_unchanged
+        return self.snapshots_unchanged / polls if polls else 0.0
 
 
 class DataCollector:
@@ -31,18 +89,22 @@ class DataCollector:
             settings: Application settings
         """
         self.settings = settings
+        self._db = get_connection_manager(settings.db_path)
         self._kalshi: KalshiClient | None = None
         self._odds_api: OddsAPIClient | None = None
+        self._boards_fetched = 0
+        self._snapshots_created = 0
+        self._snapshots_unchanged = 0
+        # Latest (content hash, snapshot) per game, for change-only snapshotting
+        self._latest: OrderedDict[str, tuple[str, InfoSnapshot]] = OrderedDict()
+        # Line volatility per game, from the snapshots this collector takes
+        self.movement = MovementTracker()
 
     async def __aenter__(self) -> DataCollector:
         """Enter async context, initialize API clients."""
         if self.settings.kalshi_configured:
             try:
-                self._kalshi = KalshiClient(
-                    api_key=self.settings.kalshi_api_key,
-                    private_key_path=self.settings.kalshi_private_key_path,
-                    rate_limit=self.settings.kalshi_rate_limit,
-                )
+                self._kalshi = create_kalshi_client(self.settings)
                 await self._kalshi.__aenter__()
                 await self._kalshi.authenticate()
             except Exception:
@@ -52,10 +114,7 @@ class DataCollector:
                 self._kalshi = None
 
         if self.settings.odds_api_configured:
-            self._odds_api = OddsAPIClient(
-                api_key=self.settings.odds_api_key,
-                rate_limit=self.settings.odds_api_rate_limit,
-            )
+            self._odds_api = create_odds_api_client(self.settings)
             await self._odds_api.__aenter__()
 
         return self
@@ -67,16 +126,128 @@ class DataCollector:
         if self._odds_api:
             await self._odds_api.__aexit__(*args)
 
+    @property
+    def stats(self) -> CollectorStats:
+        """Current upstream request and quota counters."""
+        return CollectorStats(
+            kalshi_requests=self._kalshi.request_count if self._kalshi else 0,
+            odds_api_requests=self._odds_api.request_count if self._odds_api else 0,
+            odds_api_requests_remaining=(
+                self._odds_api.requests_remaining if self._odds_api else None
+            ),
+            odds_api_requests_used=(
+                self._odds_api.requests_used if self._odds_api else None
+            ),
+            boards_fetched=self._boards_fetched,
+            snapshots_created=self._snapshots_created,
+            kalshi_cache_hits=self._kalshi.cache_hits if self._kalshi else 0,
+            odds_api_cache_hits=self._odds_api.cache_hits if self._odds_api else 0,
+            kalshi_retries=self._kalshi.retry_count if self._kalshi else 0,
+            odds_api_retries=self._odds_api.retry_count if self._odds_api else 0,
+            snapshots_unchanged=self._snapshots_unchanged,
+        )
+
+    async def fetch_boards(
+        self,
+        sport: str = "basketball_nba",
+        include_kalshi: bool = True,
+        include_odds: bool = True,
+        kalshi_series: list[str] | None = None,
+    ) -> CycleBoards:
+        """Fetch each upstream board exactly once for a collection cycle.
+
+        Args:
+            sport: Sport key for The Odds API
+            include_kalshi: Whether to fetch the Kalshi market board
+            include_odds: Whether to fetch The Odds API odds board
+            kalshi_series: Kalshi series to fetch concurrently (default:
+                the series derived from ``sport``)
+
+        Returns:
+            CycleBoards shared by every snapshot in the cycle
+        """
+        boards = CycleBoards(sport=sport)
+
+        if include_kalshi and self._kalshi:
+            try:
+                await self._fetch_kalshi_board(
+                    boards, kalshi_series or [sport.upper().split("_")[-1]]
+                )
+                self._boards_fetched += 1
+            except Exception as e:
+                boards.kalshi_error = str(e)
+
+        if include_odds and self._odds_api:
+            budget = self._odds_api.budget
+            try:
+                odds_data = await self._odds_api.get_markets(
+                    sport=sport,
+                    markets="h2h,spreads,totals",
+                    priority=budget.priority_for(sport) if budget else None,
+                )
+                boards.odds_payload = odds_data
+                boards.odds_events = [
+                    self._odds_api.normalize_event_data(event)
+                    for event in odds_data.get("events", [])
+                ]
+                self._boards_fetched += 1
+                if budget is not None:
+                    budget.note_tipoffs(sport, _tipoffs(boards.odds_events))
+            except Exception as e:
+                boards.odds_error = str(e)
+
+        return boards
+
+    async def _fetch_kalshi_board(self, boards: CycleBoards, series_tickers: list[str]) -> None:
+        """Page through the Kalshi board, normalizing each page as it arrives.
+
+        With several series, pages are fetched concurrently and the board
+        is assembled in ``series_tickers`` order so it is deterministic.
+
+        Args:
+            boards: Boards to fill in
+            series_tickers: Kalshi series tickers
+        """
+        kalshi = self._kalshi
+        assert kalshi is not None
+        raw: dict[str, list[dict[str, Any]]] = {ticker: [] for ticker in series_tickers}
+        normalized: dict[str, list[dict[str, Any]]] = {ticker: [] for ticker in series_tickers}
+        pages = 0
+
+        def add_page(series_ticker: str, page: dict[str, Any]) -> None:
+            markets = page.get("markets") or []
+            raw[series_ticker].extend(markets)
+            normalized[series_ticker].extend(kalshi.normalize_market_data(m) for m in markets)
+
+        if len(series_tickers) == 1:
+            async for page in kalshi.iter_market_pages(series_ticker=series_tickers[0]):
+                add_page(series_tickers[0], page)
+                pages += 1
+        else:
+            async for series_ticker, page in kalshi.iter_markets_by_series(series_tickers):
+                add_page(series_ticker, page)
+                pages += 1
+
+        # Raw markets are kept for snapshot provenance, merged into one response
+        boards.kalshi_payload = {
+            "markets": [m for ticker in series_tickers for m in raw[ticker]],
+            "cursor": "",
+            "pages": pages,
+        }
+        boards.kalshi_markets = [m for ticker in series_tickers for m in normalized[ticker]]
+
     async def collect_snapshot(
         self,
         game_id: str,
         sport: str = "basketball_nba",
+        boards: CycleBoards | None = None,
     ) -> InfoSnapshot:
         """Collect data and create a snapshot for a game.
 
         Args:
             game_id: Unique game identifier
             sport: Sport key for The Odds API
+            boards: Boards already fetched this cycle (fetched if omitted)
 
         Returns:
             Created InfoSnapshot
@@ -86,70 +257,27 @@ class DataCollector:
         """
         collected_at = datetime.now(timezone.utc)
 
+        if boards is None:
+            boards = await self.fetch_boards(sport)
+
         # Collect raw data from each source
         raw_payloads: dict[str, Any] = {}
         normalized_fields: dict[str, Any] = {}
 
         # Kalshi data
-        if self._kalshi:
-            try:
-                kalshi_data = await self._kalshi.get_markets(
-                    series_ticker=sport.upper().split("_")[-1]
-                )
-                raw_payloads["kalshi"] = kalshi_data
-
-                # Normalize Kalshi markets
-                kalshi_normalized = []
-                for market in kalshi_data.get("markets", []):
-                    kalshi_normalized.append(
-                        self._kalshi.normalize_market_data(market)
-                    )
-                normalized_fields["kalshi_markets"] = kalshi_normalized
-            except Exception as e:
-                raw_payloads["kalshi_error"] = str(e)
+        self._add_kalshi_board(boards, raw_payloads, normalized_fields)
 
         # The Odds API data
-        if self._odds_api:
-            try:
-                odds_data = await self._odds_api.get_markets(
-                    sport=sport,
-                    markets="h2h,spreads,totals",
-                )
-                raw_payloads["odds_api"] = odds_data
-
-                # Normalize events
-                odds_normalized = []
-                for event in odds_data.get("events", []):
-                    odds_normalized.append(
-                        self._odds_api.normalize_event_data(event)
-                    )
-                normalized_fields["odds_api_events"] = odds_normalized
-                normalized_fields["odds_api_requests_remaining"] = (
-                    self._odds_api.requests_remaining
-                )
-            except Exception as e:
-                raw_payloads["odds_api_error"] = str(e)
-
-        # Create source versions
-        source_versions = SourceVersions(
-            kalshi=self._kalshi.get_version() if self._kalshi else "",
-            odds_api=self._odds_api.get_version() if self._odds_api else "",
-        )
-
-        # Create and save snapshot
-        snapshot = InfoSnapshot.create(
-            game_id=game_id,
-            collected_at=collected_at,
-            schema_version=self.settings.schema_version,
-            source_versions=source_versions,
-            raw_payloads=raw_payloads,
-            normalized_fields=normalized_fields,
-        )
+        if boards.odds_payload is not None:
+            raw_payloads["odds_api"] = boards.odds_payload
+            normalized_fields["odds_api_events"] = boards.odds_events
+            normalized_fields["odds_api_requests_remaining"] = (
+                self._odds_api.requests_remaining if self._odds_api else None
+            )
+        elif boards.odds_error is not None:
+            raw_payloads["odds_api_error"] = boards.odds_error
 
-        # Persist to database
-        with get_connection(self.settings.db_path) as conn:
-            repo = SnapshotRepository(conn)
-            return repo.insert(snapshot)
+        return self._save_snapshot(game_id, collected_at, raw_payloads, normalized_fields)
 
     async def collect_bulk_snapshots(
         self,
@@ -157,7 +285,8 @@ class DataCollector:
     ) -> list[InfoSnapshot]:
         """Collect snapshots for all upcoming events in a sport.
 
-        Creates one snapshot per event found.
+        Creates one snapshot per event found. Both upstream boards are
+        fetched once and shared by every snapshot in the cycle.
 
         Args:
             sport: Sport key for The Odds API
@@ -168,19 +297,18 @@ class DataCollector:
         if not self._odds_api:
             return []
 
-        # Get all upcoming events
-        odds_data = await self._odds_api.get_markets(
-            sport=sport,
-            markets="h2h,spreads,totals",
-        )
+        boards = await self.fetch_boards(sport)
+        if boards.odds_payload is None:
+            return []
 
         snapshots = []
-        for event in odds_data.get("events", []):
+        for event in boards.odds_payload.get("events", []):
             event_id = event.get("id")
             if event_id:
                 snapshot = await self.collect_snapshot(
                     game_id=event_id,
                     sport=sport,
+                    boards=boards,
                 )
                 snapshots.append(snapshot)
 
@@ -195,7 +323,8 @@ class DataCollector:
         """Collect snapshots for all games on a specific date.
 
         Fetches events from The Odds API (including scores for completed games)
-        and creates a snapshot for each game on the target date.
+        and creates a snapshot for each game on the target date. The Kalshi
+        board is fetched once for the whole cycle and shared by every game.
 
         Args:
             target_date: Date to collect games for (UTC). Defaults to today.
@@ -219,8 +348,8 @@ class DataCollector:
             days_from=3,  # Look back 3 days for completed games
         )
 
-        # Create snapshot for each game
-        snapshots = []
+        # Select the games to snapshot
+        selected: list[dict[str, Any]] = []
         seen_matchups: set[str] = set()  # Deduplicate by team matchup
 
         for event in day_events:
@@ -238,7 +367,17 @@ class DataCollector:
             if not include_completed and event.get("completed"):
                 continue
 
-            snapshot = await self._collect_snapshot_for_event(event, sport)
+            selected.append(event)
+
+        if not selected:
+            return []
+
+        # Fetch the Kalshi board once and fan it out to every game
+        boards = await self.fetch_boards(sport, include_odds=False)
+
+        snapshots = []
+        for event in selected:
+            snapshot = await self._collect_snapshot_for_event(event, sport, boards)
             snapshots.append(snapshot)
 
         return snapshots
@@ -247,12 +386,14 @@ class DataCollector:
         self,
         event: dict[str, Any],
         sport: str,
+        boards: CycleBoards | None = None,
     ) -> InfoSnapshot:
         """Create a snapshot for a specific event with full data.
 
         Args:
             event: Event data from get_events_with_scores
             sport: Sport key
+            boards: Boards already fetched this cycle (Kalshi fetched if omitted)
 
         Returns:
             Created InfoSnapshot
@@ -260,6 +401,9 @@ class DataCollector:
         collected_at = datetime.now(timezone.utc)
         event_id = event.get("id", "unknown")
 
+        if boards is None:
+            boards = await self.fetch_boards(sport, include_odds=False)
+
         # Collect raw data
         raw_payloads: dict[str, Any] = {"odds_api_event": event}
         normalized_fields: dict[str, Any] = {}
@@ -270,29 +414,68 @@ class DataCollector:
         normalized_fields["odds_api_requests_remaining"] = self._odds_api.requests_remaining
 
         # Kalshi data (if available)
-        if self._kalshi:
-            try:
-                kalshi_data = await self._kalshi.get_markets(
-                    series_ticker=sport.upper().split("_")[-1]
-                )
-                raw_payloads["kalshi"] = kalshi_data
-                kalshi_normalized = [
-                    self._kalshi.normalize_market_data(market)
-                    for market in kalshi_data.get("markets", [])
-                ]
-                normalized_fields["kalshi_markets"] = kalshi_normalized
-            except Exception as e:
-                raw_payloads["kalshi_error"] = str(e)
+        self._add_kalshi_board(boards, raw_payloads, normalized_fields)
+
+        return self._save_snapshot(event_id, collected_at, raw_payloads, normalized_fields)
+
+    def _add_kalshi_board(
+        self,
+        boards: CycleBoards,
+        raw_payloads: dict[str, Any],
+        normalized_fields: dict[str, Any],
+    ) -> None:
+        """Attach the shared Kalshi board (or its fetch error) to a snapshot."""
+        if boards.kalshi_payload is not None:
+            raw_payloads["kalshi"] = boards.kalshi_payload
+            normalized_fields["kalshi_markets"] = boards.kalshi_markets
+        elif boards.kalshi_error is not None:
+            raw_payloads["kalshi_error"] = boards.kalshi_error
+
+    def _save_snapshot(
+        self,
+        game_id: str,
+        collected_at: datetime,
+        raw_payloads: dict[str, Any],
+        normalized_fields: dict[str, Any],
+    ) -> InfoSnapshot:
+        """Create a snapshot with current source versions and persist it.
+
+        With settings.change_only_snapshots, a poll whose normalized
+        content matches the game's latest snapshot is stored as a
+        heartbeat pointing at that snapshot instead of a full row.
+
+        Args:
+            game_id: Game identifier
+            collected_at: When the data was collected
+            raw_payloads: Raw API responses
+            normalized_fields: Normalized fields
 
-        # Create source versions
+        Returns:
+            Persisted InfoSnapshot (the unchanged one for a heartbeat)
+        """
         source_versions = SourceVersions(
             kalshi=self._kalshi.get_version() if self._kalshi else "",
             odds_api=self._odds_api.get_version() if self._odds_api else "",
         )
+        self.movement.observe(game_id, collected_at, normalized_fields)
+        content_hash = compute_content_hash(normalized_fields)
+
+        if self.settings.change_only_snapshots:
+            unchanged = self._unchanged_snapshot(game_id, content_hash, source_versions)
+            if unchanged is not None:
+                heartbeat = SnapshotHeartbeat(
+                    game_id=game_id,
+                    observed_at=collected_at,
+                    snapshot_id=unchanged.snapshot_id,
+                    content_hash=content_hash,
+                )
+                with self._db.write() as conn:
+                    SnapshotRepository(conn).insert_heartbeat(heartbeat)
+                self._snapshots_unchanged += 1
+                return unchanged
 
-        # Create and save snapshot
         snapshot = InfoSnapshot.create(
-            game_id=event_id,
+            game_id=game_id,
             collected_at=collected_at,
             schema_version=self.settings.schema_version,
             source_versions=source_versions,
@@ -301,9 +484,63 @@ class DataCollector:
         )
 
         # Persist to database
-        with get_connection(self.settings.db_path) as conn:
-            repo = SnapshotRepository(conn)
-            return repo.insert(snapshot)
+        with self._db.write() as conn:
+            repo = SnapshotRepository(
+                conn, keyframe_interval=self.settings.snapshot_keyframe_interval or None
+            )
+            saved = repo.insert(snapshot)
+
+        self._snapshots_created += 1
+        self._remember(game_id, content_hash, saved)
+        return saved
+
+    def _unchanged_snapshot(
+        self, game_id: str, content_hash: str, source_versions: SourceVersions
+    ) -> InfoSnapshot | None:
+        """Get the game's latest snapshot if a poll with this content would repeat it.
+
+        Args:
+            game_id: Game identifier
+            content_hash: compute_content_hash of the poll's normalized fields
+            source_versions: Source versions of the poll
+
+        Returns:
+            The latest snapshot, or None if the poll has new content
+        """
+        latest = self._latest.get(game_id)
+        if latest is None:
+            # First poll of this game in this session: compare with the database
+            with self._db.read() as conn:
+                repo = SnapshotRepository(conn)
+                stored = repo.get_latest_normalized_fields(game_id)
+                if stored is None or compute_content_hash(stored[1]) != content_hash:
+                    return None
+                snapshot = repo.get_by_id(stored[0])
+            if snapshot is None:
+                return None
+            latest = self._remember(game_id, content_hash, snapshot)
+        else:
+            self._latest.move_to_end(game_id)
+
+        latest_hash, snapshot = latest
+        if (
+            latest_hash != content_hash
+            or snapshot.schema_version != self.settings.schema_version
+            or snapshot.source_versions != source_versions
+        ):
+            return None
+        return snapshot
+
+    def _remember(
+        self, game_id: str, content_hash: str, snapshot: InfoSnapshot
+    ) -> tuple[str, InfoSnapshot]:
+        """Cache a game's latest snapshot (bounded LRU)."""
+        entry = (content_hash, snapshot)
+        self._latest[game_id] = entry
+        self._latest.move_to_end(game_id)
+        if len(self._latest) > _LATEST_CACHE_SIZE:
+            self._latest.popitem(last=False)
+        return entry
 
     def get_latest_snapshot(self, game_id: str) -> InfoSnapshot | None:
         """Get the most recent snapshot for a game.
@@ -314,25 +551,42 @@ class DataCollector:
         Returns:
             Most recent snapshot or None
         """
-        with get_connection(self.settings.db_path) as conn:
+        with self._db.read() as conn:
             repo = SnapshotRepository(conn)
             return repo.get_latest_by_game_id(game_id)
 
-    def get_snapshot_timeline(self, game_id: str) -> list[InfoSnapshot]:
-        """Get all snapshots for a game in chronological order.
+    def get_last_collected_at(self, game_ids: list[str]) -> dict[str, datetime]:
+        """Get when each game was last snapshotted.
+
+        Args:
+            game_ids: Game identifiers
+
+        Returns:
+            Dictionary mapping game_id to last collection time
+        """
+        if not game_ids:
+            return {}
+        with self._db.read() as conn:
+            repo = SnapshotRepository(conn)
+            return repo.get_last_collected_at(game_ids)
+
+    def get_snapshot_timeline(self, game_id: str, limit: int = 100) -> list[SnapshotView]:
+        """Get a game's timeline in chronological order.
 
         This represents the "timeline of belief states" - what we
-        knew at each point in time.
+        knew at each point in time. Polls stored as heartbeats appear
+        as views of the snapshot they saw again, at the poll's time.
 
         Args:
             game_id: Game identifier
+            limit: Maximum number of entries (the most recent are kept)
 
         Returns:
-            List of snapshots ordered by collected_at
+            List of SnapshotView ordered by collected_at
         """
-        with get_connection(self.settings.db_path) as conn:
+        with self._db.read() as conn:
             repo = SnapshotRepository(conn)
-            return repo.get_by_game_id(game_id)
+            return repo.get_views_by_game_id(game_id, limit=limit, include_heartbeats=True)
 
     def compute_deltas(
         self,
@@ -7,17 +7,38 @@ how well analyses predicted actual game results.
 from __future__ import annotations
 
 import math
+from dataclasses import dataclass
 from typing import Any
 
 from sportsbetsinfo.config.settings import Settings
-from sportsbetsinfo.core.exceptions import DuplicateEntityError
-from sportsbetsinfo.core.models import Analysis, Evaluation, EvaluationMetrics, Outcome
-from sportsbetsinfo.db.connection import get_connection
+from sportsbetsinfo.core.models import Evaluation, EvaluationMetrics, Outcome
+from sportsbetsinfo.db.connection import get_connection_manager
 from sportsbetsinfo.db.repositories.analysis import AnalysisRepository
-from sportsbetsinfo.db.repositories.evaluation import EvaluationRepository
+from sportsbetsinfo.db.repositories.evaluation import EvaluationRepository, PendingEvaluation
+from sportsbetsinfo.db.repositories.market_match import MarketMatch, MarketMatchRepository
 from sportsbetsinfo.db.repositories.outcome import OutcomeRepository
 
 
+@dataclass(frozen=True)
+class EvaluationPlan:
+    """Pending evaluations computed by EvaluationService.plan_pending().
+
+    Attributes:
+        items: Pending (analysis, game) pairs with their comparisons
+        outcomes: Outcomes for the planned games, keyed by game_id
+        matches: Recorded Kalshi market matches, keyed by game_id
+    """
+
+    items: tuple[PendingEvaluation, ...]
+    outcomes: dict[str, Outcome]
+    matches: dict[str, MarketMatch]
+
+    @property
+    def size(self) -> int:
+        """Number of planned evaluations."""
+        return len(self.items)
+
+
 class EvaluationService:
     """Service for evaluating analyses against actual outcomes.
 
@@ -32,69 +53,59 @@ class EvaluationService:
             settings: Application settings
         """
         self.settings = settings
+        self._db = get_connection_manager(settings.db_path)
 
-    def evaluate_all_pending(self) -> list[Evaluation]:
-        """Evaluate all analyses that have outcomes but no evaluation.
+    def plan_pending(self, limit: int | None = None) -> EvaluationPlan:
+        """Compute the (analysis, game) pairs still needing evaluation.
+
+        Uses one indexed SQL join, so the cost does not depend on how
+        many evaluations already exist.
+
+        Args:
+            limit: Maximum number of pairs to plan (None for all)
 
         Returns:
-            List of created Evaluation objects
+            EvaluationPlan with pending pairs and their outcomes
         """
-        with get_connection(self.settings.db_path) as conn:
-            analysis_repo = AnalysisRepository(conn)
-            outcome_repo = OutcomeRepository(conn)
-            eval_repo = EvaluationRepository(conn)
+        with self._db.read() as conn:
+            pending = EvaluationRepository(conn).get_pending(limit=limit)
+            game_ids = [item.game_id for item in pending]
+            outcomes = OutcomeRepository(conn).get_by_game_ids(game_ids)
+            matches = MarketMatchRepository(conn).get_by_event_ids(game_ids)
+        return EvaluationPlan(items=tuple(pending), outcomes=outcomes, matches=matches)
 
-            # Get all analyses
-            analyses = analysis_repo.get_all(limit=1000)
+    def pending_count(self) -> int:
+        """Get the evaluation backlog size.
 
-            # Get all outcomes
-            outcomes = outcome_repo.get_all(limit=1000)
-            outcomes_by_game = {o.game_id: o for o in outcomes}
+        Returns:
+            Number of (analysis, game) pairs awaiting evaluation
+        """
+        with self._db.read() as conn:
+            return EvaluationRepository(conn).count_pending()
 
-            # Get existing evaluations to avoid duplicates
-            existing_evals = eval_repo.get_all(limit=10000)
-            evaluated_pairs = {
-                (e.analysis_id, e.game_id) for e in existing_evals
-            }
+    def evaluate_all_pending(self, limit: int | None = None) -> list[Evaluation]:
+        """Evaluate all analyses that have outcomes but no evaluation.
 
-        evaluations = []
+        Args:
+            limit: Maximum number of evaluations to create (None for all)
 
-        for analysis in analyses:
-            # Get game_ids from the analysis comparisons
-            comparisons = analysis.derived_features.get("comparisons", [])
+        Returns:
+            List of created Evaluation objects
+        """
+        plan = self.plan_pending(limit=limit)
+
+        evaluations = []
+        for item in plan.items:
+            evaluation = self._evaluate_comparison(
+                analysis_id=item.analysis_id,
+                comparison=item.comparison,
+                outcome=plan.outcomes[item.game_id],
+                market_match=plan.matches.get(item.game_id),
+            )
+            if evaluation:
+                evaluations.append(evaluation)
 
-            for comp in comparisons:
-                game_id = comp.get("event_id")
-                if not game_id:
-                    continue
-
-                # Skip if already evaluated
-                if (analysis.analysis_id, game_id) in evaluated_pairs:
-                    continue
-
-                # Check if we have an outcome
-                outcome = outcomes_by_game.get(game_id)
-                if not outcome:
-                    continue
-
-                # Create evaluation
-                evaluation = self._evaluate_comparison(
-                    analysis=analysis,
-                    comparison=comp,
-                    outcome=outcome,
-                )
-
-                if evaluation:
-                    try:
-                        with get_connection(self.settings.db_path) as conn:
-                            repo = EvaluationRepository(conn)
-                            saved = repo.insert(evaluation)
-                            evaluations.append(saved)
-                            evaluated_pairs.add((analysis.analysis_id, game_id))
-                    except DuplicateEntityError:
-                        pass
-
-        return evaluations
+        return self._save_evaluations(evaluations)
 
     def evaluate_analysis(self, analysis_id: str) -> list[Evaluation]:
         """Evaluate a specific analysis against all available outcomes.
@@ -105,7 +116,7 @@ class EvaluationService:
         Returns:
             List of created Evaluation objects
         """
-        with get_connection(self.settings.db_path) as conn:
+        with self._db.read() as conn:
             analysis_repo = AnalysisRepository(conn)
             outcome_repo = OutcomeRepository(conn)
             eval_repo = EvaluationRepository(conn)
@@ -118,11 +129,12 @@ class EvaluationService:
             existing = eval_repo.get_by_analysis_id(analysis_id)
             evaluated_games = {e.game_id for e in existing}
 
-            outcomes = outcome_repo.get_all(limit=1000)
-            outcomes_by_game = {o.game_id: o for o in outcomes}
+            comparisons = analysis.derived_features.get("comparisons", [])
+            game_ids = [c["event_id"] for c in comparisons if c.get("event_id")]
+            outcomes_by_game = outcome_repo.get_by_game_ids(game_ids)
+            matches_by_game = MarketMatchRepository(conn).get_by_event_ids(game_ids)
 
         evaluations = []
-        comparisons = analysis.derived_features.get("comparisons", [])
 
         for comp in comparisons:
             game_id = comp.get("event_id")
@@ -134,34 +146,52 @@ class EvaluationService:
                 continue
 
             evaluation = self._evaluate_comparison(
-                analysis=analysis,
+                analysis_id=analysis.analysis_id,
                 comparison=comp,
                 outcome=outcome,
+                market_match=matches_by_game.get(game_id),
             )
 
             if evaluation:
-                try:
-                    with get_connection(self.settings.db_path) as conn:
-                        repo = EvaluationRepository(conn)
-                        saved = repo.insert(evaluation)
-                        evaluations.append(saved)
-                except DuplicateEntityError:
-                    pass
+                evaluations.append(evaluation)
+                evaluated_games.add(game_id)
+
+        return self._save_evaluations(evaluations)
+
+    def _save_evaluations(self, evaluations: list[Evaluation]) -> list[Evaluation]:
+        """Persist evaluations in a single batched transaction.
+
+        Evaluations whose content already exists are skipped.
+
+        Args:
+            evaluations: Evaluations to insert
+
+        Returns:
+            Evaluations that were newly inserted
+        """
+        if not evaluations:
+            return []
+
+        with self._db.write() as conn:
+            repo = EvaluationRepository(conn)
+            result = repo.insert_many(evaluations)
 
-        return evaluations
+        return result.inserted
 
     def _evaluate_comparison(
         self,
-        analysis: Analysis,
+        analysis_id: str,
         comparison: dict[str, Any],
         outcome: Outcome,
+        market_match: MarketMatch | None = None,
     ) -> Evaluation | None:
         """Evaluate a single comparison against an outcome.
 
         Args:
-            analysis: The analysis containing the comparison
+            analysis_id: ID of the analysis containing the comparison
             comparison: Single game comparison from derived_features
             outcome: Actual game outcome
+            market_match: Recorded Kalshi market for the game, if any
 
         Returns:
             Evaluation object or None if can't evaluate
@@ -234,12 +264,14 @@ class EvaluationService:
             "final_score": f"{outcome.final_score.away}-{outcome.final_score.home}",
             "vegas_home_prob": vegas_home_prob,
             "kalshi_prob": kalshi_prob,
+            "kalshi_market_id": comparison.get("kalshi_market_id")
+            or (market_match.market_id if market_match else None),
             "delta": comparison.get("delta_home"),
             "edge_direction": comparison.get("edge_direction"),
         }
 
         return Evaluation.create(
-            analysis_id=analysis.analysis_id,
+            analysis_id=analysis_id,
             game_id=game_id,
             metrics=EvaluationMetrics(
                 brier_score=round(brier_score, 6),
@@ -256,7 +288,7 @@ class EvaluationService:
         Returns:
             Dictionary with overall performance stats
         """
-        with get_connection(self.settings.db_path) as conn:
+        with self._db.read() as conn:
             eval_repo = EvaluationRepository(conn)
             aggregates = eval_repo.get_aggregate_metrics()
             evaluations = eval_repo.get_all(limit=10000)
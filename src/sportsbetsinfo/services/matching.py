@@ -0,0 +1,416 @@
+"""Team-name matching between odds events and Kalshi markets.
+
+Market titles are tokenized once per board into an inverted index of
+token n-grams, so matching an event is a handful of dictionary lookups
+instead of substring scans over every title. Indexes are memoized by a
+hash of the board's titles: analyzing many snapshots of the same board
+builds the index once.
+
+Team aliases come from a registry of the professional leagues in
+OddsAPIClient.SPORTS. Teams not in the registry (e.g. college teams)
+fall back to their full name and nickname.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+# Longest alias (in tokens) that can be looked up in a market index
+MAX_NGRAM = 5
+
+# Match methods and their confidence
+METHOD_ALIAS = "alias"
+METHOD_CITY = "city"
+METHOD_CONFIDENCE = {METHOD_ALIAS: 1.0, METHOD_CITY: 0.6}
+
+# (city, nickname) for each team, keyed by The Odds API sport key.
+# Full names match The Odds API's team names.
+_LEAGUE_TEAMS: dict[str, list[tuple[str, str]]] = {
+    "basketball_nba": [
+        ("Atlanta", "Hawks"), ("Boston", "Celtics"), ("Brooklyn", "Nets"),
+        ("Charlotte", "Hornets"), ("Chicago", "Bulls"), ("Cleveland", "Cavaliers"),
+        ("Dallas", "Mavericks"), ("Denver", "Nuggets"), ("Detroit", "Pistons"),
+        ("Golden State", "Warriors"), ("Houston", "Rockets"), ("Indiana", "Pacers"),
+        ("Los Angeles", "Clippers"), ("Los Angeles", "Lakers"), ("Memphis", "Grizzlies"),
+        ("Miami", "Heat"), ("Milwaukee", "Bucks"), ("Minnesota", "Timberwolves"),
+        ("New Orleans", "Pelicans"), ("New York", "Knicks"), ("Oklahoma City", "Thunder"),
+        ("Orlando", "Magic"), ("Philadelphia", "76ers"), ("Phoenix", "Suns"),
+        ("Portland", "Trail Blazers"), ("Sacramento", "Kings"), ("San Antonio", "Spurs"),
+        ("Toronto", "Raptors"), ("Utah", "Jazz"), ("Washington", "Wizards"),
+    ],
+    "americanfootball_nfl": [
+        ("Arizona", "Cardinals"), ("Atlanta", "Falcons"), ("Baltimore", "Ravens"),
+        ("Buffalo", "Bills"), ("Carolina", "Panthers"), ("Chicago", "Bears"),
+        ("Cincinnati", "Bengals"), ("Cleveland", "Browns"), ("Dallas", "Cowboys"),
+        ("Denver", "Broncos"), ("Detroit", "Lions"), ("Green Bay", "Packers"),
+        ("Houston", "Texans"), ("Indianapolis", "Colts"), ("Jacksonville", "Jaguars"),
+        ("Kansas City", "Chiefs"), ("Las Vegas", "Raiders"), ("Los Angeles", "Chargers"),
+        ("Los Angeles", "Rams"), ("Miami", "Dolphins"), ("Minnesota", "Vikings"),
+        ("New England", "Patriots"), ("New Orleans", "Saints"), ("New York", "Giants"),
+        ("New York", "Jets"), ("Philadelphia", "Eagles"), ("Pittsburgh", "Steelers"),
+        ("San Francisco", "49ers"), ("Seattle", "Seahawks"), ("Tampa Bay", "Buccaneers"),
+        ("Tennessee", "Titans"), ("Washington", "Commanders"),
+    ],
+    "baseball_mlb": [
+        ("Arizona", "Diamondbacks"), ("Athletics", "Athletics"), ("Atlanta", "Braves"),
+        ("Baltimore", "Orioles"), ("Boston", "Red Sox"), ("Chicago", "Cubs"),
+        ("Chicago", "White Sox"), ("Cincinnati", "Reds"), ("Cleveland", "Guardians"),
+        ("Colorado", "Rockies"), ("Detroit", "Tigers"), ("Houston", "Astros"),
+        ("Kansas City", "Royals"), ("Los Angeles", "Angels"), ("Los Angeles", "Dodgers"),
+        ("Miami", "Marlins"), ("Milwaukee", "Brewers"), ("Minnesota", "Twins"),
+        ("New York", "Mets"), ("New York", "Yankees"), ("Philadelphia", "Phillies"),
+        ("Pittsburgh", "Pirates"), ("San Diego", "Padres"), ("San Francisco", "Giants"),
+        ("Seattle", "Mariners"), ("St. Louis", "Cardinals"), ("Tampa Bay", "Rays"),
+        ("Texas", "Rangers"), ("Toronto", "Blue Jays"), ("Washington", "Nationals"),
+    ],
+    "icehockey_nhl": [
+        ("Anaheim", "Ducks"), ("Boston", "Bruins"), ("Buffalo", "Sabres"),
+        ("Calgary", "Flames"), ("Carolina", "Hurricanes"), ("Chicago", "Blackhawks"),
+        ("Colorado", "Avalanche"), ("Columbus", "Blue Jackets"), ("Dallas", "Stars"),
+        ("Detroit", "Red Wings"), ("Edmonton", "Oilers"), ("Florida", "Panthers"),
+        ("Los Angeles", "Kings"), ("Minnesota", "Wild"), ("Montréal", "Canadiens"),
+        ("Nashville", "Predators"), ("New Jersey", "Devils"), ("New York", "Islanders"),
+        ("New York", "Rangers"), ("Ottawa", "Senators"), ("Philadelphia", "Flyers"),
+        ("Pittsburgh", "Penguins"), ("San Jose", "Sharks"), ("Seattle", "Kraken"),
+        ("St Louis", "Blues"), ("Tampa Bay", "Lightning"), ("Toronto", "Maple Leafs"),
+        ("Utah", "Mammoth"), ("Vancouver", "Canucks"), ("Vegas", "Golden Knights"),
+        ("Washington", "Capitals"), ("Winnipeg", "Jets"),
+    ],
+}
+
+# Extra aliases by full team name: common short forms and the
+# "<city> <initial>" style used to disambiguate shared cities
+_EXTRA_ALIASES: dict[str, tuple[str, ...]] = {
+    "Los Angeles Clippers": ("LA Clippers", "Los Angeles C"),
+    "Los Angeles Lakers": ("LA Lakers", "Los Angeles L"),
+    "Philadelphia 76ers": ("Sixers",),
+    "Portland Trail Blazers": ("Blazers",),
+    "New York Giants": ("NY Giants", "New York G"),
+    "New York Jets": ("NY Jets", "New York J"),
+    "Los Angeles Chargers": ("LA Chargers", "Los Angeles C"),
+    "Los Angeles Rams": ("LA Rams", "Los Angeles R"),
+    "Chicago Cubs": ("Chicago C",),
+    "Chicago White Sox": ("Chicago WS",),
+    "Los Angeles Angels": ("LA Angels", "Los Angeles A"),
+    "Los Angeles Dodgers": ("LA Dodgers", "Los Angeles D"),
+    "New York Mets": ("NY Mets", "New York M"),
+    "New York Yankees": ("NY Yankees", "New York Y"),
+    "New York Islanders": ("NY Islanders", "New York I"),
+    "New York Rangers": ("NY Rangers", "New York R"),
+    "Utah Mammoth": ("Utah Hockey Club",),
+}
+
+# Words that never identify a team on their own
+_GENERIC_WORDS = frozenset({
+    "central", "east", "eastern", "fort", "la", "las", "los", "new", "north",
+    "northern", "saint", "san", "santa", "south", "southern", "st", "the",
+    "west", "western",
+})
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+Tokens = tuple[str, ...]
+
+
+def tokenize(text: str) -> Tokens:
+    """Normalize text into lowercase ASCII alphanumeric tokens.
+
+    Accents are stripped and punctuation splits tokens, so
+    "Montréal" and "Montreal", or "St. Louis" and "St Louis", match.
+
+    Args:
+        text: Team name or market title
+
+    Returns:
+        Tuple of tokens
+    """
+    ascii_text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return tuple(_NON_ALNUM.sub(" ", ascii_text.lower()).split())
+
+
+@dataclass(frozen=True)
+class TeamAliases:
+    """Token aliases for one team.
+
+    Attributes:
+        strong: Full name, nickname and explicit aliases
+        weak: City or school names, used only if no strong match exists
+    """
+
+    strong: frozenset[Tokens]
+    weak: frozenset[Tokens]
+
+
+class TeamAliasRegistry:
+    """Aliases for every team in the supported leagues."""
+
+    def __init__(
+        self,
+        league_teams: dict[str, list[tuple[str, str]]] | None = None,
+        extra_aliases: dict[str, tuple[str, ...]] | None = None,
+    ) -> None:
+        """Build the registry.
+
+        Args:
+            league_teams: (city, nickname) lists keyed by sport key
+            extra_aliases: Additional aliases keyed by full team name
+        """
+        league_teams = _LEAGUE_TEAMS if league_teams is None else league_teams
+        extra_aliases = _EXTRA_ALIASES if extra_aliases is None else extra_aliases
+
+        self._by_sport: dict[str, dict[Tokens, TeamAliases]] = {}
+        self._any_sport: dict[Tokens, TeamAliases] = {}
+
+        for sport, teams in league_teams.items():
+            # A city shared by two teams in a league is not a usable alias
+            city_counts: dict[Tokens, int] = {}
+            for city, _ in teams:
+                city_counts[tokenize(city)] = city_counts.get(tokenize(city), 0) + 1
+
+            sport_aliases: dict[Tokens, TeamAliases] = {}
+            for city, nickname in teams:
+                full = f"{city} {nickname}" if city != nickname else nickname
+                strong = {tokenize(full), tokenize(nickname)}
+                strong.update(tokenize(a) for a in extra_aliases.get(full, ()))
+                weak = {tokenize(city)} if city_counts[tokenize(city)] == 1 else set()
+                aliases = TeamAliases(frozenset(strong), frozenset(weak - strong))
+                sport_aliases[tokenize(full)] = aliases
+                self._any_sport.setdefault(tokenize(full), aliases)
+            self._by_sport[sport] = sport_aliases
+
+        self._derived: dict[Tokens, TeamAliases] = {}
+
+    @property
+    def sports(self) -> list[str]:
+        """Sport keys with registered teams."""
+        return list(self._by_sport)
+
+    def aliases(self, team_name: str, sport_key: str | None = None) -> TeamAliases:
+        """Get aliases for a team.
+
+        Args:
+            team_name: Full team name as reported by The Odds API
+            sport_key: Odds API sport key, if known
+
+        Returns:
+            TeamAliases (derived from the name if the team is not registered)
+        """
+        tokens = tokenize(team_name)
+        if sport_key is None:
+            found = self._any_sport.get(tokens)
+        else:
+            found = self._by_sport.get(sport_key, {}).get(tokens)
+        if found is not None:
+            return found
+
+        derived = self._derived.get(tokens)
+        if derived is None:
+            derived = self._derive(tokens)
+            self._derived[tokens] = derived
+        return derived
+
+    @staticmethod
+    def _derive(tokens: Tokens) -> TeamAliases:
+        """Aliases for an unregistered team.
+
+        The full name and last word are strong aliases. Since the split
+        between school and nickname is unknown ("Duke Blue Devils",
+        "North Carolina Tar Heels"), every leading prefix is a weak alias
+        except lone words too generic to identify a team.
+        """
+        if not tokens:
+            return TeamAliases(frozenset(), frozenset())
+        strong = {tokens, tokens[-1:]}
+        weak = {
+            tokens[:size]
+            for size in range(1, len(tokens))
+            if size > 1 or tokens[0] not in _GENERIC_WORDS
+        }
+        return TeamAliases(frozenset(strong), frozenset(weak - strong))
+
+
+class MarketIndex:
+    """Inverted index from title n-grams to market positions."""
+
+    def __init__(self, titles: list[str]) -> None:
+        """Index market titles.
+
+        Args:
+            titles: Market titles in board order
+        """
+        self._postings: dict[Tokens, set[int]] = {}
+        for position, title in enumerate(titles):
+            tokens = tokenize(title)
+            for size in range(1, MAX_NGRAM + 1):
+                for start in range(len(tokens) - size + 1):
+                    gram = tokens[start : start + size]
+                    self._postings.setdefault(gram, set()).add(position)
+
+    def positions(self, aliases: frozenset[Tokens]) -> set[int]:
+        """Get positions of markets whose title contains any alias.
+
+        Args:
+            aliases: Token aliases
+
+        Returns:
+            Set of market positions
+        """
+        found: set[int] = set()
+        for alias in aliases:
+            found |= self._postings.get(alias, set())
+        return found
+
+    def find_game(self, home: TeamAliases, away: TeamAliases) -> tuple[int, str] | None:
+        """Find the first market mentioning both teams.
+
+        Strong aliases are tried first; city/school names only when no
+        market mentions both teams by name.
+
+        Args:
+            home: Home team aliases
+            away: Away team aliases
+
+        Returns:
+            (position, method) of the first matching market, or None
+        """
+        home_strong = self.positions(home.strong)
+        away_strong = self.positions(away.strong)
+        both = home_strong & away_strong
+        if both:
+            return min(both), METHOD_ALIAS
+
+        both = (home_strong | self.positions(home.weak)) & (
+            away_strong | self.positions(away.weak)
+        )
+        return (min(both), METHOD_CITY) if both else None
+
+
+@dataclass(frozen=True)
+class MarketMatchResult:
+    """A market found for a game.
+
+    Attributes:
+        market: The normalized Kalshi market
+        method: How the market was matched (see METHOD_CONFIDENCE)
+        confidence: Confidence in the match (0-1)
+    """
+
+    market: dict[str, Any]
+    method: str
+    confidence: float
+
+
+class MarketMatcher:
+    """Match odds events to Kalshi markets with memoized board indexes."""
+
+    def __init__(
+        self,
+        registry: TeamAliasRegistry | None = None,
+        cache_size: int = 32,
+    ) -> None:
+        """Initialize matcher.
+
+        Args:
+            registry: Team alias registry (defaults to the built-in leagues)
+            cache_size: Number of board indexes to keep
+        """
+        self.registry = registry or TeamAliasRegistry()
+        self._indexes: OrderedDict[str, MarketIndex] = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self.index_builds = 0
+        self.index_hits = 0
+
+    def index_for(self, markets: list[dict[str, Any]]) -> MarketIndex:
+        """Get the index for a market list, building it on first use.
+
+        Args:
+            markets: Normalized Kalshi markets
+
+        Returns:
+            MarketIndex over the markets' titles
+        """
+        titles = [market.get("title") or "" for market in markets]
+        key = hashlib.sha256("\x1f".join(titles).encode("utf-8")).hexdigest()
+
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                self._indexes.move_to_end(key)
+                self.index_hits += 1
+                return index
+
+        index = MarketIndex(titles)
+        with self._lock:
+            self._indexes[key] = index
+            if len(self._indexes) > self._cache_size:
+                self._indexes.popitem(last=False)
+            self.index_builds += 1
+        return index
+
+    def match(
+        self,
+        home_team: str,
+        away_team: str,
+        markets: list[dict[str, Any]],
+        sport_key: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Find the Kalshi market for a game.
+
+        Args:
+            home_team: Home team name
+            away_team: Away team name
+            markets: Normalized Kalshi markets
+            sport_key: Odds API sport key, if known
+
+        Returns:
+            First market mentioning both teams, or None
+        """
+        result = self.find(home_team, away_team, markets, sport_key)
+        return result.market if result is not None else None
+
+    def find(
+        self,
+        home_team: str,
+        away_team: str,
+        markets: list[dict[str, Any]],
+        sport_key: str | None = None,
+    ) -> MarketMatchResult | None:
+        """Find the Kalshi market for a game, with how it was matched.
+
+        Args:
+            home_team: Home team name
+            away_team: Away team name
+            markets: Normalized Kalshi markets
+            sport_key: Odds API sport key, if known
+
+        Returns:
+            MarketMatchResult, or None if no market mentions both teams
+        """
+        if not markets:
+            return None
+        found = self.index_for(markets).find_game(
+            self.registry.aliases(home_team, sport_key),
+            self.registry.aliases(away_team, sport_key),
+        )
+        if found is None:
+            return None
+        position, method = found
+        return MarketMatchResult(markets[position], method, METHOD_CONFIDENCE[method])
+
+
+_default_matcher: MarketMatcher | None = None
+
+
+def get_matcher() -> MarketMatcher:
+    """Get the process-wide matcher (shares board indexes across services)."""
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = MarketMatcher()
+    return _default_matcher
@@ -10,12 +10,14 @@ from datetime import datetime, timezone
 from typing import Any
 
 from sportsbetsinfo.clients.odds_api import OddsAPIClient
+from sportsbetsinfo.clients.quota import PRIORITY_LOW
 from sportsbetsinfo.config.settings import Settings
 from sportsbetsinfo.core.exceptions import DuplicateEntityError
 from sportsbetsinfo.core.models import FinalScore, Outcome
-from sportsbetsinfo.db.connection import get_connection
+from sportsbetsinfo.db.connection import get_connection_manager
 from sportsbetsinfo.db.repositories.outcome import OutcomeRepository
 from sportsbetsinfo.db.repositories.snapshot import SnapshotRepository
+from sportsbetsinfo.services.upstream import create_odds_api_client
 
 
 class OutcomeService:
@@ -32,15 +34,13 @@ class OutcomeService:
             settings: Application settings
         """
         self.settings = settings
+        self._db = get_connection_manager(settings.db_path)
         self._odds_api: OddsAPIClient | None = None
 
     async def __aenter__(self) -> OutcomeService:
         """Enter async context, initialize API client."""
         if self.settings.odds_api_configured:
-            self._odds_api = OddsAPIClient(
-                api_key=self.settings.odds_api_key,
-                rate_limit=self.settings.odds_api_rate_limit,
-            )
+            self._odds_api = create_odds_api_client(self.settings)
             await self._odds_api.__aenter__()
         return self
 
@@ -69,8 +69,10 @@ class OutcomeService:
         if not self._odds_api:
             return []
 
-        # Get scores from API
-        scores_data = await self._odds_api.get_scores(sport, days_from=days_from)
+        # Get scores from API (bulk settlement can wait if the quota is tight)
+        scores_data = await self._odds_api.get_scores(
+            sport, days_from=days_from, priority=PRIORITY_LOW
+        )
 
         # Filter to completed games only
         completed_games = [
@@ -82,7 +84,7 @@ class OutcomeService:
             return []
 
         # Get game IDs that have snapshots
-        with get_connection(self.settings.db_path) as conn:
+        with self._db.read() as conn:
             snapshot_repo = SnapshotRepository(conn)
             outcome_repo = OutcomeRepository(conn)
 
@@ -90,8 +92,8 @@ class OutcomeService:
             completed_ids = [g.get("id") for g in completed_games if g.get("id")]
 
             # Find which ones need outcomes (have snapshots but no outcome)
-            all_snapshots = snapshot_repo.get_all(limit=1000)
-            snapshot_game_ids = {s.game_id for s in all_snapshots}
+            games = snapshot_repo.get_game_summaries(limit=1000)
+            snapshot_game_ids = {g.game_id for g in games}
 
             # Filter to games we have snapshots for
             games_with_snapshots = [
@@ -113,16 +115,17 @@ class OutcomeService:
 
             outcome = self._create_outcome_from_scores(game)
             if outcome:
-                try:
-                    with get_connection(self.settings.db_path) as conn:
-                        repo = OutcomeRepository(conn)
-                        saved = repo.insert(outcome)
-                        outcomes.append(saved)
-                except DuplicateEntityError:
-                    # Already exists, skip
-                    pass
+                outcomes.append(outcome)
+
+        if not outcomes:
+            return []
+
+        # Persist in one transaction; games that already have an outcome are skipped
+        with self._db.write() as conn:
+            repo = OutcomeRepository(conn)
+            result = repo.insert_many(outcomes)
 
-        return outcomes
+        return result.inserted
 
     async def ingest_outcome_for_game(
         self,
@@ -144,7 +147,7 @@ class OutcomeService:
             return None
 
         # Check if outcome already exists
-        with get_connection(self.settings.db_path) as conn:
+        with self._db.read() as conn:
             repo = OutcomeRepository(conn)
             existing = repo.get_by_game_id(game_id)
             if existing:
@@ -167,12 +170,12 @@ class OutcomeService:
             return None
 
         try:
-            with get_connection(self.settings.db_path) as conn:
+            with self._db.write() as conn:
                 repo = OutcomeRepository(conn)
                 return repo.insert(outcome)
         except DuplicateEntityError:
             # Race condition - return existing
-            with get_connection(self.settings.db_path) as conn:
+            with self._db.read() as conn:
                 repo = OutcomeRepository(conn)
                 return repo.get_by_game_id(game_id)
 
@@ -263,13 +266,13 @@ class OutcomeService:
         Returns:
             List of game IDs needing outcome ingestion
         """
-        with get_connection(self.settings.db_path) as conn:
+        with self._db.read() as conn:
             snapshot_repo = SnapshotRepository(conn)
             outcome_repo = OutcomeRepository(conn)
 
             # Get unique game IDs from snapshots
-            snapshots = snapshot_repo.get_all(limit=1000)
-            game_ids = list({s.game_id for s in snapshots})
+            games = snapshot_repo.get_game_summaries(limit=1000)
+            game_ids = [g.game_id for g in games]
 
             # Find pending
             return outcome_repo.get_pending_games(game_ids)
@@ -0,0 +1,449 @@
+"""Polling policies for the collection daemon.
+
+A PollingPolicy decides how long to wait before a game's next snapshot.
+Two policies ship:
+
+- ``cadence``: a fixed interval per time-to-tip-off tier
+- ``volatility``: the same tiers, with the interval shortened for games
+  whose lines are moving and stretched for games whose lines are flat
+
+Line movement is tracked per game by a MovementTracker as an
+exponentially weighted average of how far the lines moved between
+consecutive snapshots, in the fields compute_deltas compares: the odds
+event's ``home_no_vig_prob`` and the matched Kalshi market's
+``implied_probability``. Measuring the move per snapshot (rather than
+per hour) makes the volatility policy self-balancing: polling a game
+faster sees smaller moves, which relaxes its interval again, so each
+game converges to roughly ``reference`` movement per request.
+
+Policies can be replayed against recorded snapshot history to measure
+how many large line moves each catches per upstream request spent.
+"""
+
+from __future__ import annotations
+
+import bisect
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Protocol
+
+from sportsbetsinfo.services.matching import get_matcher
+
+# (minimum time to tip-off, interval): the first tier the game qualifies for applies
+DEFAULT_CADENCE: tuple[tuple[timedelta, timedelta], ...] = (
+    (timedelta(hours=6), timedelta(hours=2)),
+    (timedelta(hours=1), timedelta(minutes=30)),
+    (timedelta(0), timedelta(minutes=5)),
+)
+# Interval while a game is in progress, and how long after tip-off it is tracked
+LIVE_INTERVAL = timedelta(minutes=15)
+GAME_WINDOW = timedelta(hours=4)
+
+# Line fields whose movement drives volatility
+LINE_FIELDS = ("home_no_vig_prob", "kalshi_implied_probability")
+
+
+def cadence_interval(
+    commence_time: datetime,
+    now: datetime,
+    cadence: tuple[tuple[timedelta, timedelta], ...] = DEFAULT_CADENCE,
+) -> timedelta | None:
+    """Get how often a game should be snapshotted.
+
+    Args:
+        commence_time: Scheduled tip-off
+        now: Current time
+        cadence: Pre-game tiers of (minimum time to tip-off, interval)
+
+    Returns:
+        Snapshot interval, or None once the game is past GAME_WINDOW
+    """
+    lead = commence_time - now
+    if lead < timedelta(0):
+        return LIVE_INTERVAL if -lead < GAME_WINDOW else None
+    for min_lead, interval in cadence:
+        if lead >= min_lead:
+            return interval
+    return cadence[-1][1]
+
+
+def line_probabilities(
+    normalized_fields: dict[str, Any], game_id: str | None = None
+) -> dict[str, float]:
+    """Extract a game's tracked line probabilities from a snapshot.
+
+    Args:
+        normalized_fields: Snapshot normalized fields
+        game_id: Odds API event ID (default: the snapshot's first event)
+
+    Returns:
+        LINE_FIELDS values present in the snapshot
+    """
+    events = normalized_fields.get("odds_api_events", [])
+    event = next((e for e in events if e.get("event_id") == game_id), None)
+    if event is None and events:
+        event = events[0]
+    if event is None:
+        return {}
+
+    probabilities: dict[str, float] = {}
+    if event.get("home_no_vig_prob") is not None:
+        probabilities["home_no_vig_prob"] = event["home_no_vig_prob"]
+
+    markets = normalized_fields.get("kalshi_markets", [])
+    if markets and event.get("home_team") and event.get("away_team"):
+        market = get_matcher().match(event["home_team"], event["away_team"], markets)
+        if market is not None and market.get("implied_probability") is not None:
+            probabilities["kalshi_implied_probability"] = market["implied_probability"]
+    return probabilities
+
+
+@dataclass
+class LineMovement:
+    """Recent line movement for one game.
+
+    Attributes:
+        observed_at: When the last observation was taken
+        probabilities: Line probabilities at the last observation
+        volatility: Weighted average move between observations in
+            probability points (None until two comparable observations)
+        observations: Observations seen
+    """
+
+    observed_at: datetime
+    probabilities: dict[str, float]
+    volatility: float | None = None
+    observations: int = 1
+
+
+class MovementTracker:
+    """Track line volatility per game from successive snapshots."""
+
+    def __init__(self, smoothing: float = 0.5) -> None:
+        """Initialize tracker.
+
+        Args:
+            smoothing: Weight of the newest move in the average (0-1]
+        """
+        self.smoothing = smoothing
+        self._games: dict[str, LineMovement] = {}
+
+    def observe(
+        self, game_id: str, observed_at: datetime, normalized_fields: dict[str, Any]
+    ) -> float | None:
+        """Record a snapshot's lines and update the game's volatility.
+
+        Args:
+            game_id: Game identifier
+            observed_at: When the snapshot was collected
+            normalized_fields: Snapshot normalized fields
+
+        Returns:
+            Updated volatility (None if not yet known)
+        """
+        return self.observe_probabilities(
+            game_id, observed_at, line_probabilities(normalized_fields, game_id)
+        )
+
+    def observe_probabilities(
+        self, game_id: str, observed_at: datetime, probabilities: dict[str, float]
+    ) -> float | None:
+        """Record already-extracted line probabilities (see observe)."""
+        movement = self._games.get(game_id)
+        if movement is None:
+            self._games[game_id] = LineMovement(observed_at, probabilities)
+            return None
+
+        if observed_at <= movement.observed_at:
+            # Duplicate or out-of-order snapshot
+            return movement.volatility
+
+        shared = probabilities.keys() & movement.probabilities.keys()
+        if shared:
+            move = max(abs(probabilities[k] - movement.probabilities[k]) for k in shared)
+            if movement.volatility is None:
+                movement.volatility = move
+            else:
+                movement.volatility += self.smoothing * (move - movement.volatility)
+
+        movement.observed_at = observed_at
+        movement.probabilities = {**movement.probabilities, **probabilities}
+        movement.observations += 1
+        return movement.volatility
+
+    def volatility(self, game_id: str) -> float | None:
+        """Get a game's current volatility (None if not yet known)."""
+        movement = self._games.get(game_id)
+        return movement.volatility if movement is not None else None
+
+    def forget(self, game_id: str) -> None:
+        """Drop a game that is no longer tracked."""
+        self._games.pop(game_id, None)
+
+
+class PollingPolicy(ABC):
+    """Decides how long to wait before a game's next snapshot."""
+
+    name: str
+
+    @abstractmethod
+    def interval(
+        self, commence_time: datetime, now: datetime, volatility: float | None
+    ) -> timedelta | None:
+        """Get the wait before the next snapshot.
+
+        Args:
+            commence_time: Scheduled tip-off
+            now: Time of the snapshot just taken
+            volatility: Game's line volatility (None if unknown)
+
+        Returns:
+            Interval, or None once the game should no longer be polled
+        """
+
+
+class CadencePolicy(PollingPolicy):
+    """Fixed interval per time-to-tip-off tier."""
+
+    name = "cadence"
+
+    def __init__(self, cadence: tuple[tuple[timedelta, timedelta], ...] = DEFAULT_CADENCE) -> None:
+        """Initialize policy.
+
+        Args:
+            cadence: Pre-game tiers of (minimum time to tip-off, interval)
+        """
+        self.cadence = cadence
+
+    def interval(
+        self, commence_time: datetime, now: datetime, volatility: float | None
+    ) -> timedelta | None:
+        """Get the tier interval (volatility is ignored)."""
+        return cadence_interval(commence_time, now, self.cadence)
+
+
+class VolatilityPolicy(PollingPolicy):
+    """Tier interval scaled by how much the game's lines are moving.
+
+    A game whose lines move ``reference`` probability points per
+    snapshot is polled at its tier interval; twice that halves the
+    interval and half of it doubles the interval, within [min_scale,
+    max_scale] of the tier and [min_interval, max_interval] overall.
+    Games without a volatility estimate yet are polled at the tier
+    interval.
+    """
+
+    name = "volatility"
+
+    def __init__(
+        self,
+        cadence: tuple[tuple[timedelta, timedelta], ...] = DEFAULT_CADENCE,
+        reference: float = 0.005,
+        min_scale: float = 0.25,
+        max_scale: float = 2.0,
+        min_interval: timedelta = timedelta(minutes=2),
+        max_interval: timedelta = timedelta(hours=6),
+    ) -> None:
+        """Initialize policy.
+
+        Args:
+            cadence: Pre-game tiers of (minimum time to tip-off, interval)
+            reference: Volatility (probability points per snapshot)
+                polled at the tier interval
+            min_scale: Smallest multiple of the tier interval
+            max_scale: Largest multiple of the tier interval
+            min_interval: Shortest interval
+            max_interval: Longest interval
+        """
+        self.cadence = cadence
+        self.reference = reference
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+    def interval(
+        self, commence_time: datetime, now: datetime, volatility: float | None
+    ) -> timedelta | None:
+        """Get the tier interval scaled by volatility."""
+        base = cadence_interval(commence_time, now, self.cadence)
+        if base is None or volatility is None:
+            return base
+        scale = self.reference / volatility if volatility > 0 else self.max_scale
+        scale = min(self.max_scale, max(self.min_scale, scale))
+        return min(self.max_interval, max(self.min_interval, base * scale))
+
+
+POLICIES: dict[str, type[PollingPolicy]] = {
+    CadencePolicy.name: CadencePolicy,
+    VolatilityPolicy.name: VolatilityPolicy,
+}
+
+
+def get_policy(name: str) -> PollingPolicy:
+    """Create a polling policy with default parameters.
+
+    Args:
+        name: Policy name (see POLICIES)
+
+    Returns:
+        PollingPolicy instance
+
+    Raises:
+        ValueError: If the policy is unknown
+    """
+    try:
+        return POLICIES[name]()
+    except KeyError as e:
+        raise ValueError(
+            f"Unknown polling policy: {name} (expected one of {sorted(POLICIES)})"
+        ) from e
+
+
+class RecordedSnapshot(Protocol):
+    """What replay needs from a stored snapshot (InfoSnapshot or SnapshotView)."""
+
+    @property
+    def collected_at(self) -> datetime: ...
+
+    @property
+    def normalized_fields(self) -> dict[str, Any]: ...
+
+
+@dataclass(frozen=True)
+class ReplayResult:
+    """Large-move coverage of a policy replayed over recorded history.
+
+    Attributes:
+        policy: Policy name
+        games: Games replayed
+        requests: Snapshots (board fetches) the policy would have taken
+        large_moves: Recorded line moves of at least the threshold
+        covered_moves: Large moves a poll observed within the window
+    """
+
+    policy: str
+    games: int = 0
+    requests: int = 0
+    large_moves: int = 0
+    covered_moves: int = 0
+
+    @property
+    def coverage(self) -> float:
+        """Share of large moves observed (1.0 when there were none)."""
+        return self.covered_moves / self.large_moves if self.large_moves else 1.0
+
+    @property
+    def covered_per_100_requests(self) -> float:
+        """Large moves observed per 100 requests spent."""
+        return 100 * self.covered_moves / self.requests if self.requests else 0.0
+
+    def merge(self, other: ReplayResult) -> ReplayResult:
+        """Combine results for the same policy over more games."""
+        return ReplayResult(
+            policy=self.policy,
+            games=self.games + other.games,
+            requests=self.requests + other.requests,
+            large_moves=self.large_moves + other.large_moves,
+            covered_moves=self.covered_moves + other.covered_moves,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "policy": self.policy,
+            "games": self.games,
+            "requests": self.requests,
+            "large_moves": self.large_moves,
+            "covered_moves": self.covered_moves,
+            "coverage": round(self.coverage, 4),
+            "covered_per_100_requests": round(self.covered_per_100_requests, 2),
+        }
+
+
+def replay_game(
+    policy: PollingPolicy,
+    game_id: str,
+    history: Sequence[RecordedSnapshot],
+    threshold: float = 0.03,
+    window: timedelta = timedelta(minutes=15),
+) -> ReplayResult:
+    """Replay a policy over one game's recorded snapshots.
+
+    Polling starts at the first recorded snapshot. A poll at time T sees
+    the latest snapshot recorded at or before T, so the replay is only
+    as fine-grained as the recorded history (record densely to compare
+    policies fairly). A large move is a change of at least ``threshold``
+    in any LINE_FIELDS value between consecutive recorded snapshots; it
+    is covered if the policy polls within ``window`` after it.
+
+    Args:
+        policy: Policy to replay
+        game_id: Game identifier
+        history: Snapshots ordered by collected_at
+        threshold: Smallest move (probability points) counted as large
+        window: How soon after a move a poll must land to cover it
+
+    Returns:
+        ReplayResult for the game
+    """
+    if not history:
+        return ReplayResult(policy=policy.name)
+
+    times = [snapshot.collected_at for snapshot in history]
+    lines = [line_probabilities(snapshot.normalized_fields, game_id) for snapshot in history]
+    commence_time = _commence_time(history[-1].normalized_fields, game_id)
+
+    moves = [
+        times[i]
+        for i in range(1, len(history))
+        if any(
+            abs(lines[i][k] - lines[i - 1][k]) >= threshold
+            for k in lines[i].keys() & lines[i - 1].keys()
+        )
+    ]
+
+    tracker = MovementTracker()
+    polls: list[datetime] = []
+    now = times[0]
+    while now <= times[-1]:
+        seen = bisect.bisect_right(times, now) - 1
+        volatility = tracker.observe_probabilities(game_id, now, lines[seen])
+        polls.append(now)
+        if commence_time is None:
+            break
+        interval = policy.interval(commence_time, now, volatility)
+        if interval is None:
+            break
+        due = now + interval
+        # Same tip-off clamp as the daemon: always take the closing line
+        if now < commence_time < due:
+            due = commence_time
+        now = due
+
+    covered = 0
+    for moved_at in moves:
+        first = bisect.bisect_left(polls, moved_at)
+        if first < len(polls) and polls[first] < moved_at + window:
+            covered += 1
+
+    return ReplayResult(
+        policy=policy.name,
+        games=1,
+        requests=len(polls),
+        large_moves=len(moves),
+        covered_moves=covered,
+    )
+
+
+def _commence_time(normalized_fields: dict[str, Any], game_id: str) -> datetime | None:
+    """Get a game's tip-off from a snapshot's odds event."""
+    events = normalized_fields.get("odds_api_events", [])
+    event = next((e for e in events if e.get("event_id") == game_id), None)
+    if event is None and events:
+        event = events[0]
+    if event is None or not event.get("commence_time"):
+        return None
+    return datetime.fromisoformat(event["commence_time"].replace("Z", "+00:00"))
@@ -0,0 +1,377 @@
+"""Tip-off-aware collection scheduling for the collection daemon.
+
+Lines move most in the hours before tip-off, so each game is
+snapshotted on a cadence that tightens as its commence_time approaches
+(by default every 2h more than 6h out, every 30 min inside 6h, every
+5 min in the final hour, and every 15 min while the game is live). The
+scheduler's PollingPolicy can further adapt each game's interval to how
+fast its lines are moving (see services.polling), and an optional
+request budget caps board fetches per hour across all sports.
+
+Every tick fetches each sport's boards once through a long-lived
+DataCollector and snapshots only the games that are due. Intervals
+are jittered so games (and daemons) drift apart instead of hitting
+upstream in lockstep. A game that has missed one or more ticks (daemon
+stopped, machine asleep, slow upstream) is collected once and then
+rescheduled from now rather than replaying every missed tick. Schedule
+state is written to a JSON status file after every tick.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import random
+import tempfile
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from sportsbetsinfo.core.models import InfoSnapshot
+from sportsbetsinfo.services.collector import CycleBoards, DataCollector
+from sportsbetsinfo.services.polling import LIVE_INTERVAL, PollingPolicy, VolatilityPolicy
+
+# How often each sport's board is fetched just to discover new games
+DISCOVERY_INTERVAL = timedelta(hours=2)
+# Wait before retrying a sport whose odds board could not be fetched
+ERROR_RETRY = timedelta(minutes=1)
+# Longest the daemon sleeps between schedule checks
+MAX_SLEEP = timedelta(minutes=5)
+
+
+@dataclass
+class ScheduledGame:
+    """Schedule state for one game."""
+
+    game_id: str
+    sport: str
+    home_team: str | None
+    away_team: str | None
+    commence_time: datetime
+    next_due: datetime
+    last_collected: datetime | None = None
+    snapshots: int = 0
+    volatility: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "game_id": self.game_id,
+            "sport": self.sport,
+            "matchup": f"{self.away_team} @ {self.home_team}",
+            "commence_time": self.commence_time.isoformat(),
+            "next_due": self.next_due.isoformat(),
+            "last_collected": self.last_collected.isoformat() if self.last_collected else None,
+            "snapshots": self.snapshots,
+            "volatility": round(self.volatility, 4) if self.volatility is not None else None,
+        }
+
+
+@dataclass
+class SchedulerStats:
+    """Daemon counters since start."""
+
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    ticks: int = 0
+    board_fetches: int = 0
+    snapshots_created: int = 0
+    heartbeats: int = 0
+    missed_ticks: int = 0
+    budget_deferrals: int = 0
+    errors: int = 0
+    last_error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "started_at": self.started_at.isoformat(),
+            "ticks": self.ticks,
+            "board_fetches": self.board_fetches,
+            "snapshots_created": self.snapshots_created,
+            "heartbeats": self.heartbeats,
+            "missed_ticks": self.missed_ticks,
+            "budget_deferrals": self.budget_deferrals,
+            "errors": self.errors,
+            "last_error": self.last_error,
+        }
+
+
+class CollectionScheduler:
+    """Snapshot games on a tip-off-aware, volatility-adaptive cadence until stopped."""
+
+    def __init__(
+        self,
+        collector: DataCollector,
+        sports: list[str],
+        jitter: float = 0.1,
+        status_path: Path | None = None,
+        policy: PollingPolicy | None = None,
+        max_requests_per_hour: float | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialize scheduler.
+
+        Args:
+            collector: Open DataCollector whose clients are reused every tick
+            sports: Sport keys to collect
+            jitter: Fractional jitter applied to every interval (0.1 = +/-10%)
+            status_path: JSON file rewritten after every tick (None to skip)
+            policy: Per-game polling policy (default: VolatilityPolicy)
+            max_requests_per_hour: Cap on board fetches per hour across all
+                sports (None for no cap)
+            rng: Random source for jitter
+        """
+        self.collector = collector
+        self.sports = sports
+        self.jitter = jitter
+        self.status_path = status_path
+        self.policy = policy or VolatilityPolicy()
+        self.max_requests_per_hour = max_requests_per_hour
+        self.games: dict[str, ScheduledGame] = {}
+        self.stats = SchedulerStats()
+        self._rng = rng or random.Random()
+        now = datetime.now(timezone.utc)
+        # Every sport's board is fetched on the first tick
+        self._next_board: dict[str, datetime] = dict.fromkeys(sports, now)
+        # Earliest time the request budget allows another board fetch
+        self._next_request = now
+
+    async def run(
+        self,
+        stop: asyncio.Event,
+        on_tick: Callable[[list[InfoSnapshot]], None] | None = None,
+    ) -> None:
+        """Tick until ``stop`` is set, finishing the tick in progress.
+
+        Args:
+            stop: Set (e.g. from a signal handler) to shut down
+            on_tick: Called with each tick's snapshots
+        """
+        while not stop.is_set():
+            snapshots = await self.tick()
+            if on_tick is not None:
+                on_tick(snapshots)
+            wait = (self.next_wakeup() - datetime.now(timezone.utc)).total_seconds()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(stop.wait(), timeout=max(wait, 0.0))
+        self.write_status(stopped=True)
+
+    def next_wakeup(self) -> datetime:
+        """When the next game or board is due (at most MAX_SLEEP from now)."""
+        now = datetime.now(timezone.utc)
+        candidates = [now + MAX_SLEEP, *self._next_board.values()]
+        candidates.extend(game.next_due for game in self.games.values())
+        return max(min(candidates), self._next_request)
+
+    async def tick(self, now: datetime | None = None) -> list[InfoSnapshot]:
+        """Fetch boards for sports with due games and snapshot those games.
+
+        Args:
+            now: Current time (default: now)
+
+        Returns:
+            Snapshots created this tick
+        """
+        now = now or datetime.now(timezone.utc)
+        self.stats.ticks += 1
+        created: list[InfoSnapshot] = []
+
+        # Most overdue sport first, so a tight budget serves it first
+        for sport in sorted(self.sports, key=lambda s: self._earliest_due(s)):
+            if self._earliest_due(sport) > now:
+                continue
+            if now < self._next_request:
+                self.stats.budget_deferrals += 1
+                continue
+            if self.max_requests_per_hour:
+                self._next_request = now + timedelta(hours=1) / self.max_requests_per_hour
+
+            try:
+                created.extend(await self._tick_sport(sport, now))
+            except Exception as e:
+                # Keep the daemon alive; the sport is retried shortly
+                self._record_error(sport, str(e), now)
+
+        self.write_status()
+        return created
+
+    def _earliest_due(self, sport: str) -> datetime:
+        """When the sport's board is next needed (discovery or a due game)."""
+        return min(
+            [self._next_board[sport]]
+            + [g.next_due for g in self.games.values() if g.sport == sport]
+        )
+
+    async def _tick_sport(self, sport: str, now: datetime) -> list[InfoSnapshot]:
+        """Fetch one sport's boards and snapshot its due games."""
+        boards = await self.collector.fetch_boards(sport)
+        self.stats.board_fetches += 1
+        if boards.odds_payload is None:
+            self._record_error(sport, boards.odds_error or "no odds board", now)
+            return []
+
+        self._refresh_games(sport, boards, now)
+        self._next_board[sport] = now + self._jittered(DISCOVERY_INTERVAL)
+        return [
+            await self._collect(game, boards, now)
+            for game in [g for g in self.games.values() if g.sport == sport]
+            if game.next_due <= now
+        ]
+
+    def _record_error(self, sport: str, message: str, now: datetime) -> None:
+        """Count a failed sport tick and retry its board and due games soon."""
+        self.stats.errors += 1
+        self.stats.last_error = f"{sport}: {message}"
+        self._next_board[sport] = now + ERROR_RETRY
+        for game in self.games.values():
+            if game.sport == sport and game.next_due <= now:
+                game.next_due = now + ERROR_RETRY
+
+    def _refresh_games(self, sport: str, boards: CycleBoards, now: datetime) -> None:
+        """Add new games from the odds board and drop finished or removed ones."""
+        assert boards.odds_payload is not None
+        on_board: dict[str, dict[str, Any]] = {}
+        for event in boards.odds_payload.get("events", []):
+            if event.get("id") and event.get("commence_time"):
+                on_board[event["id"]] = event
+
+        for game_id in [g.game_id for g in self.games.values() if g.sport == sport]:
+            game = self.games[game_id]
+            if (
+                game_id not in on_board
+                or self.policy.interval(game.commence_time, now, None) is None
+            ):
+                del self.games[game_id]
+                self.collector.movement.forget(game_id)
+
+        new_ids = [
+            game_id
+            for game_id, event in on_board.items()
+            if game_id not in self.games
+            and self.policy.interval(_parse_time(event["commence_time"]), now, None)
+        ]
+        last_collected = self.collector.get_last_collected_at(new_ids)
+
+        for game_id, event in on_board.items():
+            commence_time = _parse_time(event["commence_time"])
+            scheduled = self.games.get(game_id)
+            if scheduled is not None:
+                # Tip-off can be rescheduled
+                scheduled.commence_time = commence_time
+                continue
+            if game_id not in new_ids:
+                continue
+            last = last_collected.get(game_id)
+            self.games[game_id] = ScheduledGame(
+                game_id=game_id,
+                sport=sport,
+                home_team=event.get("home_team"),
+                away_team=event.get("away_team"),
+                commence_time=commence_time,
+                # Games seen by an earlier run resume their cadence; new games are due now
+                next_due=self._next_due(commence_time, last, None) if last else now,
+                last_collected=last,
+            )
+
+    async def _collect(self, game: ScheduledGame, boards: CycleBoards, now: datetime) -> InfoSnapshot:
+        """Snapshot a due game and schedule its next snapshot."""
+        interval = self.policy.interval(game.commence_time, now, game.volatility) or LIVE_INTERVAL
+        overdue = now - game.next_due
+        if overdue >= interval:
+            # Collapse the missed ticks into this one collection
+            self.stats.missed_ticks += int(overdue / interval)
+
+        unchanged_before = self.collector.stats.snapshots_unchanged
+        snapshot = await self.collector.collect_snapshot(game.game_id, game.sport, boards)
+        game.last_collected = now
+        game.snapshots += 1
+        game.volatility = self.collector.movement.volatility(game.game_id)
+        game.next_due = self._next_due(game.commence_time, now, game.volatility)
+        if self.collector.stats.snapshots_unchanged > unchanged_before:
+            self.stats.heartbeats += 1
+        else:
+            self.stats.snapshots_created += 1
+        return snapshot
+
+    def _next_due(
+        self, commence_time: datetime, last: datetime, volatility: float | None
+    ) -> datetime:
+        """Next snapshot time after one taken at ``last``.
+
+        Pre-game snapshots never skip past tip-off, so the closing line
+        is always captured.
+        """
+        interval = self.policy.interval(commence_time, last, volatility) or LIVE_INTERVAL
+        due = last + self._jittered(interval)
+        if last < commence_time < due:
+            due = commence_time
+        return due
+
+    def _jittered(self, interval: timedelta) -> timedelta:
+        """Apply +/- jitter to an interval."""
+        return interval * self._rng.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def status(self, stopped: bool = False) -> dict[str, Any]:
+        """Current daemon state, games ordered by next snapshot."""
+        return {
+            "running": not stopped,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "pid": os.getpid(),
+            "sports": self.sports,
+            "policy": self.policy.name,
+            "max_requests_per_hour": self.max_requests_per_hour,
+            "stats": self.stats.to_dict(),
+            "next_board_fetch": {s: t.isoformat() for s, t in self._next_board.items()},
+            "games": [
+                g.to_dict() for g in sorted(self.games.values(), key=lambda g: g.next_due)
+            ],
+        }
+
+    def write_status(self, stopped: bool = False) -> None:
+        """Atomically rewrite the status file (if configured)."""
+        if self.status_path is None:
+            return
+        self.status_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.status_path.parent, prefix=".daemon-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.status(stopped), f, indent=2)
+            os.replace(tmp, self.status_path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+def read_status(path: Path, now: datetime | None = None) -> dict[str, Any]:
+    """Read a daemon status file.
+
+    A daemon that was killed without shutting down leaves ``running``
+    set, so a status not rewritten within two MAX_SLEEPs is reported as
+    stale and not running.
+
+    Args:
+        path: Status file
+        now: Current time (default: now)
+
+    Returns:
+        Status dictionary (``{"running": False}`` if there is no status file)
+    """
+    try:
+        status: dict[str, Any] = json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"running": False, "games": []}
+
+    now = now or datetime.now(timezone.utc)
+    updated_at = _parse_time(status["updated_at"])
+    status["stale"] = status["running"] and now - updated_at > 2 * MAX_SLEEP
+    status["running"] = status["running"] and not status["stale"]
+    return status
+
+
+def _parse_time(value: str) -> datetime:
+    """Parse an Odds API ISO timestamp."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
@@ -0,0 +1,61 @@
+"""Construct upstream API clients from settings.
+
+Every service talking to Kalshi or The Odds API builds its clients
+here, so the response cache, quota budget, retry policy and base URL
+overrides are configured the same way everywhere.
+"""
+
+from __future__ import annotations
+
+from sportsbetsinfo.clients.cache import get_response_cache
+from sportsbetsinfo.clients.kalshi import KalshiClient, get_signer_pool
+from sportsbetsinfo.clients.odds_api import OddsAPIClient
+from sportsbetsinfo.clients.quota import QuotaBudgeter
+from sportsbetsinfo.clients.resilience import RetryPolicy
+from sportsbetsinfo.config.settings import Settings
+
+
+def retry_policy(settings: Settings) -> RetryPolicy:
+    """Get the retry and circuit breaker policy from settings."""
+    return RetryPolicy(
+        max_retries=settings.http_max_retries,
+        backoff_base=settings.http_backoff_base,
+        breaker_threshold=settings.circuit_breaker_threshold,
+        breaker_reset_timeout=settings.circuit_breaker_reset_seconds,
+    )
+
+
+def create_kalshi_client(settings: Settings) -> KalshiClient:
+    """Create a Kalshi client (requires settings.kalshi_configured)."""
+    assert settings.kalshi_private_key_path is not None
+    return KalshiClient(
+        api_key=settings.kalshi_api_key,
+        private_key_path=settings.kalshi_private_key_path,
+        rate_limit=settings.kalshi_rate_limit,
+        burst=settings.kalshi_burst,
+        cache=get_response_cache(settings.http_cache, settings.http_cache_path),
+        retry_policy=retry_policy(settings),
+        base_url=settings.kalshi_base_url,
+        signer=(
+            get_signer_pool(settings.kalshi_signer_threads, settings.kalshi_signer_prewarm)
+            if settings.kalshi_signer_threads > 0
+            else None
+        ),
+    )
+
+
+def create_odds_api_client(settings: Settings) -> OddsAPIClient:
+    """Create a The Odds API client (requires settings.odds_api_configured)."""
+    return OddsAPIClient(
+        api_key=settings.odds_api_key,
+        rate_limit=settings.odds_api_rate_limit,
+        burst=settings.odds_api_burst,
+        cache=get_response_cache(settings.http_cache, settings.http_cache_path),
+        budget=(
+            QuotaBudgeter(settings.odds_api_budget_path, settings.odds_api_quota_reset_day)
+            if settings.odds_api_budget
+            else None
+        ),
+        retry_policy=retry_policy(settings),
+        base_url=settings.odds_api_base_url,
+    )
@@ -0,0 +1,144 @@
+"""Vectorized Kalshi vs Vegas edge math for batch analysis.
+
+Odds and Kalshi prices from many snapshots are packed into columns and
+converted to implied probabilities, vig and deltas in one pass. NumPy
+is used when installed (``pip install sportsbetsinfo[fast]``); without
+it the same columns are computed in pure Python.
+
+Both backends evaluate the same IEEE-754 operations in the same order
+as american_to_probability() and AnalysisService, so results are
+bit-identical to the per-event path. Values are returned unrounded:
+callers round with Python's round(), which NumPy's rounding does not
+always match, so stored values and analysis hashes are unchanged.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+# Type checkers see NumPy as installed; at runtime it is optional
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover - optional dependency
+        np = None
+
+HAS_NUMPY = np is not None
+
+
+@dataclass(frozen=True)
+class EdgeColumns:
+    """Per-event results of compute_edges(), aligned with its inputs.
+
+    Attributes:
+        vegas_home_prob: Home implied probability (with vig)
+        vegas_away_prob: Away implied probability (with vig)
+        vegas_vig: Sum of implied probabilities minus 1
+        home_delta: Kalshi minus Vegas home probability (None without a Kalshi price)
+    """
+
+    vegas_home_prob: list[float]
+    vegas_away_prob: list[float]
+    vegas_vig: list[float]
+    home_delta: list[float | None]
+
+
+def resolve_backend(engine: str = "auto") -> str:
+    """Pick the computation backend.
+
+    Args:
+        engine: "auto", "numpy" or "python"
+
+    Returns:
+        "numpy" or "python"
+
+    Raises:
+        ValueError: If the engine is unknown, or "numpy" is requested
+            but NumPy is not installed
+    """
+    if engine == "auto":
+        return "numpy" if HAS_NUMPY else "python"
+    if engine == "numpy" and not HAS_NUMPY:
+        raise ValueError("NumPy is not installed (pip install sportsbetsinfo[fast])")
+    if engine not in ("numpy", "python"):
+        raise ValueError(f"Unknown analysis engine: {engine}")
+    return engine
+
+
+def compute_edges(
+    home_odds: Sequence[float],
+    away_odds: Sequence[float],
+    kalshi_probs: Sequence[float | None],
+    engine: str = "auto",
+) -> EdgeColumns:
+    """Compute implied probabilities, vig and deltas for many events.
+
+    Args:
+        home_odds: Best home American odds per event
+        away_odds: Best away American odds per event
+        kalshi_probs: Kalshi implied home probability per event (None if unmatched)
+        engine: "auto", "numpy" or "python"
+
+    Returns:
+        EdgeColumns aligned with the inputs
+    """
+    if resolve_backend(engine) == "numpy":
+        return _compute_numpy(home_odds, away_odds, kalshi_probs)
+    return _compute_python(home_odds, away_odds, kalshi_probs)
+
+
+def _implied(odds: float) -> float:
+    """Scalar American odds to implied probability (as american_to_probability)."""
+    if odds > 0:
+        return 100 / (odds + 100)
+    return abs(odds) / (abs(odds) + 100)
+
+
+def _compute_python(
+    home_odds: Sequence[float],
+    away_odds: Sequence[float],
+    kalshi_probs: Sequence[float | None],
+) -> EdgeColumns:
+    """Pure-Python backend."""
+    home = [_implied(o) for o in home_odds]
+    away = [_implied(o) for o in away_odds]
+    return EdgeColumns(
+        vegas_home_prob=home,
+        vegas_away_prob=away,
+        vegas_vig=[h + a - 1.0 for h, a in zip(home, away, strict=True)],
+        home_delta=[None if k is None else k - h for k, h in zip(kalshi_probs, home, strict=True)],
+    )
+
+
+def _compute_numpy(
+    home_odds: Sequence[float],
+    away_odds: Sequence[float],
+    kalshi_probs: Sequence[float | None],
+) -> EdgeColumns:
+    """NumPy backend."""
+    assert np is not None
+
+    def implied(odds: Sequence[float]) -> np.ndarray:
+        values = np.asarray(odds, dtype=np.float64)
+        magnitude = np.abs(values)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(values > 0, 100 / (values + 100), magnitude / (magnitude + 100))
+
+    home = implied(home_odds)
+    away = implied(away_odds)
+    kalshi = np.asarray(
+        [math.nan if k is None else k for k in kalshi_probs], dtype=np.float64
+    )
+    delta = (kalshi - home).tolist()
+
+    return EdgeColumns(
+        vegas_home_prob=home.tolist(),
+        vegas_away_prob=away.tolist(),
+        vegas_vig=(home + away - 1.0).tolist(),
+        home_delta=[None if k is None else d for k, d in zip(kalshi_probs, delta, strict=True)],
+    )
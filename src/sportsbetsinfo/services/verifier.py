@@ -0,0 +1,344 @@
+"""Streaming integrity verifier for all immutable tables.
+
+Walks each table in rowid order with keyset pagination, so memory use
+is bounded by the batch size regardless of table size. Rows are decoded
+in the parent process and hashed in a process pool. Every mismatch is
+collected rather than stopping at the first, including rows that cannot
+be decoded at all (corrupt compressed columns, missing payload blobs,
+broken delta chains, invalid JSON). Payload blobs are checked against
+the content hash they are stored under.
+
+Each run appends one row per table to ``verification_runs``. A later
+run resumes after the highest rowid of the last clean run for that
+table, so nightly checks only hash new rows; pass ``full=True`` to
+re-verify everything.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import uuid
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from sportsbetsinfo.config.settings import Settings
+from sportsbetsinfo.core.exceptions import CorruptRowError, HashMismatchError, IntegrityError
+from sportsbetsinfo.db.connection import get_connection_manager
+from sportsbetsinfo.db.repositories.analysis import AnalysisRepository
+from sportsbetsinfo.db.repositories.base import ImmutableRepository
+from sportsbetsinfo.db.repositories.evaluation import EvaluationRepository
+from sportsbetsinfo.db.repositories.outcome import OutcomeRepository
+from sportsbetsinfo.db.repositories.payload import PayloadStore, content_hash
+from sportsbetsinfo.db.repositories.proposal import ProposalRepository
+from sportsbetsinfo.db.repositories.snapshot import SnapshotRepository
+from sportsbetsinfo.db.schema import create_all_tables
+from sportsbetsinfo.db.verification import VerificationMode, VerificationPolicy, ensure_hash
+
+# Tables verified, in order, with the repository that decodes them
+# (payload blobs are read raw by PayloadStore and decoded by the hashers)
+VERIFIED_TABLES: list[tuple[str, type[ImmutableRepository[Any]] | type[PayloadStore]]] = [
+    ("info_snapshots", SnapshotRepository),
+    ("payload_blobs", PayloadStore),
+    ("analyses", AnalysisRepository),
+    ("outcomes", OutcomeRepository),
+    ("evaluations", EvaluationRepository),
+    ("improvement_proposals", ProposalRepository),
+]
+
+# Keep the IN (...) used to load link rows under SQLite's parameter limit
+MAX_BATCH_SIZE = 900
+
+# Errors raised by repositories when a stored row cannot be decoded
+DECODE_ERRORS = (IntegrityError, ValueError, KeyError, TypeError)
+
+ProgressCallback = Callable[[str, int], None]
+
+# (entity_type, entity_id, expected, actual) per hash mismatch, and
+# (rowid, entity_id, reason) per row that could not be decoded
+CheckResult = tuple[list[tuple[str, str, str, str]], list[tuple[int, str, str]]]
+
+
+def _check_batch(entities: list[Any]) -> CheckResult:
+    """Hash a batch of entities (runs in a worker process).
+
+    Args:
+        entities: Decoded entities
+
+    Returns:
+        Hash mismatches (decoding already happened in the parent)
+    """
+    mismatches = []
+    for entity in entities:
+        try:
+            ensure_hash(entity)
+        except HashMismatchError as e:
+            mismatches.append((e.entity_type, e.entity_id, e.expected, e.actual))
+    return mismatches, []
+
+
+def _check_blobs(rows: list[tuple[int, str, str | bytes]]) -> CheckResult:
+    """Decode and hash a batch of payload blobs (runs in a worker process).
+
+    Args:
+        rows: (rowid, blob_hash, stored content) from PayloadStore.get_after_rowid
+
+    Returns:
+        Hash mismatches and undecodable blobs
+    """
+    mismatches = []
+    failures = []
+    for rowid, blob_hash, content in rows:
+        try:
+            actual = content_hash(content)
+        except IntegrityError as e:
+            failures.append((rowid, blob_hash, str(e)))
+            continue
+        if actual != blob_hash:
+            mismatches.append(("PayloadBlob", blob_hash, blob_hash, actual))
+    return mismatches, failures
+
+
+@dataclass
+class TableVerification:
+    """Result of verifying one table."""
+
+    table: str
+    start_rowid: int
+    last_rowid: int
+    rows: int = 0
+    mismatches: list[IntegrityError] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Verification throughput."""
+        return self.rows / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+@dataclass
+class VerificationReport:
+    """Result of a verification run across all tables."""
+
+    run_id: str
+    tables: list[TableVerification] = field(default_factory=list)
+
+    @property
+    def rows(self) -> int:
+        """Total rows verified."""
+        return sum(t.rows for t in self.tables)
+
+    @property
+    def mismatches(self) -> list[IntegrityError]:
+        """All mismatches and undecodable rows across tables."""
+        return [m for t in self.tables for m in t.mismatches]
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Total wall time."""
+        return sum(t.elapsed_seconds for t in self.tables)
+
+    @property
+    def rows_per_second(self) -> float:
+        """Overall throughput."""
+        elapsed = self.elapsed_seconds
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+
+class IntegrityVerifier:
+    """Verify stored hashes for every row of every immutable table."""
+
+    def __init__(
+        self,
+        settings: Settings,
+        workers: int | None = None,
+        batch_size: int = 500,
+    ) -> None:
+        """Initialize verifier.
+
+        Args:
+            settings: Application settings
+            workers: Hashing processes (1 hashes in-process; default CPU count)
+            batch_size: Rows per keyset page and per worker task
+        """
+        self.settings = settings
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+        self._db = get_connection_manager(settings.db_path)
+        # Hashing happens in _check_batch, so repositories only decode
+        self._decode_only = VerificationPolicy(mode=VerificationMode.NEVER)
+
+    def get_checkpoint(self, table: str) -> int:
+        """Get the last rowid verified clean for a table.
+
+        Args:
+            table: Table name
+
+        Returns:
+            Highest last_rowid from runs with no mismatches (0 if none)
+        """
+        with self._db.read() as conn:
+            row = conn.execute(
+                """
+                SELECT MAX(last_rowid) FROM verification_runs
+                WHERE table_name = ? AND mismatches = 0
+                """,
+                (table,),
+            ).fetchone()
+        return row[0] or 0
+
+    def verify_all(
+        self,
+        full: bool = False,
+        checkpoint: bool = True,
+        on_progress: ProgressCallback | None = None,
+    ) -> VerificationReport:
+        """Verify all tables.
+
+        Args:
+            full: Ignore checkpoints and verify every row
+            checkpoint: Record this run in verification_runs
+            on_progress: Called with (table, rows verified so far)
+
+        Returns:
+            VerificationReport with per-table results
+        """
+        report = VerificationReport(run_id=str(uuid.uuid4()))
+
+        # Databases created before verification_runs existed get the table here
+        with self._db.write() as conn:
+            create_all_tables(conn)
+
+        pool = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            for table, repo_cls in VERIFIED_TABLES:
+                start_rowid = 0 if full else self.get_checkpoint(table)
+                started_at = datetime.now(timezone.utc)
+                result = self._verify_table(table, repo_cls, start_rowid, pool, on_progress)
+                report.tables.append(result)
+                if checkpoint and result.rows:
+                    self._record(report.run_id, result, started_at)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        return report
+
+    def _verify_table(
+        self,
+        table: str,
+        repo_cls: type[ImmutableRepository[Any]] | type[PayloadStore],
+        start_rowid: int,
+        pool: ProcessPoolExecutor | None,
+        on_progress: ProgressCallback | None,
+    ) -> TableVerification:
+        """Stream one table through the hashers."""
+        result = TableVerification(table=table, start_rowid=start_rowid, last_rowid=start_rowid)
+        in_flight: deque[Future[CheckResult]] = deque()
+        started = time.perf_counter()
+
+        def collect(checked: CheckResult) -> None:
+            mismatches, failures = checked
+            result.mismatches.extend(HashMismatchError(*m) for m in mismatches)
+            result.mismatches.extend(CorruptRowError(table, *f) for f in failures)
+
+        check: Callable[[list[Any]], CheckResult]
+        items: list[Any]
+        after = start_rowid
+        while True:
+            if issubclass(repo_cls, ImmutableRepository):
+                rowids, items, failures = self._decode_page(repo_cls, after)
+                result.mismatches.extend(failures)
+                check = _check_batch
+            else:
+                with self._db.read() as conn:
+                    items = repo_cls(conn).get_after_rowid(after, self.batch_size)
+                rowids = [rowid for rowid, _, _ in items]
+                check = _check_blobs
+            if not rowids:
+                break
+
+            after = rowids[-1]
+            result.last_rowid = after
+            result.rows += len(rowids)
+
+            if pool is None:
+                collect(check(items))
+            else:
+                in_flight.append(pool.submit(check, items))
+                # Bound memory: decode at most two batches ahead per worker
+                while len(in_flight) >= self.workers * 2:
+                    collect(in_flight.popleft().result())
+
+            if on_progress is not None:
+                on_progress(table, result.rows)
+
+        while in_flight:
+            collect(in_flight.popleft().result())
+
+        result.elapsed_seconds = time.perf_counter() - started
+        return result
+
+    def _decode_page(
+        self, repo_cls: type[ImmutableRepository[Any]], after: int
+    ) -> tuple[list[int], list[Any], list[CorruptRowError]]:
+        """Decode the next page of a table.
+
+        If the page fails to decode, its rows are decoded one at a time
+        so each undecodable row is reported and the rest still verified.
+
+        Returns:
+            (rowids read, decoded entities, undecodable rows)
+        """
+        with self._db.read() as conn:
+            repo = repo_cls(conn, self._decode_only)
+            try:
+                page = repo.get_after_rowid(after, self.batch_size)
+                return [rowid for rowid, _ in page], [entity for _, entity in page], []
+            except DECODE_ERRORS:
+                pass
+
+            rows = conn.execute(
+                f"""
+                SELECT rowid, {repo.id_column} FROM {repo.table_name}
+                WHERE rowid > ?
+                ORDER BY rowid
+                LIMIT ?
+                """,  # noqa: S608
+                (after, self.batch_size),
+            ).fetchall()
+            entities: list[Any] = []
+            failures = []
+            for rowid, entity_id in rows:
+                try:
+                    entities.extend(entity for _, entity in repo.get_after_rowid(rowid - 1, 1))
+                except DECODE_ERRORS as e:
+                    reason = str(e) or type(e).__name__
+                    failures.append(CorruptRowError(repo.table_name, rowid, entity_id, reason))
+        return [row[0] for row in rows], entities, failures
+
+    def _record(self, run_id: str, result: TableVerification, started_at: datetime) -> None:
+        """Append a checkpoint row for a verified table."""
+        with self._db.write() as conn:
+            conn.execute(
+                """
+                INSERT INTO verification_runs (
+                    run_id, table_name, started_at, finished_at,
+                    first_rowid, last_rowid, rows_verified, mismatches
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    run_id,
+                    result.table,
+                    started_at.isoformat(),
+                    datetime.now(timezone.utc).isoformat(),
+                    result.start_rowid + 1,
+                    result.last_rowid,
+                    result.rows,
+                    len(result.mismatches),
+                ),
+            )
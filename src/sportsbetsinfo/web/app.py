@@ -1,6 +1,8 @@
 """FastAPI application factory for sportsbetsinfo web UI."""
 
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -8,6 +10,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
+from sportsbetsinfo.db.connection import close_all_connections
 from sportsbetsinfo.web.routes import api, pages
 
 # Path to templates and static files
@@ -16,6 +19,13 @@ TEMPLATES_DIR = WEB_DIR / "templates"
 STATIC_DIR = WEB_DIR / "static"
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Release pooled database connections on shutdown."""
+    yield
+    close_all_connections()
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application.
 
@@ -26,6 +36,7 @@ def create_app() -> FastAPI:
         title="SportsBetsInfo",
         description="Event-sourced sports betting research platform",
         version="0.1.0",
+        lifespan=lifespan,
     )
 
     # Add CORS middleware for API access from different origins
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from datetime import datetime, timezone
 from typing import Any
 
@@ -10,7 +11,7 @@ from fastapi import APIRouter, BackgroundTasks, HTTPException
 from pydantic import BaseModel
 
 from sportsbetsinfo.config.settings import get_settings
-from sportsbetsinfo.db.connection import get_connection
+from sportsbetsinfo.db.connection import get_connection_manager
 from sportsbetsinfo.db.schema import get_table_counts
 
 router = APIRouter()
@@ -24,6 +25,9 @@ class StatusResponse(BaseModel):
     outcomes: int
     evaluations: int
     proposals: int
+    pending_evaluations: int = 0
+    heartbeats: int = 0
+    dedup_ratio: float = 0.0
     last_updated: str
 
 
@@ -100,8 +104,13 @@ def get_status() -> StatusResponse:
             last_updated=datetime.now(timezone.utc).isoformat(),
         )
 
-    with get_connection(settings.db_path) as conn:
+    from sportsbetsinfo.db.repositories.evaluation import EvaluationRepository
+    from sportsbetsinfo.db.repositories.snapshot import SnapshotRepository
+
+    with get_connection_manager(settings.db_path).read() as conn:
         counts = get_table_counts(conn)
+        pending = EvaluationRepository(conn).count_pending()
+        dedup = SnapshotRepository(conn).get_dedup_stats()
 
     return StatusResponse(
         snapshots=counts.get("info_snapshots", 0),
@@ -109,10 +118,62 @@ def get_status() -> StatusResponse:
         outcomes=counts.get("outcomes", 0),
         evaluations=counts.get("evaluations", 0),
         proposals=counts.get("improvement_proposals", 0),
+        pending_evaluations=pending,
+        heartbeats=dedup.heartbeats,
+        dedup_ratio=round(dedup.dedup_ratio, 4),
         last_updated=datetime.now(timezone.utc).isoformat(),
     )
 
 
+@router.get("/health")
+def get_health() -> dict[str, Any]:
+    """Get connection pool, verification and upstream client statistics."""
+    from sportsbetsinfo.clients.cache import get_cache_stats
+    from sportsbetsinfo.clients.ratelimit import get_rate_limit_stats
+    from sportsbetsinfo.clients.resilience import get_resilience_stats
+    from sportsbetsinfo.db.verification import get_verification_stats
+
+    settings = get_settings()
+
+    if not settings.db_path.exists():
+        return {
+            "status": "no_database",
+            "connections": None,
+            "verification": None,
+            "http_cache": get_cache_stats(),
+            "rate_limits": get_rate_limit_stats(),
+            "upstream": get_resilience_stats(),
+        }
+
+    manager = get_connection_manager(settings.db_path)
+    return {
+        "status": "ok",
+        "connections": manager.stats().to_dict(),
+        "verification": get_verification_stats(),
+        "http_cache": get_cache_stats(),
+        "rate_limits": get_rate_limit_stats(),
+        "upstream": get_resilience_stats(),
+    }
+
+
+@router.get("/quota")
+def get_quota() -> dict[str, Any]:
+    """Get the Odds API quota budget and exhaustion forecast."""
+    from sportsbetsinfo.clients.quota import QuotaBudgeter
+
+    settings = get_settings()
+    budget = QuotaBudgeter(settings.odds_api_budget_path, settings.odds_api_quota_reset_day)
+    return budget.forecast().to_dict()
+
+
+@router.get("/daemon/status")
+def get_daemon_status() -> dict[str, Any]:
+    """Get the collection daemon's state and next scheduled fetches."""
+    from sportsbetsinfo.services.scheduler import read_status
+
+    return read_status(get_settings().daemon_status_path)
+
+
 @router.post("/collect", response_model=CollectResponse)
 async def collect_today(sport: str = "basketball_nba") -> CollectResponse:
     """Collect snapshots for today's games."""
@@ -177,11 +238,12 @@ def get_edges() -> EdgesResponse:
             significant_edges=0,
         )
 
-    with get_connection(settings.db_path) as conn:
+    with get_connection_manager(settings.db_path).read() as conn:
         repo = AnalysisRepository(conn)
-        analyses = repo.get_all(limit=1)
+        latest = repo.get_latest_ref()
+        comparisons = repo.get_comparisons(latest[0]) if latest else []
 
-    if not analyses:
+    if not latest:
         return EdgesResponse(
             edges=[],
             total_games=0,
@@ -189,8 +251,7 @@ def get_edges() -> EdgesResponse:
             significant_edges=0,
         )
 
-    analysis = analyses[0]
-    comparisons = analysis.derived_features.get("comparisons", [])
+    analysis_id, analyzed_at = latest
 
     # Build edge items sorted by delta magnitude
     edges = []
@@ -221,25 +282,99 @@ def get_edges() -> EdgesResponse:
         total_games=len(edges),
         matched_games=len(matched),
         significant_edges=len(significant),
-        analysis_id=analysis.analysis_id[:8],
-        analyzed_at=analysis.created_at.isoformat(),
+        analysis_id=analysis_id[:8],
+        analyzed_at=analyzed_at.isoformat(),
     )
 
 
+@router.get("/edges/top", response_model=list[EdgeItem])
+def get_top_edges(
+    min_edge: float = 0.03,
+    day: str | None = None,
+    limit: int = 20,
+) -> list[EdgeItem]:
+    """Get the largest current edges across all analyses.
+
+    Uses each game's most recent analysis.
+
+    Args:
+        min_edge: Minimum absolute delta (0.03 = 3%)
+        day: Only games starting on this UTC date (YYYY-MM-DD, "today" for today)
+        limit: Maximum number of edges
+    """
+    from datetime import date, timedelta
+
+    from sportsbetsinfo.db.repositories.analysis import AnalysisRepository
+
+    commence_from = commence_to = None
+    if day:
+        try:
+            start = (
+                datetime.now(timezone.utc).date() if day == "today" else date.fromisoformat(day)
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid day {day!r}; expected YYYY-MM-DD or 'today'",
+            ) from e
+        commence_from = start.isoformat()
+        commence_to = (start + timedelta(days=1)).isoformat()
+
+    settings = get_settings()
+
+    if not settings.db_path.exists():
+        return []
+
+    with get_connection_manager(settings.db_path).read() as conn:
+        comparisons = AnalysisRepository(conn).get_top_edges(
+            min_edge=min_edge,
+            commence_from=commence_from,
+            commence_to=commence_to,
+            limit=limit,
+        )
+
+    return [
+        EdgeItem(
+            game=f"{comp.get('away_team', '?')} @ {comp.get('home_team', '?')}",
+            home_team=comp.get("home_team", "?"),
+            away_team=comp.get("away_team", "?"),
+            vegas_prob=comp.get("vegas_home_prob", 0),
+            kalshi_prob=comp.get("kalshi_implied_prob"),
+            delta=comp.get("delta_home"),
+            delta_percent=comp.get("delta_home_percent"),
+            direction=comp.get("edge_direction"),
+            matched=comp.get("matched", False),
+            game_status=comp.get("game_status", "pre_game"),
+            event_id=comp.get("event_id", ""),
+        )
+        for comp in comparisons
+    ]
+
+
 @router.post("/analyze")
-async def run_analysis() -> dict[str, Any]:
-    """Run analysis on all games with snapshots."""
+def run_analysis(workers: int | None = None) -> dict[str, Any]:
+    """Run analysis on all games with snapshots.
+
+    ``workers`` overrides SPORTSBETS_ANALYSIS_WORKERS (capped at 32).
+    """
     from sportsbetsinfo.services.analyzer import AnalysisService
 
     settings = get_settings()
     service = AnalysisService(settings)
+    if workers is not None:
+        workers = max(1, min(workers, 32))
 
-    analyses = service.analyze_all_games()
+    started = time.perf_counter()
+    analyses = service.analyze_all_games(workers=workers)
+    elapsed = time.perf_counter() - started
 
     return {
         "status": "success",
         "message": f"Created {len(analyses)} analysis(es)",
         "analyses_created": len(analyses),
+        "workers": workers or settings.analysis_workers,
+        "elapsed_seconds": round(elapsed, 3),
+        "analyses_per_second": round(len(analyses) / elapsed, 1) if elapsed > 0 else None,
     }
 
 
@@ -332,20 +467,25 @@ async def ingest_outcomes(
 @router.get("/games/{game_id}/timeline")
 def get_game_timeline(game_id: str) -> dict[str, Any]:
     """Get belief drift timeline for a specific game."""
+    from sportsbetsinfo.db.repositories.market_match import MarketMatchRepository
     from sportsbetsinfo.db.repositories.snapshot import SnapshotRepository
+    from sportsbetsinfo.services.matching import get_matcher
 
     settings = get_settings()
 
     if not settings.db_path.exists():
         raise HTTPException(status_code=404, detail="Database not found")
 
-    with get_connection(settings.db_path) as conn:
+    with get_connection_manager(settings.db_path).read() as conn:
         repo = SnapshotRepository(conn)
-        snapshots = repo.get_by_game_id(game_id)
+        snapshots = repo.get_views_by_game_id(game_id, include_heartbeats=True)
+        recorded = MarketMatchRepository(conn).get_by_event_id(game_id)
 
     if not snapshots:
         raise HTTPException(status_code=404, detail=f"No snapshots for game {game_id}")
 
+    matcher = get_matcher()
+
     timeline = []
     for snapshot in snapshots:
         events = snapshot.normalized_fields.get("odds_api_events", [])
@@ -354,6 +494,7 @@ def get_game_timeline(game_id: str) -> dict[str, Any]:
         point = {
             "collected_at": snapshot.collected_at.isoformat(),
             "snapshot_id": snapshot.snapshot_id[:8],
+            "unchanged": snapshot.is_heartbeat,
         }
 
         if events:
@@ -364,10 +505,23 @@ def get_game_timeline(game_id: str) -> dict[str, Any]:
             point["away_team"] = event.get("away_team")
 
         if kalshi_markets:
-            # Find matching market
-            market = kalshi_markets[0] if kalshi_markets else None
+            # Use the recorded market for this game, else match by team names
+            market = None
+            if recorded is not None:
+                market = next(
+                    (m for m in kalshi_markets if m.get("market_id") == recorded.market_id),
+                    None,
+                )
+            if market is None and events:
+                market = matcher.match(
+                    events[0].get("home_team", ""),
+                    events[0].get("away_team", ""),
+                    kalshi_markets,
+                    events[0].get("sport_key"),
+                )
             if market:
                 point["kalshi_prob"] = market.get("implied_probability")
+                point["kalshi_market_id"] = market.get("market_id")
 
         timeline.append(point)
 
@@ -389,51 +543,31 @@ def get_games() -> dict[str, Any]:
     if not settings.db_path.exists():
         return {"games": [], "total": 0}
 
-    with get_connection(settings.db_path) as conn:
+    with get_connection_manager(settings.db_path).read() as conn:
         snapshot_repo = SnapshotRepository(conn)
         outcome_repo = OutcomeRepository(conn)
 
-        snapshots = snapshot_repo.get_all(limit=500)
+        summaries = snapshot_repo.get_game_summaries(limit=500)
         outcomes = outcome_repo.get_all(limit=500)
 
-    # Group snapshots by game_id
-    games_map: dict[str, dict[str, Any]] = {}
     outcomes_map = {o.game_id: o for o in outcomes}
 
-    for snapshot in snapshots:
-        game_id = snapshot.game_id
-        events = snapshot.normalized_fields.get("odds_api_events", [])
-
-        if game_id not in games_map:
-            games_map[game_id] = {
-                "game_id": game_id,
-                "snapshot_count": 0,
-                "first_snapshot": snapshot.collected_at.isoformat(),
-                "last_snapshot": snapshot.collected_at.isoformat(),
-                "home_team": None,
-                "away_team": None,
-                "has_outcome": game_id in outcomes_map,
-                "winner": None,
-                "final_score": None,
-            }
-
-            if events:
-                event = events[0]
-                games_map[game_id]["home_team"] = event.get("home_team")
-                games_map[game_id]["away_team"] = event.get("away_team")
-
-            if game_id in outcomes_map:
-                outcome = outcomes_map[game_id]
-                games_map[game_id]["winner"] = outcome.winner
-                games_map[game_id]["final_score"] = (
-                    f"{outcome.final_score.away}-{outcome.final_score.home}"
-                )
-
-        games_map[game_id]["snapshot_count"] += 1
-        if snapshot.collected_at.isoformat() > games_map[game_id]["last_snapshot"]:
-            games_map[game_id]["last_snapshot"] = snapshot.collected_at.isoformat()
-
-    games = sorted(games_map.values(), key=lambda g: g["last_snapshot"], reverse=True)
+    games = []
+    for summary in summaries:
+        outcome = outcomes_map.get(summary.game_id)
+        games.append({
+            "game_id": summary.game_id,
+            "snapshot_count": summary.snapshot_count,
+            "first_snapshot": summary.first_collected_at.isoformat(),
+            "last_snapshot": summary.last_collected_at.isoformat(),
+            "home_team": summary.home_team,
+            "away_team": summary.away_team,
+            "has_outcome": outcome is not None,
+            "winner": outcome.winner if outcome else None,
+            "final_score": (
+                f"{outcome.final_score.away}-{outcome.final_score.home}" if outcome else None
+            ),
+        })
 
     return {"games": games, "total": len(games)}
 
@@ -452,7 +586,7 @@ def get_calibration_data() -> dict[str, Any]:
     if not settings.db_path.exists():
         return {"buckets": [], "total_evaluations": 0}
 
-    with get_connection(settings.db_path) as conn:
+    with get_connection_manager(settings.db_path).read() as conn:
         repo = EvaluationRepository(conn)
         evaluations = repo.get_all(limit=10000)
 
@@ -526,7 +660,7 @@ def get_roi_waterfall() -> dict[str, Any]:
     if not settings.db_path.exists():
         return {"bets": [], "total_roi": 0}
 
-    with get_connection(settings.db_path) as conn:
+    with get_connection_manager(settings.db_path).read() as conn:
         repo = EvaluationRepository(conn)
         evaluations = repo.get_all(limit=10000)
 
@@ -575,7 +709,7 @@ def get_edge_accuracy() -> dict[str, Any]:
     if not settings.db_path.exists():
         return {"points": [], "overall_win_rate": None}
 
-    with get_connection(settings.db_path) as conn:
+    with get_connection_manager(settings.db_path).read() as conn:
         repo = EvaluationRepository(conn)
         evaluations = repo.get_all(limit=10000)
 
@@ -648,16 +782,14 @@ def get_heatmap_data() -> dict[str, Any]:
     if not settings.db_path.exists():
         return {"games": [], "analyzed_at": None}
 
-    with get_connection(settings.db_path) as conn:
+    with get_connection_manager(settings.db_path).read() as conn:
         repo = AnalysisRepository(conn)
-        analyses = repo.get_all(limit=1)
+        latest = repo.get_latest_ref()
+        comparisons = repo.get_comparisons(latest[0]) if latest else []
 
-    if not analyses:
+    if not latest:
         return {"games": [], "analyzed_at": None}
 
-    analysis = analyses[0]
-    comparisons = analysis.derived_features.get("comparisons", [])
-
     games = []
     for comp in comparisons:
         if not comp.get("matched"):
@@ -678,6 +810,6 @@ def get_heatmap_data() -> dict[str, Any]:
 
     return {
         "games": games,
-        "analyzed_at": analysis.created_at.isoformat(),
+        "analyzed_at": latest[1].isoformat(),
         "total_matched": len(games),
     }
@@ -0,0 +1,77 @@
+"""Shared fixtures: an initialized SQLite database and snapshot factories."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from sportsbetsinfo.core.models import InfoSnapshot, SourceVersions
+from sportsbetsinfo.db.connection import get_connection
+from sportsbetsinfo.db.schema import initialize_database
+
+T0 = datetime(2026, 1, 5, 12, tzinfo=UTC)
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    """Path to a database with the schema and immutability triggers."""
+    path = tmp_path / "test.db"
+    conn = get_connection(path)
+    try:
+        initialize_database(conn)
+    finally:
+        conn.close()
+    return path
+
+
+@pytest.fixture
+def conn(db_path: Path) -> Iterator[sqlite3.Connection]:
+    """Connection to the test database."""
+    connection = get_connection(db_path)
+    yield connection
+    connection.close()
+
+
+def make_snapshot(game_id: str, minute: float, price: int, markets: int = 20) -> InfoSnapshot:
+    """Build a snapshot whose normalized fields differ from its neighbours by a few prices.
+
+    Args:
+        game_id: Game identifier
+        minute: Minutes after T0 the snapshot was collected
+        price: Price of the game's own market (other markets are fixed)
+        markets: Markets on the shared Kalshi board
+    """
+    board = [
+        {
+            "market_id": f"KXNBAGAME-{i}",
+            "title": f"Team {i} at Team {i + 1} Winner?",
+            "implied_probability": (price if i == 0 else 40 + i) / 100,
+            "yes_bid": (price if i == 0 else 40 + i) - 1,
+            "yes_ask": (price if i == 0 else 40 + i) + 1,
+            "volume": 1000 * i,
+        }
+        for i in range(markets)
+    ]
+    return InfoSnapshot.create(
+        game_id=game_id,
+        collected_at=T0 + timedelta(minutes=minute),
+        schema_version="1",
+        source_versions=SourceVersions(),
+        raw_payloads={"odds_api_event": {"id": game_id, "price": price}},
+        normalized_fields={
+            "odds_api_events": [
+                {
+                    "event_id": game_id,
+                    "home_team": "Boston Celtics",
+                    "away_team": "New York Knicks",
+                    "best_home_odds": -110 - price,
+                    "best_away_odds": 100 + price,
+                }
+            ],
+            "kalshi_markets": board,
+        },
+    )
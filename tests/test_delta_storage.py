@@ -0,0 +1,199 @@
+"""Keyframe + delta storage of snapshot normalized_fields."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+from conftest import make_snapshot
+
+from sportsbetsinfo.core.exceptions import IntegrityError
+from sportsbetsinfo.core.models import InfoSnapshot
+from sportsbetsinfo.db.codec import ZLIB_TAG, ColumnCodec, decode_column, recompress_database
+from sportsbetsinfo.db.connection import get_connection
+from sportsbetsinfo.db.repositories.delta import DELTA_REF_KEY, apply_patch, diff, is_delta_ref
+from sportsbetsinfo.db.repositories.snapshot import SnapshotRepository
+from sportsbetsinfo.db.schema import initialize_database
+from sportsbetsinfo.db.verification import VerificationPolicy
+
+PLAIN = ColumnCodec()
+ZLIB = ColumnCodec(name="zlib")
+
+
+def writer(conn: sqlite3.Connection, interval: int | None, codec: ColumnCodec = PLAIN) -> SnapshotRepository:
+    """Repository that delta-encodes new rows."""
+    return SnapshotRepository(
+        conn, VerificationPolicy.strict(), keyframe_interval=interval, codec=codec
+    )
+
+
+def reader(conn: sqlite3.Connection) -> SnapshotRepository:
+    """Fresh repository (empty delta cache) that re-hashes every row it reads."""
+    return SnapshotRepository(conn, VerificationPolicy.strict(), codec=PLAIN)
+
+
+def layout(conn: sqlite3.Connection, game_id: str) -> list[int]:
+    """Delta seq of each stored row of a game in insertion order (0 for keyframes)."""
+    rows = conn.execute(
+        "SELECT normalized_fields FROM info_snapshots WHERE game_id = ? ORDER BY rowid",
+        (game_id,),
+    ).fetchall()
+    seqs = []
+    for (value,) in rows:
+        stored = json.loads(decode_column(value))
+        seqs.append(stored[DELTA_REF_KEY]["seq"] if is_delta_ref(stored) else 0)
+    return seqs
+
+
+def assert_round_trip(conn: sqlite3.Connection, snapshots: list[InfoSnapshot]) -> None:
+    """Every snapshot reads back unchanged, in timeline order and by ID."""
+    by_game: dict[str, list[InfoSnapshot]] = {}
+    for snapshot in snapshots:
+        by_game.setdefault(snapshot.game_id, []).append(snapshot)
+    for game_id, expected in by_game.items():
+        timeline = reader(conn).get_by_game_id(game_id)
+        expected = sorted(expected, key=lambda s: s.collected_at)
+        assert [s.snapshot_id for s in timeline] == [s.snapshot_id for s in expected]
+        assert [s.normalized_fields for s in timeline] == [s.normalized_fields for s in expected]
+
+    # Cold reads in reverse walk each chain back to its keyframe
+    for snapshot in reversed(snapshots):
+        loaded = reader(conn).get_by_id(snapshot.snapshot_id)
+        assert loaded is not None
+        assert loaded.normalized_fields == snapshot.normalized_fields
+        assert loaded.hash == snapshot.hash
+
+
+def test_diff_apply_patch_round_trip() -> None:
+    old = {"a": [1, 2, {"b": 1.0}], "c/d": "x", "gone": True}
+    new = {"a": [1, 3, {"b": 1}], "c/d": "y", "added": None}
+    assert apply_patch(old, diff(old, new)) == new
+    # int vs float is replaced, not compared equal
+    assert type(apply_patch(old, diff(old, new))["a"][2]["b"]) is int
+    assert old["a"] == [1, 2, {"b": 1.0}]
+
+
+def test_round_trip_across_keyframe_boundaries(conn: sqlite3.Connection) -> None:
+    repo = writer(conn, interval=3)
+    snapshots = [make_snapshot("g1", minute=5 * i, price=50 + i) for i in range(7)]
+    for snapshot in snapshots:
+        repo.insert(snapshot)
+
+    assert layout(conn, "g1") == [0, 1, 2, 0, 1, 2, 0]
+    assert_round_trip(conn, snapshots)
+
+
+def test_batch_chains_interleaved_games(conn: sqlite3.Connection) -> None:
+    repo = writer(conn, interval=4)
+    snapshots = [
+        make_snapshot(game_id, minute=5 * i, price=50 + i)
+        for i in range(5)
+        for game_id in ("g1", "g2")
+    ]
+    result = repo.insert_many(snapshots)
+    assert len(result.inserted) == len(snapshots)
+
+    # A later batch continues each game's chain from its stored tip
+    more = [make_snapshot("g1", minute=30, price=60), make_snapshot("g2", minute=30, price=61)]
+    repo.insert_many(more)
+
+    assert layout(conn, "g1") == [0, 1, 2, 3, 0, 1]
+    assert layout(conn, "g2") == [0, 1, 2, 3, 0, 1]
+    assert_round_trip(conn, snapshots + more)
+
+
+def test_out_of_order_snapshot_is_stored_as_keyframe(conn: sqlite3.Connection) -> None:
+    repo = writer(conn, interval=10)
+    in_order = [make_snapshot("g1", minute=m, price=50 + m) for m in (0, 10, 20)]
+    for snapshot in in_order:
+        repo.insert(snapshot)
+
+    late = make_snapshot("g1", minute=15, price=99)
+    repo.insert(late)
+    after = make_snapshot("g1", minute=30, price=70)
+    repo.insert(after)
+
+    assert layout(conn, "g1") == [0, 1, 2, 0, 3]
+    # The next delta still chains from the latest row, not the late one
+    stored = json.loads(
+        decode_column(
+            conn.execute(
+                "SELECT normalized_fields FROM info_snapshots WHERE snapshot_id = ?",
+                (after.snapshot_id,),
+            ).fetchone()[0]
+        )
+    )
+    assert stored[DELTA_REF_KEY]["base"] == in_order[-1].snapshot_id
+    assert_round_trip(conn, [*in_order, late, after])
+
+
+def _insert_raw(conn: sqlite3.Connection, snapshot_id: str, normalized_fields: str) -> None:
+    """Insert an info_snapshots row directly, bypassing the repository."""
+    conn.execute(
+        """
+        INSERT INTO info_snapshots (
+            snapshot_id, game_id, collected_at, schema_version,
+            source_versions, raw_payloads, normalized_fields, hash
+        ) VALUES (?, 'g1', '2026-01-05T12:00:00+00:00', '1', '{}', '{}', ?, ?)
+        """,
+        (snapshot_id, normalized_fields, f"hash-{snapshot_id}"),
+    )
+    conn.commit()
+
+
+def test_missing_base_row_raises(conn: sqlite3.Connection) -> None:
+    _insert_raw(conn, "orphan", json.dumps({DELTA_REF_KEY: {"base": "gone", "seq": 1, "patch": []}}))
+
+    with pytest.raises(IntegrityError, match="base snapshot not found: gone"):
+        reader(conn).get_by_id("orphan")
+
+
+def test_missing_base_deeper_in_chain_raises(conn: sqlite3.Connection) -> None:
+    _insert_raw(conn, "middle", json.dumps({DELTA_REF_KEY: {"base": "gone", "seq": 1, "patch": []}}))
+    _insert_raw(conn, "tip", json.dumps({DELTA_REF_KEY: {"base": "middle", "seq": 2, "patch": []}}))
+
+    with pytest.raises(IntegrityError, match="base snapshot not found: gone"):
+        reader(conn).get_by_id("tip")
+
+
+def test_round_trip_with_zlib_codec(conn: sqlite3.Connection) -> None:
+    repo = writer(conn, interval=3, codec=ZLIB)
+    snapshots = [make_snapshot("g1", minute=5 * i, price=50 + i) for i in range(7)]
+    repo.insert_many(snapshots)
+
+    keyframe = conn.execute(
+        "SELECT normalized_fields FROM info_snapshots WHERE snapshot_id = ?",
+        (snapshots[0].snapshot_id,),
+    ).fetchone()[0]
+    assert isinstance(keyframe, bytes) and keyframe.startswith(ZLIB_TAG)
+    assert layout(conn, "g1") == [0, 1, 2, 0, 1, 2, 0]
+    assert_round_trip(conn, snapshots)
+
+
+@pytest.mark.parametrize("codec", [PLAIN, ZLIB], ids=["plain", "zlib"])
+def test_round_trip_after_recompress(
+    conn: sqlite3.Connection, tmp_path: Path, codec: ColumnCodec
+) -> None:
+    snapshots = [
+        make_snapshot(game_id, minute=5 * i, price=50 + i)
+        for i in range(7)
+        for game_id in ("g1", "g2")
+    ]
+    writer(conn, interval=3, codec=codec).insert_many(snapshots)
+
+    compressed = get_connection(tmp_path / "zlib.db")
+    plain = get_connection(tmp_path / "plain.db")
+    try:
+        initialize_database(compressed)
+        recompress_database(conn, compressed, ZLIB)
+        initialize_database(plain)
+        recompress_database(compressed, plain, PLAIN)
+
+        for copy in (compressed, plain):
+            assert layout(copy, "g1") == layout(conn, "g1")
+            assert_round_trip(copy, snapshots)
+    finally:
+        compressed.close()
+        plain.close()
@@ -0,0 +1,103 @@
+"""Batched inserts through ImmutableRepository.insert_many."""
+
+from __future__ import annotations
+
+import dataclasses
+import sqlite3
+from pathlib import Path
+
+import pytest
+from conftest import make_snapshot
+
+from sportsbetsinfo.db.codec import ColumnCodec
+from sportsbetsinfo.db.connection import get_connection
+from sportsbetsinfo.db.repositories.snapshot import SnapshotRepository
+from sportsbetsinfo.db.verification import VerificationPolicy
+
+
+def repository(conn: sqlite3.Connection, interval: int | None = None) -> SnapshotRepository:
+    """Snapshot repository with plain columns that verifies every read."""
+    return SnapshotRepository(
+        conn, VerificationPolicy.strict(), keyframe_interval=interval, codec=ColumnCodec()
+    )
+
+
+def stored_ids(db_path: Path) -> set[str]:
+    """Snapshot IDs visible to a new connection (i.e. committed)."""
+    conn = get_connection(db_path)
+    try:
+        return {row[0] for row in conn.execute("SELECT snapshot_id FROM info_snapshots")}
+    finally:
+        conn.close()
+
+
+def test_duplicate_hashes_are_skipped(conn: sqlite3.Connection, db_path: Path) -> None:
+    repo = repository(conn)
+    existing = make_snapshot("g1", minute=0, price=50)
+    repo.insert(existing)
+
+    fresh = make_snapshot("g1", minute=5, price=51)
+    repeated = dataclasses.replace(fresh, snapshot_id="repeat-of-fresh")
+    result = repo.insert_many([existing, fresh, repeated])
+
+    assert result.inserted == [fresh]
+    assert [(c.index, c.reason) for c in result.conflicts] == [
+        (0, "duplicate_hash"),
+        (2, "duplicate_hash"),
+    ]
+    assert result.duplicates == result.conflicts
+    assert stored_ids(db_path) == {existing.snapshot_id, fresh.snapshot_id}
+
+
+@pytest.mark.parametrize("interval", [None, 3], ids=["full", "delta"])
+def test_constraint_failure_falls_back_to_row_by_row(
+    conn: sqlite3.Connection, db_path: Path, interval: int | None
+) -> None:
+    repo = repository(conn, interval)
+    existing = make_snapshot("g1", minute=0, price=50)
+    repo.insert(existing)
+
+    before = make_snapshot("g1", minute=5, price=51)
+    # New content (so not a duplicate hash) under an existing primary key
+    clash = dataclasses.replace(make_snapshot("g1", minute=10, price=52), snapshot_id=existing.snapshot_id)
+    after = [make_snapshot("g1", minute=15 + 5 * i, price=53 + i) for i in range(3)]
+    result = repo.insert_many([before, clash, *after])
+
+    assert result.inserted == [before, *after]
+    assert len(result.conflicts) == 1
+    conflict = result.conflicts[0]
+    assert conflict.index == 1
+    assert conflict.entity is clash
+    assert "UNIQUE constraint failed" in conflict.reason
+    assert result.duplicates == []
+
+    # The surviving rows are committed and read back intact
+    assert stored_ids(db_path) == {s.snapshot_id for s in [existing, before, *after]}
+    timeline = repository(conn).get_by_game_id("g1")
+    assert [s.snapshot_id for s in timeline] == [s.snapshot_id for s in [existing, before, *after]]
+    assert [s.normalized_fields for s in timeline] == [
+        s.normalized_fields for s in [existing, before, *after]
+    ]
+    game = repository(conn).get_game_summaries()[0]
+    assert game.snapshot_count == 5
+    assert game.latest_snapshot_id == after[-1].snapshot_id
+
+
+def test_failed_batch_inside_a_transaction_is_not_committed(
+    conn: sqlite3.Connection, db_path: Path
+) -> None:
+    repo = repository(conn)
+    existing = make_snapshot("g1", minute=0, price=50)
+    repo.insert(existing)
+
+    conn.execute("BEGIN")
+    clash = dataclasses.replace(make_snapshot("g1", minute=5, price=51), snapshot_id=existing.snapshot_id)
+    fresh = make_snapshot("g1", minute=10, price=52)
+    result = repo.insert_many([clash, fresh])
+    assert result.inserted == [fresh]
+    # The caller owns the transaction: nothing is visible until it commits
+    assert conn.in_transaction
+    assert stored_ids(db_path) == {existing.snapshot_id}
+
+    conn.rollback()
+    assert stored_ids(db_path) == {existing.snapshot_id}
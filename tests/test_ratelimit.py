@@ -0,0 +1,92 @@
+"""GCRA rate limiter reservation math."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from sportsbetsinfo.clients.ratelimit import EndpointRateLimiter, RateLimiter, WaitHistogram
+
+
+def approx(expected: object) -> object:
+    """pytest.approx with an absolute tolerance for waits computed from large clock values."""
+    return pytest.approx(expected, abs=1e-9)
+
+
+def future() -> float:
+    """A monotonic time after every limiter's initial TAT."""
+    return time.monotonic() + 1000.0
+
+
+def test_burst_is_free_then_requests_are_spaced_by_the_interval() -> None:
+    limiter = RateLimiter(10.0, burst=5)
+    now = future()
+
+    waits = [limiter.reserve(now) for _ in range(8)]
+
+    assert waits == approx([0.0] * 5 + [0.1, 0.2, 0.3])
+
+
+def test_burst_refills_after_idling() -> None:
+    limiter = RateLimiter(10.0, burst=5)
+    now = future()
+    for _ in range(8):
+        limiter.reserve(now)
+
+    # While the queue drains, a new request waits behind it
+    assert limiter.reserve(now + 0.3) == approx(0.1)
+    # Once the TAT has passed, a full burst is available again
+    assert [limiter.reserve(now + 1.3) for _ in range(6)] == approx(
+        [0.0] * 5 + [0.1]
+    )
+
+
+def test_steady_rate_never_waits() -> None:
+    limiter = RateLimiter(4.0, burst=1)
+    now = future()
+
+    assert [limiter.reserve(now + i * 0.25) for i in range(10)] == approx([0.0] * 10)
+    assert limiter.reserve(now + 9 * 0.25) == approx(0.25)
+
+
+def test_burst_defaults_to_one_second_of_requests() -> None:
+    assert RateLimiter(4.0).burst == 4
+    assert RateLimiter(4.0).tolerance == approx(0.75)
+    assert RateLimiter(0.5).burst == 1
+    assert RateLimiter(0.5).interval == approx(2.0)
+
+
+def test_rejects_non_positive_rate() -> None:
+    with pytest.raises(ValueError):
+        RateLimiter(0.0)
+
+
+def test_endpoint_limiter_applies_to_matching_paths_only() -> None:
+    limiter = EndpointRateLimiter(10.0, burst=10, endpoints={r"/costly/\w+": (1.0, 1)})
+
+    costly = limiter.limiter_for("/costly/abc")
+    assert costly is not None
+    assert costly.interval == approx(1.0)
+    assert limiter.limiter_for("/costly") is None
+    assert limiter.limiter_for("/markets") is None
+
+    now = future()
+    assert [costly.reserve(now) for _ in range(3)] == approx([0.0, 1.0, 2.0])
+    assert limiter.default.reserve(now) == approx(0.0)
+
+
+def test_wait_histogram_buckets() -> None:
+    histogram = WaitHistogram()
+    for wait in (0.0, 0.0, 0.03, 0.5, 30.0):
+        histogram.record(wait)
+
+    stats = histogram.to_dict()
+    assert stats["count"] == 5
+    assert stats["max_wait_seconds"] == 30.0
+    buckets = stats["buckets"]
+    assert isinstance(buckets, dict)
+    assert buckets["le_0"] == 2
+    assert buckets["le_0.05"] == 1
+    assert buckets["le_0.5"] == 1
+    assert buckets["le_inf"] == 1